@@ -9,28 +9,38 @@ Usage:
     python run_analysis.py --session session_001 --xplane-play
 """
 
+import os
+# Headless backend for this process and any spawned plotting workers; set
+# before anything can import matplotlib so no GUI backend is probed
+os.environ.setdefault('MPLBACKEND', 'Agg')
+
 import sys
 import argparse
+import json
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional
-import yaml
+from typing import Optional, TYPE_CHECKING
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from src.flight_data import FlightData
-from src.styles.themes import load_style
-from src.plotters import (
-    TimeHistoryPlotter,
-    TrajectoryPlotter,
-    ControlsPlotter,
-    Aircraft3DPlotter,
-    DashboardPlotter
-)
+# Plotting and data modules (matplotlib, scipy) are imported lazily so that
+# --help and --list-sessions start instantly
+if TYPE_CHECKING:
+    from src.flight_data import FlightData
+    from src.styles.themes import PlotStyle
+
+
+def _setup_matplotlib() -> None:
+    """Select the headless backend before pyplot is imported anywhere."""
+    import matplotlib
+    matplotlib.use('Agg')  # Headless backend: worker processes must never touch a GUI
+    import matplotlib.pyplot as plt
+    plt.rcParams['figure.max_open_warning'] = 0
 
 
 def run_xplane_playback(
-    flight_data: FlightData,
+    flight_data: 'FlightData',
     speed: float = 1.0,
     host: str = "localhost",
     backend: str = "auto",
@@ -130,12 +140,24 @@ def run_xplane_playback(
     return 0
 
 
+# Plot file extensions removed by clean_session_plots
+PLOT_EXTENSIONS = frozenset({'.png', '.gif', '.mp4', '.svg', '.pdf'})
+
+
+def _mat_file_paths(session_path) -> list:
+    """List .mat file paths (as strings) in a session's raw_data folder."""
+    try:
+        # Single scandir pass; is_dir() uses the cached d_type, no extra stat
+        with os.scandir(os.path.join(session_path, 'raw_data')) as entries:
+            return [entry.path for entry in entries
+                    if entry.name.endswith('.mat') and not entry.is_dir()]
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+
+
 def find_mat_files(session_path: Path) -> list:
     """Find all .mat files in session's raw_data folder."""
-    raw_data_dir = session_path / 'raw_data'
-    if not raw_data_dir.exists():
-        return []
-    return list(raw_data_dir.glob('*.mat'))
+    return [Path(p) for p in _mat_file_paths(session_path)]
 
 
 def clean_session_plots(session_path: Path, verbose: bool = True) -> int:
@@ -153,11 +175,13 @@ def clean_session_plots(session_path: Path, verbose: bool = True) -> int:
     if not plots_dir.exists():
         return 0
 
+    # One directory walk, matching every extension at once
     deleted_count = 0
-    for ext in ['*.png', '*.gif', '*.mp4', '*.svg', '*.pdf']:
-        for file in plots_dir.rglob(ext):
-            file.unlink()
-            deleted_count += 1
+    for root, _, files in os.walk(plots_dir):
+        for name in files:
+            if name[name.rfind('.'):].lower() in PLOT_EXTENSIONS:
+                os.unlink(os.path.join(root, name))
+                deleted_count += 1
 
     if verbose and deleted_count > 0:
         print(f"Cleaned {deleted_count} existing plot(s) from previous run")
@@ -165,12 +189,153 @@ def clean_session_plots(session_path: Path, verbose: bool = True) -> int:
     return deleted_count
 
 
+def _output_fingerprint(
+    flight_data: 'FlightData',
+    style: 'PlotStyle',
+    **params
+) -> Optional[str]:
+    """
+    Fingerprint of everything an output set is generated from.
+
+    Covers the MAT file (path, size, mtime), the data mapping, the resolved
+    plot style and any extra generation parameters (e.g. animation fps), so
+    a change to any of them marks the outputs as stale.
+
+    Args:
+        flight_data: Loaded FlightData instance
+        style: PlotStyle the outputs are rendered with
+        **params: Additional parameters the outputs depend on
+
+    Returns:
+        Canonical JSON string, or None if the MAT file is missing
+    """
+    from dataclasses import asdict
+    from src.flight_data import load_mapping_config
+
+    try:
+        st = os.stat(flight_data.source_file)
+    except OSError:
+        return None  # Unknown source: always regenerate
+    return json.dumps({
+        'mat_file': [os.path.abspath(flight_data.source_file), st.st_size, st.st_mtime_ns],
+        'mapping': load_mapping_config(),
+        'style': asdict(style),
+        'params': params,
+    }, sort_keys=True, default=str)
+
+
+def _fingerprint_path(output_path: Path) -> Path:
+    """Sidecar file holding the fingerprint of a single output file."""
+    return output_path.with_name(f".{output_path.name}.fingerprint.json")
+
+
+def _is_up_to_date(outputs, stamp_path: Path, fingerprint: Optional[str]) -> bool:
+    """
+    Check whether outputs exist and were generated from the current inputs.
+
+    Args:
+        outputs: Output paths that must all exist
+        stamp_path: Sidecar fingerprint written when the outputs were generated
+        fingerprint: Fingerprint of the current inputs (None: always stale)
+
+    Returns:
+        True if every output exists and the stored fingerprint matches
+    """
+    if fingerprint is None or not all(os.path.exists(path) for path in outputs):
+        return False
+    try:
+        return stamp_path.read_text() == fingerprint
+    except OSError:
+        return False
+
+
+# Per-process plotting state, populated once per worker by _init_plot_worker
+_worker_state: dict = {}
+
+
+def _init_plot_worker(flight_data: 'FlightData', style: 'PlotStyle', plots_dir: Path) -> None:
+    """
+    Initialize a plotting worker process.
+
+    Receives the flight data and style once per worker (instead of once per
+    figure) and applies the style to matplotlib a single time.
+
+    Args:
+        flight_data: Loaded FlightData instance
+        style: PlotStyle to render with
+        plots_dir: Base plots directory
+    """
+    _setup_matplotlib()
+    _worker_state['flight_data'] = flight_data
+    _worker_state['style'] = style
+    _worker_state['plots_dir'] = str(plots_dir)
+    _worker_state['plotters'] = {}
+    style.apply_to_matplotlib()
+
+
+def _render_and_save(
+    plotter_cls: type,
+    method_name: str,
+    filename: str,
+    subdir: str,
+    kwargs: dict
+) -> dict:
+    """
+    Render a single figure and save it to disk.
+
+    Top-level so it can be pickled and dispatched to worker processes. Plotter
+    instances are created once per class per worker and reused across figures.
+
+    Args:
+        plotter_cls: Plotter class to instantiate
+        method_name: Name of the plotter method that builds the figure. It
+                     returns either a figure, or (figure, {name: subfigure})
+                     for grouped figures saved as one file per subfigure
+        filename: Output filename (without extension); for grouped figures
+                  the tuple of subfigure names, unused here
+        subdir: Subdirectory within plots_dir
+        kwargs: Keyword arguments for the plot method
+
+    Returns:
+        Dictionary mapping output filename to saved path
+    """
+    import matplotlib.pyplot as plt
+    from src.plotters.base import wait_for_pending_saves, shutdown_png_encoder
+
+    plotters = _worker_state['plotters']
+    plotter = plotters.get(plotter_cls)
+    if plotter is None:
+        plotter = plotter_cls(_worker_state['flight_data'], _worker_state['style'],
+                              _worker_state['plots_dir'])
+        plotters[plotter_cls] = plotter
+
+    try:
+        result = getattr(plotter, method_name)(**kwargs)
+        if isinstance(result, tuple):
+            # Grouped figure: one render pass, one file per subfigure
+            fig, regions = result
+            paths = plotter.save_figure_regions(fig, regions, subdir, background=True)
+        else:
+            fig = result
+            paths = {filename: plotter.save_figure(fig, filename, subdir, background=True)}
+        plt.close(fig)  # Release the figure and its canvas buffer from pyplot
+        # Finish the background encodes here so their errors reach the parent;
+        # atexit hooks never run in pool workers
+        wait_for_pending_saves()
+    finally:
+        shutdown_png_encoder()
+    return paths
+
+
 def generate_all_plots(
-    flight_data: FlightData,
+    flight_data: 'FlightData',
     output_dir: Path,
     style_config: Optional[str] = None,
     create_animation: bool = False,
-    animation_fps: int = 30
+    animation_fps: int = 30,
+    animation_format: str = 'gif',
+    max_workers: Optional[int] = None,
+    force: bool = False
 ) -> dict:
     """
     Generate all visualization plots for flight data.
@@ -181,10 +346,25 @@ def generate_all_plots(
         style_config: Path to custom style config (optional)
         create_animation: Whether to create animated visualization
         animation_fps: Frames per second for animation
+        animation_format: Animation container ('gif' or 'mp4')
+        max_workers: Number of plotting processes (default: one per CPU core)
+        force: Regenerate every output, even those already generated from the
+               current MAT file, data mapping, style and animation settings
 
     Returns:
-        Dictionary with paths to generated files
+        Dictionary with paths to generated files (None for figures that
+        failed to render)
     """
+    _setup_matplotlib()
+    from src.styles.themes import load_style
+    from src.plotters import (
+        TimeHistoryPlotter,
+        TrajectoryPlotter,
+        ControlsPlotter,
+        Aircraft3DPlotter,
+        DashboardPlotter
+    )
+
     # Load style
     style = load_style(style_config)
 
@@ -204,133 +384,150 @@ def generate_all_plots(
     print(f"Output: {output_dir}")
     print("=" * 60 + "\n")
 
-    # 1. Time History Plots
-    print("Generating time history plots...")
-    th_plotter = TimeHistoryPlotter(flight_data, style, str(plots_dir))
-
-    # All states combined
-    fig = th_plotter.plot_all_states()
-    path = th_plotter.save_figure(fig, 'time_history_all', 'time_histories')
-    generated_files['time_history_all'] = path
-    fig.clf()
-
-    # Attitude only
-    fig = th_plotter.plot_attitude()
-    path = th_plotter.save_figure(fig, 'attitude', 'time_histories')
-    generated_files['attitude'] = path
-    fig.clf()
-
-    # Position only
-    fig = th_plotter.plot_position()
-    path = th_plotter.save_figure(fig, 'position', 'time_histories')
-    generated_files['position'] = path
-    fig.clf()
-
-    # Velocity
-    fig = th_plotter.plot_velocity()
-    path = th_plotter.save_figure(fig, 'velocity', 'time_histories')
-    generated_files['velocity'] = path
-    fig.clf()
-
-    print(f"  Created {len([k for k in generated_files if 'time' in k or 'attitude' in k or 'position' in k or 'velocity' in k])} time history plots")
-
-    # 2. Trajectory Plots
-    print("Generating trajectory plots...")
-    traj_plotter = TrajectoryPlotter(flight_data, style, str(plots_dir))
-
-    # Ground track
-    fig = traj_plotter.plot_ground_track()
-    path = traj_plotter.save_figure(fig, 'ground_track', 'trajectory')
-    generated_files['ground_track'] = path
-    fig.clf()
-
-    # 3D trajectory
-    fig = traj_plotter.plot_3d_trajectory()
-    path = traj_plotter.save_figure(fig, 'trajectory_3d', 'trajectory')
-    generated_files['trajectory_3d'] = path
-    fig.clf()
-
-    # Combined views
-    fig = traj_plotter.plot_combined()
-    path = traj_plotter.save_figure(fig, 'trajectory_combined', 'trajectory')
-    generated_files['trajectory_combined'] = path
-    fig.clf()
-
-    # Altitude profile
-    fig = traj_plotter.plot_altitude_profile()
-    path = traj_plotter.save_figure(fig, 'altitude_profile', 'trajectory')
-    generated_files['altitude_profile'] = path
-    fig.clf()
-
-    print(f"  Created 4 trajectory plots")
-
-    # 3. Controls Plots
-    print("Generating controls plots...")
-    ctrl_plotter = ControlsPlotter(flight_data, style, str(plots_dir))
-
-    # All controls
-    fig = ctrl_plotter.plot_all_controls()
-    path = ctrl_plotter.save_figure(fig, 'controls_all', 'controls')
-    generated_files['controls_all'] = path
-    fig.clf()
-
-    # Control surfaces only
-    fig = ctrl_plotter.plot_control_surfaces()
-    path = ctrl_plotter.save_figure(fig, 'control_surfaces', 'controls')
-    generated_files['control_surfaces'] = path
-    fig.clf()
-
-    # Propulsion only
-    fig = ctrl_plotter.plot_propulsion()
-    path = ctrl_plotter.save_figure(fig, 'propulsion', 'controls')
-    generated_files['propulsion'] = path
-    fig.clf()
-
-    print(f"  Created 3 controls plots")
-
-    # 4. 3D Aircraft Visualization
-    print("Generating 3D aircraft visualization...")
-    ac_plotter = Aircraft3DPlotter(flight_data, style, str(plots_dir))
-
-    # Static 3D with aircraft
-    fig = ac_plotter.plot_trajectory_with_aircraft(n_aircraft=8)
-    path = ac_plotter.save_figure(fig, 'aircraft_3d_trajectory', '3d_aircraft')
-    generated_files['aircraft_3d'] = path
-    fig.clf()
-
-    print(f"  Created 1 3D aircraft plot")
-
-    # 5. Dashboard
-    print("Generating dashboard...")
-    dash_plotter = DashboardPlotter(flight_data, style, str(plots_dir))
-
-    fig = dash_plotter.plot_dashboard()
-    path = dash_plotter.save_figure(fig, 'dashboard', 'summary')
-    generated_files['dashboard'] = path
-    fig.clf()
-
-    print(f"  Created 1 dashboard")
+    # Build the figure task list: (group, key, plotter class, method, filename, subdir, kwargs)
+    # A key of None marks a grouped figure; its filename is the tuple of
+    # subfigure names, which are also its keys
+    tasks = [
+        ('time history', None, TimeHistoryPlotter, 'plot_grouped',
+         ('time_history_all', 'attitude', 'position', 'velocity'), 'time_histories', {}),
+        ('trajectory', 'ground_track', TrajectoryPlotter, 'plot_ground_track',
+         'ground_track', 'trajectory', {}),
+        ('trajectory', 'trajectory_3d', TrajectoryPlotter, 'plot_3d_trajectory',
+         'trajectory_3d', 'trajectory', {}),
+        ('trajectory', 'trajectory_combined', TrajectoryPlotter, 'plot_combined',
+         'trajectory_combined', 'trajectory', {}),
+        ('trajectory', 'altitude_profile', TrajectoryPlotter, 'plot_altitude_profile',
+         'altitude_profile', 'trajectory', {}),
+        ('controls', 'controls_all', ControlsPlotter, 'plot_all_controls',
+         'controls_all', 'controls', {}),
+        ('controls', 'control_surfaces', ControlsPlotter, 'plot_control_surfaces',
+         'control_surfaces', 'controls', {}),
+        ('controls', 'propulsion', ControlsPlotter, 'plot_propulsion',
+         'propulsion', 'controls', {}),
+        ('3D aircraft', 'aircraft_3d', Aircraft3DPlotter, 'plot_trajectory_with_aircraft',
+         'aircraft_3d_trajectory', '3d_aircraft', {'n_aircraft': 8}),
+        ('dashboard', 'dashboard', DashboardPlotter, 'plot_dashboard',
+         'dashboard', 'summary', {}),
+    ]
+
+    # Incremental build: skip figures whose outputs exist and were generated
+    # from the same MAT file, data mapping and style
+    fingerprint = _output_fingerprint(flight_data, style)
+    stamp_path = plots_dir / '.fingerprint.json'
+    if force or not _is_up_to_date((), stamp_path, fingerprint):
+        stamp_path.unlink(missing_ok=True)
+    pending = []
+    failed = []
+    reused = 0
+    for task in tasks:
+        group, key, _, _, filename, subdir, _ = task
+        names = (filename,) if key is not None else filename
+        outputs = {name: plots_dir / subdir / f"{name}.{style.format}" for name in names}
+        if _is_up_to_date(outputs.values(), stamp_path, fingerprint):
+            if key is None:
+                generated_files.update(outputs)
+            else:
+                generated_files[key] = outputs[filename]
+            reused += len(outputs)
+        else:
+            pending.append(task)
+
+    if reused:
+        print(f"Keeping {reused} up-to-date plot(s) (use --force to regenerate)")
+
+    # 1-5. Render the remaining static figures in parallel (each figure is independent)
+    if pending:
+        workers = max_workers or min(len(pending), os.cpu_count() or 1)
+        print(f"Generating {len(pending)} figures using {workers} worker(s)...")
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_plot_worker,
+            initargs=(flight_data, style, plots_dir)
+        ) as executor:
+            # Each task's fields after (group, key) are _render_and_save's arguments
+            futures = {executor.submit(_render_and_save, *task[2:]): i
+                       for i, task in enumerate(pending)}
+
+            # Collect figures as they finish; one failure does not discard the rest
+            results = {}
+            for future in as_completed(futures):
+                i = futures[future]
+                try:
+                    results[i] = future.result()
+                except Exception as e:
+                    _, key, _, _, filename, _, _ = pending[i]
+                    names = (key,) if key is not None else filename
+                    print(f"  Error: Failed to create {', '.join(names)}: {e}")
+
+        # Record outputs in task order; failed figures map to None
+        group_counts = {}
+        for i, (group, key, _, _, filename, _, _) in enumerate(pending):
+            paths = results.get(i)
+            if paths is None:
+                names = (key,) if key is not None else filename
+                generated_files.update(dict.fromkeys(names))
+                failed.extend(names)
+                continue
+            if key is None:
+                generated_files.update(paths)
+            else:
+                generated_files[key] = next(iter(paths.values()))
+            group_counts[group] = group_counts.get(group, 0) + len(paths)
+
+        for group, count in group_counts.items():
+            print(f"  Created {count} {group} plot(s)")
+
+    # Record the inputs only once every static figure is in place
+    if fingerprint is not None and not failed:
+        stamp_path.write_text(fingerprint)
 
     # 6. Animation (if requested)
-    if create_animation:
+    anim_path = plots_dir / 'animations' / f'flight_animation.{animation_format}'
+    anim_params = {
+        'fps': animation_fps,
+        'duration_factor': 0.3,  # 3x speed for shorter animation
+        'trail_length': 100,
+    }
+    anim_fingerprint = _output_fingerprint(flight_data, style, format=animation_format,
+                                           **anim_params)
+    # create_animation writes a GIF instead when MP4 is requested without
+    # ffmpeg; either file is current if its own stamp matches
+    anim_candidates = tuple(dict.fromkeys((anim_path, anim_path.with_suffix('.gif'))))
+    current_anim = next((path for path in anim_candidates
+                         if _is_up_to_date((path,), _fingerprint_path(path), anim_fingerprint)),
+                        None)
+    if create_animation and not force and current_anim is not None:
+        generated_files['animation'] = current_anim
+        print(f"\nKeeping up-to-date animation: {current_anim}")
+    elif create_animation:
         print("\nGenerating animation (this may take a while)...")
-        anim_path = plots_dir / 'animations' / 'flight_animation.gif'
+        for path in anim_candidates:
+            _fingerprint_path(path).unlink(missing_ok=True)
 
         try:
-            ac_plotter.create_animation(
+            ac_plotter = Aircraft3DPlotter(flight_data, style, str(plots_dir))
+            anim_path = ac_plotter.create_animation(
                 output_path=str(anim_path),
-                fps=animation_fps,
-                duration_factor=0.3,  # 3x speed for shorter animation
-                trail_length=100
+                format=animation_format,
+                max_workers=max_workers,
+                **anim_params
             )
             generated_files['animation'] = anim_path
+            if anim_fingerprint is not None:
+                # Stamp the file actually written, which may be the GIF fallback
+                _fingerprint_path(Path(anim_path)).write_text(anim_fingerprint)
             print(f"  Created animation: {anim_path}")
         except Exception as e:
             print(f"  Warning: Animation creation failed: {e}")
 
     # Summary
     print("\n" + "=" * 60)
-    print(f"COMPLETE: Generated {len(generated_files)} files")
+    if failed:
+        print(f"INCOMPLETE: Generated {len(generated_files) - len(failed)} files, "
+              f"{len(failed)} failed: {', '.join(failed)}")
+    else:
+        print(f"COMPLETE: Generated {len(generated_files)} files")
     print("=" * 60)
 
     for name, path in generated_files.items():
@@ -394,16 +591,30 @@ Examples:
         help='Animation frames per second (default: 30)'
     )
 
+    parser.add_argument(
+        '--anim-format',
+        choices=['gif', 'mp4'],
+        default='gif',
+        help='Animation output format (default: gif)'
+    )
+
     parser.add_argument(
         '--list-sessions',
         action='store_true',
         help='List available sessions and exit'
     )
 
+    parser.add_argument(
+        '--force', '-f',
+        action='store_true',
+        help='Clean and regenerate all plots, even those already up to date, '
+             'and re-read the MAT file instead of its cached signals'
+    )
+
     parser.add_argument(
         '--no-clean',
         action='store_true',
-        help='Do not clean existing plots before generating new ones'
+        help='With --force, overwrite existing plots without cleaning first'
     )
 
     # X-Plane playback arguments
@@ -456,11 +667,13 @@ Examples:
     if args.list_sessions:
         sessions_dir = project_root / 'sessions'
         if sessions_dir.exists():
-            sessions = [d.name for d in sessions_dir.iterdir() if d.is_dir()]
+            # DirEntry.is_dir() reuses d_type from the directory read
+            with os.scandir(sessions_dir) as entries:
+                sessions = sorted((entry.name, entry.path) for entry in entries
+                                  if entry.is_dir())
             print("Available sessions:")
-            for s in sorted(sessions):
-                mat_files = find_mat_files(sessions_dir / s)
-                print(f"  {s}: {len(mat_files)} MAT file(s)")
+            for name, path in sessions:
+                print(f"  {name}: {len(_mat_file_paths(path))} MAT file(s)")
         else:
             print("No sessions directory found.")
         return 0
@@ -496,14 +709,16 @@ Examples:
         output_dir = Path(args.output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
 
-    # Clean existing plots if not disabled
-    if not args.no_clean:
+    # Full rebuild: clean existing plots unless disabled. Without --force,
+    # up-to-date plots are kept and only stale ones are regenerated.
+    if args.force and not args.no_clean:
         clean_session_plots(output_dir)
 
     # Load flight data
+    from src.flight_data import FlightData
     print(f"Loading {mat_file}...")
     try:
-        flight_data = FlightData.from_mat_file(str(mat_file))
+        flight_data = FlightData.from_mat_file(str(mat_file), use_cache=not args.force)
     except Exception as e:
         print(f"Error loading MAT file: {e}")
         return 1
@@ -521,12 +736,14 @@ Examples:
 
     # Generate plots
     try:
-        generate_all_plots(
+        generated_files = generate_all_plots(
             flight_data=flight_data,
             output_dir=output_dir,
             style_config=args.config,
             create_animation=args.animate,
-            animation_fps=args.fps
+            animation_fps=args.fps,
+            animation_format=args.anim_format,
+            force=args.force
         )
     except Exception as e:
         print(f"Error generating plots: {e}")
@@ -534,7 +751,8 @@ Examples:
         traceback.print_exc()
         return 1
 
-    return 0
+    # Figures that failed to render are recorded with a path of None
+    return 1 if None in generated_files.values() else 0
 
 
 if __name__ == '__main__':
@@ -16,6 +16,9 @@ This script will:
 Press Ctrl+C to stop.
 """
 
+import logging
+import logging.handlers
+import queue
 import sys
 import time
 from pathlib import Path
@@ -43,6 +46,18 @@ def main():
         print(f"ERROR: Flight data not found: {mat_file}")
         return 1
 
+    # Debug output is queued by the playback thread and written by a
+    # background listener, so stdout flushes never delay frame sends. Only
+    # the player's logger is set to DEBUG; other libraries stay quiet
+    log_queue = queue.SimpleQueue()
+    player_logger = logging.getLogger(XPlanePlayer.__module__)
+    player_logger.setLevel(logging.DEBUG)
+    player_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    console = logging.StreamHandler(sys.stdout)
+    console.setFormatter(logging.Formatter('%(message)s'))
+    listener = logging.handlers.QueueListener(log_queue, console)
+    listener.start()
+
     # Create player with DEBUG MODE ENABLED
     player = XPlanePlayer(debug=True, verbose=True)
 
@@ -82,7 +97,8 @@ def main():
         while player.is_playing:
             time.sleep(0.5)
             # Print progress
-            print(f"\r[Progress: {player.progress*100:.1f}%]", end="", flush=True)
+            sys.stdout.write(f"\r[Progress: {player.progress*100:.1f}%]")
+            sys.stdout.flush()
 
     except KeyboardInterrupt:
         print("\n\nPlayback interrupted by user")
@@ -90,6 +106,7 @@ def main():
     finally:
         player.stop()
         player.disconnect()
+        listener.stop()
         print("\nPlayback stopped.")
 
     return 0
@@ -15,9 +15,12 @@ Example:
 """
 
 import argparse
+import queue
 import sys
+import threading
 import time
 from pathlib import Path
+from typing import Optional
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
@@ -28,30 +31,53 @@ from src.xplane import XPlanePlayer, PlaybackState
 from src.xplane.player import PlaybackConfig
 
 
-def format_time(seconds: float) -> str:
-    """Format seconds as MM:SS.s"""
-    mins = int(seconds // 60)
-    secs = seconds % 60
-    return f"{mins:02d}:{secs:05.2f}"
+# Minimum seconds between status line redraws
+STATUS_INTERVAL = 0.05
 
+# Progress bar width and a prebuilt template; the bar is a slice of it
+BAR_WIDTH = 30
+_FULL_BAR = '=' * BAR_WIDTH + '-' * BAR_WIDTH
 
-def print_status(player: XPlanePlayer, clear: bool = True) -> None:
-    """Print current playback status."""
-    if clear:
-        print('\r', end='')
+# Status line: prefix, state, bar, elapsed, total, percent
+_STATUS_FORMAT = "%s[%-7s] [%s] %s/%s (%5.1f%%)"
 
-    state_str = player.state.name
-    time_str = format_time(player.current_time)
-    total_str = format_time(player.total_time)
-    progress_pct = player.progress * 100
+
+def format_time(seconds: float) -> str:
+    """Format seconds as MM:SS.ss"""
+    # Fixed-point hundredths keep this to integer math and one %-format
+    cs = int(seconds * 100)
+    return "%02d:%02d.%02d" % (cs // 6000, (cs // 100) % 60, cs % 100)
+
+
+def print_status(
+    player: XPlanePlayer,
+    clear: bool = True,
+    total_str: Optional[str] = None
+) -> None:
+    """
+    Print current playback status.
+
+    Args:
+        player: Player to report on
+        clear: Return to the start of the line first
+        total_str: Preformatted total time (formatted from the player if None)
+    """
+    if total_str is None:
+        total_str = format_time(player.total_time)
+    progress = player.progress
 
     # Progress bar
-    bar_width = 30
-    filled = int(bar_width * player.progress)
-    bar = '=' * filled + '-' * (bar_width - filled)
+    filled = int(BAR_WIDTH * progress)
 
-    status = f"[{state_str:7}] [{bar}] {time_str}/{total_str} ({progress_pct:5.1f}%)"
-    print(status, end='', flush=True)
+    sys.stdout.write(_STATUS_FORMAT % (
+        '\r' if clear else '',
+        player.state.name,
+        _FULL_BAR[BAR_WIDTH - filled:2 * BAR_WIDTH - filled],
+        format_time(player.current_time),
+        total_str,
+        progress * 100,
+    ))
+    sys.stdout.flush()
 
 
 def interactive_playback(player: XPlanePlayer) -> None:
@@ -66,14 +92,20 @@ def interactive_playback(player: XPlanePlayer) -> None:
     print("  q      - Quit")
     print("=" * 60 + "\n")
 
-    # Status callback
+    # Status callback, throttled to 20 Hz so it never competes with the
+    # playback timer for stdout
+    last_status = [0.0]
+    total_str = format_time(player.total_time)
+
     def on_frame(frame_idx: int, time_sec: float):
-        print_status(player)
+        now = time.monotonic()
+        if now - last_status[0] >= STATUS_INTERVAL:
+            last_status[0] = now
+            print_status(player, total_str=total_str)
 
     player.on_frame(on_frame)
 
     try:
-        import select
         import tty
         import termios
 
@@ -81,48 +113,70 @@ def interactive_playback(player: XPlanePlayer) -> None:
         old_settings = termios.tcgetattr(sys.stdin)
         tty.setcbreak(sys.stdin.fileno())
 
-        running = True
-        while running:
-            # Check for input
-            if select.select([sys.stdin], [], [], 0.1)[0]:
+        # Keypresses are read by a blocking daemon thread and handed over
+        # through a queue, so the main loop sleeps instead of polling stdin
+        keys = queue.Queue()
+
+        def read_keys():
+            while True:
                 char = sys.stdin.read(1)
+                keys.put(char)
+                if not char:  # EOF
+                    return
+
+        threading.Thread(target=read_keys, daemon=True).start()
 
-                if char == '\n' or char == ' ':  # Enter or Space
-                    if player.state == PlaybackState.STOPPED:
-                        print("\nStarting playback...")
-                        player.play()
-                    elif player.state == PlaybackState.PLAYING:
-                        player.pause()
-                        print("\n[PAUSED]")
-                    elif player.state == PlaybackState.PAUSED:
-                        player.resume()
-                        print("\n[RESUMED]")
-
-                elif char == 's':
-                    player.stop()
-                    print("\n[STOPPED]")
-
-                elif char == '+' or char == '=':
-                    new_speed = min(10.0, player._speed * 1.5)
-                    player.set_speed(new_speed)
-                    print(f"\nSpeed: {new_speed:.1f}x")
-
-                elif char == '-':
-                    new_speed = max(0.1, player._speed / 1.5)
-                    player.set_speed(new_speed)
-                    print(f"\nSpeed: {new_speed:.1f}x")
-
-                elif char == 'q':
-                    print("\nQuitting...")
-                    running = False
-
-            # Check if playback finished
-            if player.state == PlaybackState.STOPPED and player._current_frame > 0:
-                print("\n\nPlayback complete!")
-                player._current_frame = 0
-
-        # Restore terminal
-        termios.tcsetattr(sys.stdin, termios.TCSADRAIN, old_settings)
+        try:
+            running = True
+            while running:
+                # Wait for input
+                try:
+                    char = keys.get(timeout=0.25)
+                except queue.Empty:
+                    char = None
+
+                if char is not None:
+                    if not char:  # stdin closed
+                        running = False
+
+                    elif char == '\n' or char == ' ':  # Enter or Space
+                        if player.state == PlaybackState.STOPPED:
+                            print("\nStarting playback...")
+                            player.play()
+                        elif player.state == PlaybackState.PLAYING:
+                            player.pause()
+                            print("\n[PAUSED]")
+                        elif player.state == PlaybackState.PAUSED:
+                            player.resume()
+                            print("\n[RESUMED]")
+
+                    elif char == 's':
+                        player.stop()
+                        print("\n[STOPPED]")
+
+                    elif char == '+' or char == '=':
+                        new_speed = min(10.0, player._speed * 1.5)
+                        player.set_speed(new_speed)
+                        print(f"\nSpeed: {new_speed:.1f}x")
+
+                    elif char == '-':
+                        new_speed = max(0.1, player._speed / 1.5)
+                        player.set_speed(new_speed)
+                        print(f"\nSpeed: {new_speed:.1f}x")
+
+                    elif char == 'q':
+                        print("\nQuitting...")
+                        running = False
+
+                # Check if playback finished
+                if player.state == PlaybackState.STOPPED and player._current_frame > 0:
+                    # The throttled callback usually skips the last frame
+                    print_status(player, total_str=total_str)
+                    print("\n\nPlayback complete!")
+                    player._current_frame = 0
+        finally:
+            # Restore terminal
+            termios.tcsetattr(sys.stdin, termios.TCSADRAIN, old_settings)
 
     except ImportError:
         # Windows or no termios - use simple input
@@ -134,9 +188,11 @@ def simple_playback(player: XPlanePlayer) -> None:
     print("\nStarting playback (non-interactive mode)...")
     print("Press Ctrl+C to stop\n")
 
+    total_str = format_time(player.total_time)
+
     def on_frame(frame_idx: int, time_sec: float):
         if frame_idx % 10 == 0:  # Update every 10 frames
-            print_status(player)
+            print_status(player, total_str=total_str)
 
     player.on_frame(on_frame)
     player.play()
@@ -144,6 +200,7 @@ def simple_playback(player: XPlanePlayer) -> None:
     try:
         while player.is_playing or player.is_paused:
             time.sleep(0.1)
+        print_status(player, total_str=total_str)  # The last frame is rarely a 10th
     except KeyboardInterrupt:
         print("\n\nStopping...")
         player.stop()
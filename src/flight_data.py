@@ -2,15 +2,22 @@
 Core FlightData class - the central data model for flight simulation data.
 """
 
+import hashlib
+import json
+import os
 import warnings
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 import numpy as np
 import scipy.io as sio
 import yaml
 from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Dict, Optional, Any, Union
+from typing import Dict, Iterable, List, Optional, Any, Tuple, Union
 
 from .utils.conversions import UnitConverter
+from .utils.kernels import derived_quantities
 
 
 # Default variable mappings - FALLBACK ONLY
@@ -32,6 +39,9 @@ DEFAULT_MAPPING = {
 }
 
 
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
 def load_mapping_config(config_path: Optional[Union[str, Path]] = None) -> Dict:
     """
     Load data mapping configuration from YAML file.
@@ -55,13 +65,31 @@ def load_mapping_config(config_path: Optional[Union[str, Path]] = None) -> Dict:
                 break
 
     if config_path is None or not Path(config_path).exists():
-        return DEFAULT_MAPPING.copy()
+        return _copy_mapping(DEFAULT_MAPPING)
+
+    config_path = Path(config_path)
+    merged = _load_merged_mapping(str(config_path), config_path.stat().st_mtime_ns)
+    return _copy_mapping(merged)
+
+
+def _copy_mapping(mapping: Dict) -> Dict:
+    """Copy a mapping down to its category dicts, so callers can edit it freely."""
+    return {k: dict(v) if isinstance(v, dict) else v for k, v in mapping.items()}
 
-    with open(config_path, 'r') as f:
-        config = yaml.safe_load(f)
+
+@lru_cache(maxsize=8)
+def _load_merged_mapping(path: str, mtime_ns: int) -> Dict:
+    """
+    Parse a mapping YAML and merge it over DEFAULT_MAPPING.
+
+    Memoized on (path, mtime), so batch loads parse the file only once while
+    edits to it are still picked up. Callers must copy the result.
+    """
+    with open(path, 'r') as f:
+        config = yaml.load(f, Loader=_YAML_LOADER) or {}
 
     # Merge with defaults for any missing keys
-    merged = DEFAULT_MAPPING.copy()
+    merged = _copy_mapping(DEFAULT_MAPPING)
     for category in merged:
         if category in config:
             if isinstance(merged[category], dict):
@@ -72,6 +100,143 @@ def load_mapping_config(config_path: Optional[Union[str, Path]] = None) -> Dict:
     return merged
 
 
+# Per-sample signals packed into FlightData.signals, in row order
+SIGNAL_CHANNELS = (
+    'N', 'E', 'D',
+    'phi', 'theta', 'psi',
+    'delta_a', 'delta_e', 'delta_r',
+    'RPM_Cl', 'RPM_Cr', 'theta_Cl', 'theta_Cr',
+    'Vn', 'Ve', 'Vd', 'V_ground', 'V_total',
+)
+
+# Angle signals per 'units' mapping key, converted together when in degrees
+ANGLE_GROUPS = {
+    'attitude': ('phi', 'theta', 'psi'),
+    'controls': ('delta_a', 'delta_e', 'delta_r'),
+    'propulsion_tilt': ('theta_Cl', 'theta_Cr'),
+}
+
+# Storage precision for packed signals; ample for telemetry at 10-100 Hz
+SIGNAL_DTYPE = np.float32
+
+# On-disk cache of packed signals, so unchanged MAT files skip loadmat
+SIGNAL_CACHE_DIR = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'matlab_xplane_viz'
+
+# Signal cache format version; bump when loading or derived-quantity code
+# changes what gets cached, so existing cache entries are ignored
+CACHE_VERSION = 1
+
+
+def _signal_cache_path(filepath: Union[str, Path], mapping: Dict) -> Optional[Path]:
+    """
+    Cache file for a MAT file's packed signals under a given mapping.
+
+    The key covers the cache version, absolute path, size, mtime, mapping,
+    channel layout and storage dtype, so editing the MAT file or the
+    mapping (or changing CACHE_VERSION, SIGNAL_CHANNELS or SIGNAL_DTYPE)
+    invalidates the cache.
+
+    Returns:
+        Path of the .npy cache file (its channel names and metadata are in a
+        .json file alongside), or None if the MAT file does not exist
+    """
+    try:
+        st = os.stat(filepath)
+    except OSError:
+        return None
+    key = '|'.join([str(CACHE_VERSION),
+                    os.path.abspath(filepath), str(st.st_size), str(st.st_mtime_ns),
+                    json.dumps(mapping, sort_keys=True, default=str),
+                    ','.join(SIGNAL_CHANNELS), np.dtype(SIGNAL_DTYPE).str])
+    return SIGNAL_CACHE_DIR / f"{hashlib.sha1(key.encode()).hexdigest()[:16]}.npy"
+
+
+def _time_vector(n_samples: int, sample_rate: float) -> np.ndarray:
+    """
+    Build the uniform time vector for n_samples at sample_rate.
+
+    Generated directly as float64 and scaled in place: one allocation, no
+    int-to-float cast, and the same values as np.arange(n) * dt.
+    """
+    time = np.arange(n_samples, dtype=np.float64)
+    time *= 1.0 / sample_rate
+    return time
+
+
+# Where each loaded attribute comes from: attribute -> (mapping category, key)
+MAT_SOURCES = {
+    'sample_rate': ('metadata', 'sample_rate'),
+    'duration': ('metadata', 'duration'),
+    'N': ('position', 'north'),
+    'E': ('position', 'east'),
+    'D': ('position', 'down'),
+    'phi': ('attitude', 'roll'),
+    'theta': ('attitude', 'pitch'),
+    'psi': ('attitude', 'yaw'),
+    'delta_a': ('controls', 'aileron'),
+    'delta_e': ('controls', 'elevator'),
+    'delta_r': ('controls', 'rudder'),
+    'RPM_Cl': ('propulsion', 'rpm_left'),
+    'RPM_Cr': ('propulsion', 'rpm_right'),
+    'theta_Cl': ('propulsion', 'tilt_left'),
+    'theta_Cr': ('propulsion', 'tilt_right'),
+}
+
+
+# Metadata attributes and their defaults when missing from the MAT file
+METADATA_DEFAULTS = {'sample_rate': 10.0, 'duration': 0.0}
+
+
+@dataclass(frozen=True)
+class _MatExtractor:
+    """Extraction plan for one mapping, built once by _build_extractor."""
+
+    variable_names: List[str]                    # MAT variables to load
+    metadata: Tuple[Tuple[str, str, float], ...]  # (attribute, MAT variable, default)
+    signals: Tuple[Tuple[str, str, float], ...]   # (attribute, MAT variable, scale)
+    shared_keys: frozenset                       # MAT variables read by several signals
+
+
+def _build_extractor(mapping: Dict) -> _MatExtractor:
+    """
+    Resolve a mapping into a flat extraction plan.
+
+    All mapping lookups and unit decisions happen here, once per mapping;
+    reading a file is then a single loop over (attribute, variable, scale).
+
+    Args:
+        mapping: Variable mapping as returned by load_mapping_config; missing
+                 entries fall back to DEFAULT_MAPPING
+
+    Returns:
+        _MatExtractor for the mapping
+    """
+    mat_keys = {
+        name: (mapping.get(category) or {}).get(key, DEFAULT_MAPPING[category][key])
+        for name, (category, key) in MAT_SOURCES.items()
+    }
+
+    # Degrees-to-radians factor per angle signal, from the 'units' section
+    units = mapping.get('units') or {}
+    scales = {
+        name: UnitConverter.DEG_TO_RAD
+        for unit_key, names in ANGLE_GROUPS.items()
+        if units.get(unit_key, 'radians') == 'degrees'
+        for name in names
+    }
+
+    signal_keys = [mat_keys[name] for name in mat_keys if name not in METADATA_DEFAULTS]
+    return _MatExtractor(
+        variable_names=sorted(set(mat_keys.values())),
+        metadata=tuple((name, mat_keys[name], default)
+                       for name, default in METADATA_DEFAULTS.items()),
+        signals=tuple((name, mat_key, scales.get(name, 1.0))
+                      for name, mat_key in mat_keys.items()
+                      if name not in METADATA_DEFAULTS),
+        shared_keys=frozenset(k for k in signal_keys if signal_keys.count(k) > 1),
+    )
+
+
 @dataclass
 class FlightData:
     """
@@ -117,14 +282,16 @@ class FlightData:
     Vd: np.ndarray = field(default_factory=lambda: np.array([]))  # Down velocity
     V_ground: np.ndarray = field(default_factory=lambda: np.array([]))  # Ground speed
     V_total: np.ndarray = field(default_factory=lambda: np.array([]))   # Total velocity
-    altitude: np.ndarray = field(default_factory=lambda: np.array([]))  # Altitude (=-D)
 
-    # Raw data storage for any extra variables
-    raw_data: Dict[str, Any] = field(default_factory=dict)
+    # Packed signal storage: one (n_channels, n_samples) block whose rows back
+    # the per-signal arrays above (see _pack_signals)
+    signals: np.ndarray = field(default_factory=lambda: np.empty((0, 0), dtype=SIGNAL_DTYPE))
+    signal_rows: Dict[str, int] = field(default_factory=dict)
 
     @classmethod
     def from_mat_file(cls, filepath: str,
-                      mapping_config: Optional[Union[str, Path, Dict]] = None) -> 'FlightData':
+                      mapping_config: Optional[Union[str, Path, Dict]] = None,
+                      use_cache: bool = True) -> 'FlightData':
         """
         Load flight data from a MATLAB .mat file.
 
@@ -132,22 +299,221 @@ class FlightData:
             filepath: Path to the .mat file
             mapping_config: Either a path to data_mapping.yaml, a dict with mappings,
                            or None to use default/auto-detected config
+            use_cache: Reuse (and store) the processed signals in SIGNAL_CACHE_DIR
 
         Returns:
             FlightData instance with loaded and processed data
         """
+        mapping = cls._resolve_mapping(mapping_config)
+        cache_path = _signal_cache_path(filepath, mapping) if use_cache else None
+
+        flight_data = cls._from_signal_cache(cache_path, filepath) if cache_path else None
+        if flight_data is None:
+            # Record validation warnings so cache hits can replay them
+            with warnings.catch_warnings(record=True) as caught:
+                warnings.simplefilter('always')
+                flight_data = cls._read_mat_file(filepath, _build_extractor(mapping))
+            for w in caught:
+                warnings.warn_explicit(w.message, w.category, w.filename, w.lineno)
+
+            # Compute derived quantities
+            flight_data._compute_derived_quantities()
+
+            # Pack all signals into one contiguous block
+            flight_data._pack_signals()
+
+            if cache_path:
+                flight_data._save_signal_cache(
+                    cache_path,
+                    [str(w.message) for w in caught if issubclass(w.category, UserWarning)])
+
+        # Print loading summary
+        flight_data._print_loading_summary()
+
+        return flight_data
+
+    @classmethod
+    def from_mat_files(
+        cls,
+        filepaths: List[Union[str, Path]],
+        mapping_config: Optional[Union[str, Path, Dict]] = None,
+        max_workers: Optional[int] = None,
+        use_cache: bool = True
+    ) -> List['FlightData']:
+        """
+        Load several MAT files in parallel worker processes.
+
+        Args:
+            filepaths: Paths to the .mat files
+            mapping_config: Mapping shared by all files (see from_mat_file)
+            max_workers: Number of processes (default: one per CPU core)
+            use_cache: Passed on to from_mat_file
+
+        Returns:
+            FlightData instances, in the order of filepaths
+        """
+        filepaths = [str(path) for path in filepaths]
+        mapping = cls._resolve_mapping(mapping_config)  # Resolved once, not per file
+
+        workers = max_workers or min(len(filepaths), os.cpu_count() or 1)
+        if workers <= 1:
+            return [cls.from_mat_file(path, mapping, use_cache) for path in filepaths]
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(cls.from_mat_file, filepaths,
+                                     repeat(mapping), repeat(use_cache)))
+
+    @classmethod
+    def from_mat_files_batched(
+        cls,
+        filepaths: List[Union[str, Path]],
+        mapping_config: Optional[Union[str, Path, Dict]] = None
+    ) -> List['FlightData']:
+        """
+        Load several MAT files, computing derived quantities as a batch.
+
+        With JAX installed, flights of equal length and sample rate are
+        stacked and processed in one vmapped call (one accelerator launch per
+        group). Without JAX each flight is processed as in from_mat_file.
+
+        Args:
+            filepaths: Paths to the .mat files
+            mapping_config: Mapping shared by all files (see from_mat_file)
+
+        Returns:
+            FlightData instances, in the order of filepaths
+        """
+        # Imported here: loading jax is only worth it for batched loads
+        from .utils.jax_kernels import JAX_AVAILABLE, derived_quantities_batched
+
+        extractor = _build_extractor(cls._resolve_mapping(mapping_config))
+        flights = [cls._read_mat_file(path, extractor) for path in filepaths]
+
+        # Group flights that can share one (B, T) batch
+        batches: Dict[tuple, List['FlightData']] = {}
+        for flight in flights:
+            if JAX_AVAILABLE and flight.n_samples >= 2:
+                batches.setdefault((flight.n_samples, flight.sample_rate), []).append(flight)
+            else:
+                flight._compute_derived_quantities()
+
+        for batch in batches.values():
+            dt = np.array([1.0 / f.sample_rate for f in batch])
+            outputs = derived_quantities_batched(
+                np.stack([f.N for f in batch]),
+                np.stack([f.E for f in batch]),
+                np.stack([f.D for f in batch]),
+                dt
+            )
+            for i, flight in enumerate(batch):
+                (flight.Vn, flight.Ve, flight.Vd,
+                 flight.V_ground, flight.V_total) = (out[i] for out in outputs)
+
+        for flight in flights:
+            flight._pack_signals()
+            flight._print_loading_summary()
+
+        return flights
+
+    @classmethod
+    def _from_signal_cache(cls, cache_path: Path,
+                           filepath: Union[str, Path]) -> Optional['FlightData']:
+        """
+        Rebuild a FlightData from its signal cache; None on a cache miss.
+
+        The signal block is memory-mapped copy-on-write, so only the pages
+        of the samples actually used are read, and writes never reach the
+        cache file. Warnings raised when the MAT file was first read are
+        emitted again.
+        """
+        try:
+            with open(cache_path.with_suffix('.json')) as f:
+                header = json.load(f)
+            channels = header['channels']
+            sample_rate, duration = header['sample_rate'], header['duration']
+            load_warnings = header['warnings']
+            signals = np.load(cache_path, mmap_mode='c')
+        except (OSError, KeyError, ValueError):
+            return None
+        if signals.shape[0] != len(channels):
+            return None
+
+        flight_data = cls()
+        flight_data.source_file = str(Path(filepath))
+        flight_data.sample_rate = float(sample_rate)
+        flight_data.duration = float(duration)
+        flight_data.n_samples = signals.shape[1]
+        flight_data.time = _time_vector(flight_data.n_samples, flight_data.sample_rate)
+
+        flight_data.signals = signals
+        flight_data.signal_rows = {name: row for row, name in enumerate(channels)}
+        for name, row in flight_data.signal_rows.items():
+            setattr(flight_data, name, signals[row])
+
+        for message in load_warnings:
+            warnings.warn(message, UserWarning, stacklevel=3)
+
+        return flight_data
+
+    def _save_signal_cache(self, cache_path: Path, load_warnings: List[str]) -> None:
+        """
+        Store the packed signals; failures only cost the next load a loadmat.
+
+        Args:
+            cache_path: Cache file from _signal_cache_path
+            load_warnings: Warning messages raised while reading the MAT
+                           file, replayed on cache hits
+        """
+        header = {
+            'channels': sorted(self.signal_rows, key=self.signal_rows.get),
+            'sample_rate': float(self.sample_rate),
+            'duration': float(self.duration),
+            'warnings': load_warnings,
+        }
+        tmp_path = cache_path.with_name(f"{cache_path.stem}.{os.getpid()}.tmp")
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            # Header first, signals last: a reader only hits once the .npy exists
+            with open(tmp_path, 'w') as f:
+                json.dump(header, f)
+            os.replace(tmp_path, cache_path.with_suffix('.json'))
+            with open(tmp_path, 'wb') as f:
+                np.save(f, self.signals)
+            os.replace(tmp_path, cache_path)  # Atomic: readers never see partial files
+        except OSError:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+    @staticmethod
+    def _resolve_mapping(mapping_config: Optional[Union[str, Path, Dict]]) -> Dict:
+        """Return a mapping dict, loading it from YAML unless one was given."""
+        if isinstance(mapping_config, dict):
+            return mapping_config
+        return load_mapping_config(mapping_config)
+
+    @classmethod
+    def _read_mat_file(cls, filepath: Union[str, Path], extractor: _MatExtractor) -> 'FlightData':
+        """
+        Read and validate the mapped signals of a MAT file.
+
+        Derived quantities are not computed and signals are not packed yet.
+
+        Args:
+            filepath: Path to the .mat file
+            extractor: Extraction plan from _build_extractor
+
+        Returns:
+            FlightData instance with the raw signals loaded
+        """
         path = Path(filepath)
         if not path.exists():
             raise FileNotFoundError(f"MAT file not found: {filepath}")
 
-        # Load mapping configuration
-        if isinstance(mapping_config, dict):
-            mapping = mapping_config
-        else:
-            mapping = load_mapping_config(mapping_config)
-
-        # Load raw data
-        mat_data = sio.loadmat(str(path))
+        # Load only the mapped variables, squeezed to 1-D where possible
+        mat_data = sio.loadmat(str(path), squeeze_me=True, mat_dtype=True,
+                               variable_names=extractor.variable_names)
 
         # Create instance
         flight_data = cls()
@@ -155,91 +521,59 @@ class FlightData:
 
         # Helper to safely extract array using mapping
         def get_array(mat_key: str) -> np.ndarray:
+            # One conversion to a flat, C-contiguous float64 array; no copy
+            # when the MAT variable already is one
             if mat_key in mat_data:
-                return mat_data[mat_key].flatten().astype(np.float64)
+                return np.ascontiguousarray(mat_data[mat_key], dtype=np.float64).reshape(-1)
             return np.array([])
 
         def get_scalar(mat_key: str, default: float = 0.0) -> float:
             if mat_key in mat_data:
-                return float(mat_data[mat_key].flatten()[0])
+                return float(np.ravel(mat_data[mat_key])[0])
             return default
 
         # Extract metadata using mapping
-        meta = mapping.get('metadata', {})
-        flight_data.sample_rate = get_scalar(meta.get('sample_rate', 'output_hz'), 10.0)
-        flight_data.duration = get_scalar(meta.get('duration', 'Time'), 0.0)
-
-        # Extract position using mapping
-        pos = mapping.get('position', {})
-        flight_data.N = get_array(pos.get('north', 'N'))
-        flight_data.E = get_array(pos.get('east', 'E'))
-        flight_data.D = get_array(pos.get('down', 'D'))
-
-        # Extract attitude using mapping
-        att = mapping.get('attitude', {})
-        flight_data.phi = get_array(att.get('roll', 'phi'))
-        flight_data.theta = get_array(att.get('pitch', 'theta'))
-        flight_data.psi = get_array(att.get('yaw', 'psi'))
-
-        # Convert attitude to radians if needed
-        units = mapping.get('units', {})
-        if units.get('attitude', 'radians') == 'degrees':
-            flight_data.phi = np.radians(flight_data.phi)
-            flight_data.theta = np.radians(flight_data.theta)
-            flight_data.psi = np.radians(flight_data.psi)
-
-        # Extract control surfaces using mapping
-        ctrl = mapping.get('controls', {})
-        flight_data.delta_a = get_array(ctrl.get('aileron', 'delta_a'))
-        flight_data.delta_e = get_array(ctrl.get('elevator', 'delta_e'))
-        flight_data.delta_r = get_array(ctrl.get('rudder', 'delta_r'))
-
-        # Convert controls to radians if needed
-        if units.get('controls', 'radians') == 'degrees':
-            flight_data.delta_a = np.radians(flight_data.delta_a)
-            flight_data.delta_e = np.radians(flight_data.delta_e)
-            flight_data.delta_r = np.radians(flight_data.delta_r)
-
-        # Extract propulsion using mapping
-        prop = mapping.get('propulsion', {})
-        flight_data.RPM_Cl = get_array(prop.get('rpm_left', 'RPM_Cl'))
-        flight_data.RPM_Cr = get_array(prop.get('rpm_right', 'RPM_Cr'))
-        flight_data.theta_Cl = get_array(prop.get('tilt_left', 'theta_Cl'))
-        flight_data.theta_Cr = get_array(prop.get('tilt_right', 'theta_Cr'))
-
-        # Convert propulsion tilt to radians if needed
-        if units.get('propulsion_tilt', 'radians') == 'degrees':
-            flight_data.theta_Cl = np.radians(flight_data.theta_Cl)
-            flight_data.theta_Cr = np.radians(flight_data.theta_Cr)
+        for name, mat_key, default in extractor.metadata:
+            setattr(flight_data, name, get_scalar(mat_key, default))
+
+        # Extract position, attitude, controls and propulsion, converting
+        # degrees to radians. Scaling is in place unless the MAT variable
+        # also backs another signal.
+        for name, mat_key, scale in extractor.signals:
+            arr = get_array(mat_key)
+            if scale != 1.0:
+                arr = np.multiply(arr, scale,
+                                  out=None if mat_key in extractor.shared_keys else arr)
+            setattr(flight_data, name, arr)
 
         # Set sample count
         flight_data.n_samples = len(flight_data.N)
 
         # Generate time vector
-        dt = 1.0 / flight_data.sample_rate
-        flight_data.time = np.arange(flight_data.n_samples) * dt
-
-        # Store raw data for reference
-        flight_data.raw_data = {
-            k: v for k, v in mat_data.items()
-            if not k.startswith('__')
-        }
+        flight_data.time = _time_vector(flight_data.n_samples, flight_data.sample_rate)
 
         # Validate loaded data
         flight_data._validate_data()
 
-        # Compute derived quantities
-        flight_data._compute_derived_quantities()
+        return flight_data
 
-        # Print loading summary
-        flight_data._print_loading_summary()
+    @cached_property
+    def raw_data(self) -> Dict[str, Any]:
+        """
+        All variables of the source MAT file, for anything not in the mapping.
 
-        return flight_data
+        Read from disk on first access instead of being kept from loading, so
+        the full MAT contents only stay in memory when actually used.
+        """
+        if not self.source_file or not Path(self.source_file).exists():
+            return {}
+        mat_data = sio.loadmat(self.source_file)
+        return {k: v for k, v in mat_data.items() if not k.startswith('__')}
 
     def _print_loading_summary(self) -> None:
         """Print a summary of loaded data for debugging."""
         print(f"\nFlight Data Loading Summary:")
-        print(f"  Source: {Path(self.source_file).name}")
+        print(f"  Source: {self.source_name}")
         print(f"  Duration: {self.duration:.1f}s, Samples: {self.n_samples}, Rate: {self.sample_rate}Hz")
 
         # Position/Attitude
@@ -292,24 +626,67 @@ class FlightData:
             status = 'constant' if rud_deg.min() == rud_deg.max() else 'varies'
             print(f"  Rudder (delta_r): [{rud_deg.min():.1f}°, {rud_deg.max():.1f}°] ({status})")
 
-    def _compute_derived_quantities(self) -> None:
-        """Compute velocities and other derived quantities from position data."""
+    def _compute_derived_quantities(self, use_jax: bool = False) -> None:
+        """
+        Compute velocities and other derived quantities from position data.
+
+        Args:
+            use_jax: Run the JAX-compiled kernel (e.g. on a GPU) instead of
+                     the Numba/NumPy one; requires JAX
+        """
         if len(self.N) == 0:
             return
 
         dt = 1.0 / self.sample_rate
+        if use_jax:
+            # Imported on demand so plain loads never pay for importing jax
+            from .utils.jax_kernels import derived_quantities_jax as derive
+        else:
+            derive = derived_quantities
 
-        # Compute velocities using central differences
-        self.Vn = np.gradient(self.N, dt)
-        self.Ve = np.gradient(self.E, dt)
-        self.Vd = np.gradient(self.D, dt)
-
-        # Ground speed and total velocity
-        self.V_ground = np.sqrt(self.Vn**2 + self.Ve**2)
-        self.V_total = np.sqrt(self.Vn**2 + self.Ve**2 + self.Vd**2)
+        # Velocities (central differences) and ground/total speed, fused
+        # into a single pass over the positions
+        (self.Vn, self.Ve, self.Vd,
+         self.V_ground, self.V_total) = derive(
+            self.N, self.E, self.D, dt)
 
-        # Altitude (negative of Down)
-        self.altitude = -self.D
+    def _pack_signals(self) -> None:
+        """
+        Pack all loaded signals into one contiguous block.
+
+        Each loaded signal in SIGNAL_CHANNELS becomes a row of self.signals
+        (stored as SIGNAL_DTYPE) and its attribute is replaced by a zero-copy
+        view of that row, so each channel stays contiguous and several
+        channels can be read together. Scale channels with scale_signals,
+        which also drops the cached values derived from them.
+        Channels that were not loaded stay empty arrays.
+        """
+        names = [name for name in SIGNAL_CHANNELS
+                 if len(getattr(self, name)) == self.n_samples > 0]
+
+        block = np.empty((len(names), self.n_samples), dtype=SIGNAL_DTYPE)
+        for row, name in enumerate(names):
+            block[row] = getattr(self, name)
+            setattr(self, name, block[row])
+
+        self.signals = block
+        self.signal_rows = {name: row for row, name in enumerate(names)}
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Row views would each be pickled as a separate copy; send the block
+        # once and rebuild the views on unpickling
+        state = self.__dict__.copy()
+        for name in self.signal_rows:
+            arr = state.get(name)
+            if isinstance(arr, np.ndarray) and np.may_share_memory(arr, self.signals):
+                del state[name]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        for name, row in self.signal_rows.items():
+            if name not in state:
+                self.__dict__[name] = self.signals[row]
 
     def _validate_data(self) -> None:
         """
@@ -328,13 +705,19 @@ class FlightData:
             (self.psi, 'psi (Yaw angle)'),
         ]
 
-        for arr, name in arrays_to_check:
-            if len(arr) == 0:
-                continue
-            if np.any(np.isnan(arr)):
-                raise ValueError(f"NaN values found in {name}. Check data source.")
-            if np.any(np.isinf(arr)):
-                raise ValueError(f"Infinite values found in {name}. Check data source.")
+        # A sum is finite only if every element is, so one allocation-free
+        # reduction per array clears the common case. A non-finite total
+        # (NaN/Inf, or overflow of huge values) gets the per-array check.
+        with np.errstate(over='ignore', invalid='ignore'):
+            total = sum(float(arr.sum()) for arr, _ in arrays_to_check)
+        if not np.isfinite(total):
+            for arr, name in arrays_to_check:
+                if len(arr) == 0:
+                    continue
+                if not np.isfinite(arr).all():
+                    if np.isnan(arr).any():
+                        raise ValueError(f"NaN values found in {name}. Check data source.")
+                    raise ValueError(f"Infinite values found in {name}. Check data source.")
 
         # Check array length consistency
         arrays_with_data = [(arr, name) for arr, name in arrays_to_check if len(arr) > 0]
@@ -349,67 +732,167 @@ class FlightData:
 
         # Warn about potential unit issues
         if len(self.phi) > 0:
-            if np.any(np.abs(self.phi) > 2 * np.pi):
+            if max(self.phi.max(), -self.phi.min()) > 2 * np.pi:
                 warnings.warn(
                     "Roll angles (phi) exceed 2π radians. "
                     "If your data is in degrees, set 'attitude: degrees' in data_mapping.yaml",
                     UserWarning
                 )
         if len(self.theta) > 0:
-            if np.any(np.abs(self.theta) > np.pi / 2 + 0.1):  # Allow small margin
+            if max(self.theta.max(), -self.theta.min()) > np.pi / 2 + 0.1:  # Allow small margin
                 warnings.warn(
                     "Pitch angles (theta) exceed ±90°. "
                     "If your data is in degrees, set 'attitude: degrees' in data_mapping.yaml",
                     UserWarning
                 )
 
-    # Convenience properties for degree conversions
-    @property
+    # Convenience properties for degree conversions. These are computed once
+    # and cached; assigning a new source array drops the cached conversions
+    # that depend on it (see __setattr__).
+
+    _DEPENDENT_CACHES = {
+        'phi': ('phi_deg',),
+        'theta': ('theta_deg',),
+        'psi': ('psi_deg',),
+        'delta_a': ('delta_a_deg',),
+        'delta_e': ('delta_e_deg',),
+        'delta_r': ('delta_r_deg',),
+        'V_ground': ('V_ground_knots', 'V_ground_kmh', 'flight_stats'),
+        'Vd': ('climb_rate', 'climb_rate_fpm', 'flight_stats'),
+        'N': ('segment_length', 'cumulative_path', 'path_length', 'flight_stats'),
+        'E': ('segment_length', 'cumulative_path', 'path_length', 'flight_stats'),
+        'D': ('altitude', 'segment_length', 'cumulative_path', 'path_length', 'flight_stats'),
+        'source_file': ('source_name',),
+    }
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        self._drop_dependent_caches(name)
+
+    def _drop_dependent_caches(self, name: str) -> None:
+        """Forget the cached properties computed from attribute name."""
+        for cached in self._DEPENDENT_CACHES.get(name, ()):
+            self.__dict__.pop(cached, None)
+
+    def scale_signals(self, names: Iterable[str], factor: float) -> None:
+        """
+        Scale packed channels in place with one operation on self.signals.
+
+        In-place writes bypass __setattr__, so the cached properties derived
+        from these channels are dropped here.
+
+        Args:
+            names: Channel names (keys of signal_rows)
+            factor: Multiplier applied to every sample
+
+        Raises:
+            KeyError: If a channel is not packed in self.signals
+        """
+        names = list(names)
+        self.signals[[self.signal_rows[name] for name in names]] *= factor
+        for name in names:
+            self._drop_dependent_caches(name)
+
+    @cached_property
+    def source_name(self) -> str:
+        """File name of the source, without its directory."""
+        return Path(self.source_file).name
+
+    @cached_property
+    def altitude(self) -> np.ndarray:
+        """Altitude in meters (negative of Down), computed on first access."""
+        return np.negative(self.D)
+
+    @cached_property
+    def segment_length(self) -> np.ndarray:
+        """3D distance between consecutive samples in meters, shape (n-1,)."""
+        # One (3, n-1) float64 diff block; einsum fuses the squares and their sum
+        diffs = np.diff(np.array([self.N, self.E, self.D], dtype=np.float64), axis=1)
+        return np.sqrt(np.einsum('ij,ij->j', diffs, diffs))
+
+    @cached_property
+    def cumulative_path(self) -> np.ndarray:
+        """Distance flown along the 3D path up to each sample in meters, shape (n,)."""
+        cumulative = np.zeros(self.n_samples)
+        np.cumsum(self.segment_length, out=cumulative[1:])
+        return cumulative
+
+    @cached_property
+    def path_length(self) -> float:
+        """Length of the 3D flight path in meters."""
+        if self.n_samples < 2:
+            return 0.0
+        return float(self.cumulative_path[-1])
+
+    @cached_property
+    def flight_stats(self) -> Dict[str, float]:
+        """
+        Summary statistics for reports, computed on first access.
+
+        Returns:
+            Dictionary with distance_m (straight-line, horizontal),
+            path_length_m, altitude_min_m/altitude_max_m,
+            speed_min_ms/speed_max_ms/speed_mean_ms and
+            climb_rate_min_ms/climb_rate_max_ms
+        """
+        return {
+            'distance_m': float(np.hypot(self.N[-1] - self.N[0], self.E[-1] - self.E[0])),
+            'path_length_m': self.path_length,
+            'altitude_min_m': float(self.altitude.min()),
+            'altitude_max_m': float(self.altitude.max()),
+            'speed_min_ms': float(self.V_ground.min()),
+            'speed_max_ms': float(self.V_ground.max()),
+            'speed_mean_ms': float(self.V_ground.mean()),
+            'climb_rate_min_ms': float(self.climb_rate.min()),
+            'climb_rate_max_ms': float(self.climb_rate.max()),
+        }
+
+    @cached_property
     def phi_deg(self) -> np.ndarray:
         """Roll angle in degrees."""
         return UnitConverter.rad_to_deg(self.phi)
 
-    @property
+    @cached_property
     def theta_deg(self) -> np.ndarray:
         """Pitch angle in degrees."""
         return UnitConverter.rad_to_deg(self.theta)
 
-    @property
+    @cached_property
     def psi_deg(self) -> np.ndarray:
         """Yaw/heading in degrees."""
         return UnitConverter.rad_to_deg(self.psi)
 
-    @property
+    @cached_property
     def delta_a_deg(self) -> np.ndarray:
         """Aileron deflection in degrees."""
         return UnitConverter.rad_to_deg(self.delta_a)
 
-    @property
+    @cached_property
     def delta_e_deg(self) -> np.ndarray:
         """Elevator deflection in degrees."""
         return UnitConverter.rad_to_deg(self.delta_e)
 
-    @property
+    @cached_property
     def delta_r_deg(self) -> np.ndarray:
         """Rudder deflection in degrees."""
         return UnitConverter.rad_to_deg(self.delta_r)
 
-    @property
+    @cached_property
     def V_ground_knots(self) -> np.ndarray:
         """Ground speed in knots."""
         return UnitConverter.ms_to_knots(self.V_ground)
 
-    @property
+    @cached_property
     def V_ground_kmh(self) -> np.ndarray:
         """Ground speed in km/h."""
         return UnitConverter.ms_to_kmh(self.V_ground)
 
-    @property
+    @cached_property
     def climb_rate(self) -> np.ndarray:
         """Climb rate in m/s (positive = climbing)."""
         return -self.Vd
 
-    @property
+    @cached_property
     def climb_rate_fpm(self) -> np.ndarray:
         """Climb rate in feet per minute."""
         return UnitConverter.ms_to_fpm(self.climb_rate)
@@ -429,7 +912,7 @@ class FlightData:
 
     def __repr__(self) -> str:
         return (
-            f"FlightData(source='{Path(self.source_file).name}', "
+            f"FlightData(source='{self.source_name}', "
             f"duration={self.duration}s, samples={self.n_samples}, "
             f"rate={self.sample_rate}Hz)"
         )
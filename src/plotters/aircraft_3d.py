@@ -2,19 +2,324 @@
 3D Aircraft visualization with trajectory and attitude.
 """
 
+import os
+import shutil
+import subprocess
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import chain
 import matplotlib.pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D
-from mpl_toolkits.mplot3d.art3d import Poly3DCollection
+from matplotlib.colors import to_rgba
+from mpl_toolkits.mplot3d.art3d import Line3DCollection, Poly3DCollection
 import numpy as np
-from typing import Optional, List, Tuple
-import imageio
+from PIL import Image
+from typing import Callable, Iterable, Iterator, Optional, List, Tuple
 from pathlib import Path
 from tqdm import tqdm
 
 from .base import BasePlotter
 from ..flight_data import FlightData
 from ..styles.themes import PlotStyle
-from ..utils.rotations import RotationUtils
+from ..utils.kernels import body_to_world, decimate_trail
+
+
+def find_ffmpeg() -> Optional[str]:
+    """
+    Locate an ffmpeg executable.
+
+    Prefers ffmpeg on PATH, then the binary bundled with imageio-ffmpeg.
+
+    Returns:
+        Path to ffmpeg, or None if unavailable
+    """
+    ffmpeg = shutil.which('ffmpeg')
+    if ffmpeg:
+        return ffmpeg
+    try:
+        import imageio_ffmpeg
+        return imageio_ffmpeg.get_ffmpeg_exe()
+    except (ImportError, RuntimeError):
+        return None
+
+
+# Default animation resolution per format. Video frames gain nothing from
+# print resolution (the style's dpi), only pixels to copy and encode
+ANIMATION_DPI = {'gif': 72, 'mp4': 100}
+
+# Frames rendered per worker task; only one task per worker (plus one) is in
+# flight, so memory stays bounded even at high dpi
+ANIMATION_CHUNK_FRAMES = 8
+
+# Per-process animation scene, set by _init_animation_worker
+_animation_state: dict = {}
+
+
+def _draw_frame(fig: plt.Figure, update: Callable[[int], None], frame_num: int) -> np.ndarray:
+    """
+    Update the scene to a frame and return its (H, W, 4) RGBA pixels.
+
+    The result is a view of the canvas buffer, valid until the next draw.
+    """
+    update(frame_num)
+    fig.canvas.draw()
+    return np.asarray(fig.canvas.buffer_rgba())
+
+
+def _init_animation_worker(
+    plotter: 'Aircraft3DPlotter',
+    n_frames: int,
+    trail_length: int,
+    dpi: float
+) -> None:
+    """Build the animation scene once per worker process."""
+    plotter.style.apply_to_matplotlib()
+    _animation_state['scene'] = plotter._animation_scene(n_frames, trail_length, dpi)
+
+
+def _render_frames(start: int, stop: int) -> np.ndarray:
+    """Render frames [start, stop) of the worker's scene as an (F, H, W, 3) RGB array."""
+    fig, update = _animation_state['scene']
+    block = None
+    for i, frame_num in enumerate(range(start, stop)):
+        rgba = _draw_frame(fig, update, frame_num)
+        if block is None:
+            block = np.empty((stop - start, *rgba.shape[:2], 3), dtype=np.uint8)
+        block[i] = rgba[..., :3]  # Drops alpha in the one copy out of the canvas
+    return block
+
+
+def _iter_animation_frames(
+    plotter: 'Aircraft3DPlotter',
+    n_frames: int,
+    trail_length: int,
+    dpi: float,
+    workers: int
+) -> Iterator[np.ndarray]:
+    """
+    Yield the pixels of every animation frame, in order.
+
+    With several workers, each renders contiguous frame ranges from its own
+    copy of the scene and frames are (H, W, 3) RGB. Only a bounded number of
+    ranges is in flight, so memory stays flat however long the animation is.
+    In this process, frames are (H, W, 4) RGBA views of the canvas, each valid
+    until the next frame is requested.
+
+    Args:
+        plotter: Plotter whose flight is animated
+        n_frames: Number of frames
+        trail_length: Number of past positions to show in trail
+        dpi: Frame resolution (dots per inch)
+        workers: Number of rendering processes (1 renders in this process)
+    """
+    if workers <= 1:
+        fig, update = plotter._animation_scene(n_frames, trail_length, dpi)
+        try:
+            for frame_num in range(n_frames):
+                yield _draw_frame(fig, update, frame_num)
+        finally:
+            plt.close(fig)
+        return
+
+    starts = iter(range(0, n_frames, ANIMATION_CHUNK_FRAMES))
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_animation_worker,
+        initargs=(plotter, n_frames, trail_length, dpi)
+    ) as executor:
+        def submit(start):
+            return executor.submit(_render_frames, start,
+                                   min(start + ANIMATION_CHUNK_FRAMES, n_frames))
+
+        pending = deque(submit(start) for _, start in zip(range(workers + 1), starts))
+        while pending:
+            block = pending.popleft().result()
+            start = next(starts, None)
+            if start is not None:
+                pending.append(submit(start))
+            yield from block
+
+
+def _with_progress(frames: Iterable[np.ndarray], progress: tqdm) -> Iterator[np.ndarray]:
+    """Pass frames through, advancing a progress bar per frame."""
+    for frame in frames:
+        yield frame
+        progress.update(1)
+
+
+def _encode_frames(
+    frames: Iterable[np.ndarray],
+    output_path: Path,
+    fps: int,
+    format: str
+) -> Path:
+    """
+    Encode frames to a GIF or MP4 file.
+
+    Frames are piped to ffmpeg when available (palettegen/paletteuse for GIF,
+    libx264 for MP4), otherwise encoded as a GIF with Pillow. Each frame is
+    consumed before the next one is requested.
+
+    Args:
+        frames: (H, W, 3) RGB or (H, W, 4) RGBA uint8 frames, all the same
+                size and layout
+        output_path: Output file path
+        fps: Frames per second
+        format: Output format ('gif' or 'mp4')
+
+    Returns:
+        Path of the written file (.gif when falling back from MP4)
+    """
+    frames = iter(frames)
+    first = next(frames)
+    height, width, channels = first.shape
+
+    ffmpeg = find_ffmpeg()
+    if ffmpeg is None and format != 'gif':
+        print("Warning: ffmpeg not found, writing GIF instead of "
+              f"{format.upper()}")
+        output_path = output_path.with_suffix('.gif')
+
+    # Encode to a temporary file and move it into place only on success, so an
+    # interrupted or failed render never leaves a truncated output behind
+    tmp_path = output_path.with_suffix('.tmp' + output_path.suffix)
+    try:
+        if ffmpeg is None:
+            # Frames are converted as Pillow consumes them; it only keeps their
+            # palettized form, not a list of full RGB images
+            Image.fromarray(first).convert('RGB').save(
+                tmp_path, save_all=True,
+                append_images=(Image.fromarray(frame).convert('RGB') for frame in frames),
+                duration=int(1000 / fps), loop=0)
+        else:
+            _pipe_to_ffmpeg(ffmpeg, chain([first], frames), tmp_path,
+                            width, height, channels, fps, format)
+        os.replace(tmp_path, output_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+    return output_path
+
+
+def _pipe_to_ffmpeg(
+    ffmpeg: str,
+    frames: Iterable[np.ndarray],
+    output_path: Path,
+    width: int,
+    height: int,
+    channels: int,
+    fps: int,
+    format: str
+) -> None:
+    """
+    Pipe raw frames to an ffmpeg process writing output_path.
+
+    Raises:
+        RuntimeError: If ffmpeg exits with an error
+    """
+    if format == 'gif':
+        codec_args = ['-filter_complex',
+                      'split [a][b];[a] palettegen [p];[b][p] paletteuse']
+    else:
+        codec_args = ['-vcodec', 'libx264', '-b:v', '4000k', '-pix_fmt', 'yuv420p',
+                      '-vf', 'pad=ceil(iw/2)*2:ceil(ih/2)*2']
+    cmd = [ffmpeg, '-loglevel', 'error',
+           '-f', 'rawvideo', '-pix_fmt', 'rgba' if channels == 4 else 'rgb24',
+           '-s', f'{width}x{height}',
+           '-framerate', str(fps), '-i', 'pipe:',
+           *codec_args, '-y', str(output_path)]
+
+    proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stderr=subprocess.PIPE)
+    try:
+        for frame in frames:
+            proc.stdin.write(frame.data)
+    except BrokenPipeError:
+        pass  # ffmpeg exited early; its error is reported below
+    except BaseException:
+        # The frame source failed: stop ffmpeg and reap it
+        proc.kill()
+        proc.communicate()
+        raise
+    _, stderr = proc.communicate()  # Closes stdin and waits for ffmpeg
+    if proc.returncode != 0:
+        raise RuntimeError(f"ffmpeg failed: {stderr.decode(errors='replace').strip()}")
+
+
+def _readonly(arr: np.ndarray) -> np.ndarray:
+    """Mark an array read-only and return it."""
+    arr.flags.writeable = False
+    return arr
+
+
+# Simplified VTOL aircraft geometry at unit scale (nose pointing +X in body frame)
+# Coordinates are [x, y, z] where x=forward, y=right, z=down
+_BASE_VERTICES = _readonly(np.array([
+    # Fuselage
+    [4, 0, 0],            # 0: Nose
+    [-3, 0, 0],           # 1: Tail
+    [0, 0.5, 0],          # 2: Fuselage right
+    [0, -0.5, 0],         # 3: Fuselage left
+    [0, 0, 0.3],          # 4: Fuselage bottom
+    [0, 0, -0.2],         # 5: Fuselage top
+
+    # Right wing
+    [0.5, 5, 0],          # 6: Right wing tip leading
+    [-0.5, 5, 0],         # 7: Right wing tip trailing
+    [0.5, 0.8, 0],        # 8: Right wing root leading
+    [-0.5, 0.8, 0],       # 9: Right wing root trailing
+
+    # Left wing
+    [0.5, -5, 0],         # 10: Left wing tip leading
+    [-0.5, -5, 0],        # 11: Left wing tip trailing
+    [0.5, -0.8, 0],       # 12: Left wing root leading
+    [-0.5, -0.8, 0],      # 13: Left wing root trailing
+
+    # Horizontal tail
+    [-2.5, 1.5, 0],       # 14: Right tail tip
+    [-2.5, -1.5, 0],      # 15: Left tail tip
+    [-2, 0, 0],           # 16: Tail leading edge
+
+    # Vertical tail
+    [-2, 0, -0.2],        # 17: Vertical tail bottom
+    [-3, 0, -0.2],        # 18: Vertical tail trailing
+    [-2.5, 0, -1.2],      # 19: Vertical tail top
+], dtype=np.float64))
+
+# Faces (vertex indices) for 3D plotting
+_BASE_FACES = tuple(_readonly(np.array(face)) for face in [
+    # Fuselage (simplified)
+    [0, 2, 5], [0, 5, 3], [0, 3, 4], [0, 4, 2],  # Nose cone
+    [1, 5, 2], [1, 3, 5], [1, 4, 3], [1, 2, 4],  # Tail cone
+
+    # Right wing
+    [6, 7, 9, 8],
+
+    # Left wing
+    [10, 12, 13, 11],
+
+    # Horizontal tail
+    [14, 1, 15], [14, 16, 1], [1, 16, 15],
+
+    # Vertical tail
+    [17, 18, 19],
+])
+
+
+# Wireframe edges (vertex index pairs) of the fuselage triangles and the
+# wing quads, and which of them belong to the wings
+_WIREFRAME_EDGES = _readonly(np.array([
+    (face[k], face[(k + 1) % len(face)])
+    for face in _BASE_FACES[:10] for k in range(len(face))
+]))
+_WIREFRAME_IS_WING = _readonly(np.array([
+    face_idx >= 8 for face_idx, face in enumerate(_BASE_FACES[:10]) for _ in face
+]))
+
+
+@lru_cache(maxsize=8)
+def _aircraft_geometry(scale: float) -> Tuple[np.ndarray, Tuple[np.ndarray, ...]]:
+    """Aircraft vertices at a given scale and faces, shared between callers."""
+    return _readonly(_BASE_VERTICES * scale), _BASE_FACES
 
 
 class Aircraft3DPlotter(BasePlotter):
@@ -28,72 +333,18 @@ class Aircraft3DPlotter(BasePlotter):
         """Generate 3D aircraft visualization."""
         return self.plot_trajectory_with_aircraft()
 
-    def _create_aircraft_geometry(self, scale: float = 1.0) -> Tuple[np.ndarray, List]:
+    def _create_aircraft_geometry(
+        self,
+        scale: float = 1.0
+    ) -> Tuple[np.ndarray, Tuple[np.ndarray, ...]]:
         """
         Create simple aircraft geometry.
 
         Returns:
-            vertices: (N, 3) array of vertex positions in body frame
-            faces: List of face definitions (vertex indices)
+            vertices: (N, 3) read-only array of vertex positions in body frame
+            faces: Tuple of face definitions (read-only vertex index arrays)
         """
-        # Scale factor
-        s = scale
-
-        # Simplified VTOL aircraft geometry (nose pointing +X in body frame)
-        # Coordinates are [x, y, z] where x=forward, y=right, z=down
-
-        vertices = np.array([
-            # Fuselage
-            [4 * s, 0, 0],           # 0: Nose
-            [-3 * s, 0, 0],          # 1: Tail
-            [0, 0.5 * s, 0],         # 2: Fuselage right
-            [0, -0.5 * s, 0],        # 3: Fuselage left
-            [0, 0, 0.3 * s],         # 4: Fuselage bottom
-            [0, 0, -0.2 * s],        # 5: Fuselage top
-
-            # Right wing
-            [0.5 * s, 5 * s, 0],     # 6: Right wing tip leading
-            [-0.5 * s, 5 * s, 0],    # 7: Right wing tip trailing
-            [0.5 * s, 0.8 * s, 0],   # 8: Right wing root leading
-            [-0.5 * s, 0.8 * s, 0],  # 9: Right wing root trailing
-
-            # Left wing
-            [0.5 * s, -5 * s, 0],    # 10: Left wing tip leading
-            [-0.5 * s, -5 * s, 0],   # 11: Left wing tip trailing
-            [0.5 * s, -0.8 * s, 0],  # 12: Left wing root leading
-            [-0.5 * s, -0.8 * s, 0], # 13: Left wing root trailing
-
-            # Horizontal tail
-            [-2.5 * s, 1.5 * s, 0],  # 14: Right tail tip
-            [-2.5 * s, -1.5 * s, 0], # 15: Left tail tip
-            [-2 * s, 0, 0],          # 16: Tail leading edge
-
-            # Vertical tail
-            [-2 * s, 0, -0.2 * s],   # 17: Vertical tail bottom
-            [-3 * s, 0, -0.2 * s],   # 18: Vertical tail trailing
-            [-2.5 * s, 0, -1.2 * s], # 19: Vertical tail top
-        ])
-
-        # Define faces (triangles) for 3D plotting
-        faces = [
-            # Fuselage (simplified)
-            [0, 2, 5], [0, 5, 3], [0, 3, 4], [0, 4, 2],  # Nose cone
-            [1, 5, 2], [1, 3, 5], [1, 4, 3], [1, 2, 4],  # Tail cone
-
-            # Right wing
-            [6, 7, 9, 8],
-
-            # Left wing
-            [10, 12, 13, 11],
-
-            # Horizontal tail
-            [14, 1, 15], [14, 16, 1], [1, 16, 15],
-
-            # Vertical tail
-            [17, 18, 19],
-        ]
-
-        return vertices, faces
+        return _aircraft_geometry(float(scale))
 
     def _transform_aircraft(
         self,
@@ -103,17 +354,9 @@ class Aircraft3DPlotter(BasePlotter):
         theta: float,
         psi: float
     ) -> np.ndarray:
-        """Transform aircraft vertices to world coordinates."""
-        # Create rotation matrix (body to NED)
-        dcm = RotationUtils.euler_to_dcm(phi, theta, psi)
-
-        # Transform vertices
-        transformed = (dcm @ vertices.T).T
-
-        # Add position offset
-        transformed += position
-
-        return transformed
+        """Transform aircraft vertices to world coordinates (one pose of body_to_world)."""
+        return body_to_world(vertices, np.reshape(position, (1, 3)),
+                             [phi], [theta], [psi])[0]
 
     def plot_trajectory_with_aircraft(
         self,
@@ -135,61 +378,51 @@ class Aircraft3DPlotter(BasePlotter):
         colors = self.style.colors.get('trajectory', {})
         ac_colors = self.style.colors.get('aircraft', {})
 
-        # Plot trajectory path
-        ax.plot(self.data.E, self.data.N, self.data.altitude,
+        # Plot trajectory path (simplified; the aircraft use full-rate samples)
+        path = self._simplified_path()
+        ax.plot(path[:, 0], path[:, 1], path[:, 2],
                 color=colors.get('path', '#1f77b4'),
                 linewidth=1.0, alpha=0.7, label='Flight Path')
 
         # Ground track
         if show_ground_track:
-            ax.plot(self.data.E, self.data.N, np.zeros_like(self.data.N),
+            ax.plot(path[:, 0], path[:, 1], np.zeros(len(path)),
                     color='gray', linewidth=0.5, alpha=0.3, linestyle='--')
 
         # Create aircraft geometry
-        vertices, faces = self._create_aircraft_geometry(scale=self.aircraft_scale)
+        vertices, _ = self._create_aircraft_geometry(scale=self.aircraft_scale)
 
         # Select indices for aircraft placement
         indices = np.linspace(0, len(self.data.N) - 1, n_aircraft + 2).astype(int)[1:-1]
 
-        # Draw aircraft at selected points
-        for i, idx in enumerate(indices):
-            # Get position and attitude
-            pos = np.array([self.data.E[idx], self.data.N[idx], self.data.altitude[idx]])
-            phi = self.data.phi[idx]
-            theta = self.data.theta[idx]
-            psi = self.data.psi[idx]
-
-            # Transform aircraft
-            transformed = self._transform_aircraft(vertices, pos, phi, theta, psi)
-
-            # Color gradient along path
-            alpha = 0.3 + 0.7 * (i / len(indices))
-
-            # Draw aircraft as wireframe
-            # Fuselage
-            for face_idx in range(8):
-                face = faces[face_idx]
-                verts = transformed[face]
-                ax.plot(verts[[0, 1, 2, 0], 0],
-                        verts[[0, 1, 2, 0], 1],
-                        verts[[0, 1, 2, 0], 2],
-                        color=ac_colors.get('fuselage', '#4a90d9'),
-                        linewidth=0.8, alpha=alpha)
-
-            # Wings
-            for face_idx in [8, 9]:
-                face = faces[face_idx]
-                verts = transformed[face]
-                xs = np.append(verts[:, 0], verts[0, 0])
-                ys = np.append(verts[:, 1], verts[0, 1])
-                zs = np.append(verts[:, 2], verts[0, 2])
-                ax.plot(xs, ys, zs,
-                        color=ac_colors.get('wings', '#6ab7ff'),
-                        linewidth=1.0, alpha=alpha)
-
-            # Draw vertical line to ground
-            ax.plot([pos[0], pos[0]], [pos[1], pos[1]], [0, pos[2]],
-                    color='gray', linestyle=':', alpha=0.3, linewidth=0.5)
+        # Transform all aircraft poses in one batched kernel call
+        positions = np.column_stack([self.data.E[indices], self.data.N[indices],
+                                     self.data.altitude[indices]])
+        all_transformed = body_to_world(vertices, positions, self.data.phi[indices],
+                                        self.data.theta[indices], self.data.psi[indices])
+
+        # Draw every aircraft as one wireframe collection: (aircraft, edge, 2, 3)
+        # segments, with alpha fading in along the path
+        segments = all_transformed[:, _WIREFRAME_EDGES]
+        alphas = 0.3 + 0.7 * (np.arange(len(indices)) / len(indices))
+        edge_colors = np.where(_WIREFRAME_IS_WING[:, None],
+                               to_rgba(ac_colors.get('wings', '#6ab7ff')),
+                               to_rgba(ac_colors.get('fuselage', '#4a90d9')))
+        seg_colors = np.repeat(edge_colors[None], len(indices), axis=0)
+        seg_colors[..., 3] = alphas[:, None]
+        ax.add_collection3d(Line3DCollection(
+            segments.reshape(-1, 2, 3),
+            colors=seg_colors.reshape(-1, 4),
+            linewidths=np.tile(np.where(_WIREFRAME_IS_WING, 1.0, 0.8), len(indices))))
+
+        # Vertical lines to ground
+        drops = np.repeat(positions[:, None, :], 2, axis=1)
+        drops[:, 0, 2] = 0
+        ax.add_collection3d(Line3DCollection(drops, colors='gray', linestyles=':',
+                                             alpha=0.3, linewidths=0.5))
+        # Include the aircraft in the z autoscale (as ax.plot did)
+        ax.auto_scale_xyz(segments[..., 0], segments[..., 1], segments[..., 2],
+                          had_data=True)
 
         # Mark start and end
         ax.scatter(self.data.E[0], self.data.N[0], self.data.altitude[0],
@@ -228,17 +461,24 @@ class Aircraft3DPlotter(BasePlotter):
         fps: int = 30,
         duration_factor: float = 1.0,
         trail_length: int = 50,
-        format: str = 'gif'
+        format: str = 'gif',
+        max_workers: Optional[int] = None,
+        dpi: Optional[float] = None
     ) -> Path:
         """
         Create animated flight visualization.
 
+        Frames are independent, so contiguous frame ranges are rendered in
+        parallel worker processes and streamed, in order, to the encoder.
+
         Args:
             output_path: Output file path
             fps: Frames per second
             duration_factor: Speed factor (1.0 = real-time, 0.5 = 2x speed)
             trail_length: Number of past positions to show in trail
             format: Output format ('gif' or 'mp4')
+            max_workers: Number of rendering processes (default: one per CPU core)
+            dpi: Frame resolution (default: ANIMATION_DPI for the format)
 
         Returns:
             Path to output file
@@ -246,13 +486,47 @@ class Aircraft3DPlotter(BasePlotter):
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Calculate frame indices
+        # Calculate frame count
         real_duration = self.data.duration
         anim_duration = real_duration * duration_factor
-        n_frames = int(anim_duration * fps)
+        n_frames = max(int(anim_duration * fps), 1)
+
+        workers = min(max_workers or os.cpu_count() or 1,
+                      -(-n_frames // ANIMATION_CHUNK_FRAMES))
+
+        print(f"Rendering {n_frames} frames to {output_path} using {workers} worker(s)...")
+        dpi = dpi or ANIMATION_DPI.get(format, ANIMATION_DPI['mp4'])
+        frames = _iter_animation_frames(self, n_frames, trail_length, dpi, workers)
+        with tqdm(total=n_frames, desc="Rendering") as progress:
+            output_path = _encode_frames(_with_progress(frames, progress),
+                                         output_path, fps, format)
 
+        print(f"Animation saved: {output_path}")
+        return output_path
+
+    def _animation_scene(
+        self,
+        n_frames: int,
+        trail_length: int,
+        dpi: float
+    ) -> Tuple[plt.Figure, Callable[[int], None]]:
+        """
+        Build the animation figure and its per-frame update function.
+
+        The figure and every artist are created once; update(frame_num) only
+        moves the trail, the aircraft pose artists, the title and the view.
+
+        Args:
+            n_frames: Number of frames, spread evenly over the flight
+            trail_length: Number of past positions to show in trail
+            dpi: Frame resolution (dots per inch)
+
+        Returns:
+            (figure, update function)
+        """
         # Sample indices from data
-        frame_indices = np.linspace(0, len(self.data.N) - 1, n_frames).astype(int)
+        frame_indices = np.linspace(0, len(self.data.N) - 1, n_frames).astype(np.int64)
+        trail_starts = np.maximum(frame_indices - trail_length, 0)
 
         # Create aircraft geometry
         vertices, faces = self._create_aircraft_geometry(scale=self.aircraft_scale)
@@ -260,112 +534,109 @@ class Aircraft3DPlotter(BasePlotter):
         colors = self.style.colors.get('trajectory', {})
         ac_colors = self.style.colors.get('aircraft', {})
 
-        # Generate frames
-        frames = []
-        print(f"Generating {n_frames} frames for animation...")
-
-        for frame_num, idx in enumerate(tqdm(frame_indices, desc="Rendering")):
-            fig = plt.figure(figsize=(10, 8))
-            ax = fig.add_subplot(111, projection='3d')
-
-            # Determine trail range
-            trail_start = max(0, idx - trail_length)
-
-            # Plot trail
-            ax.plot(self.data.E[trail_start:idx + 1],
-                    self.data.N[trail_start:idx + 1],
-                    self.data.altitude[trail_start:idx + 1],
-                    color=colors.get('path', '#1f77b4'),
-                    linewidth=2.0, alpha=0.8)
-
-            # Plot future path (faded)
-            ax.plot(self.data.E[idx:],
-                    self.data.N[idx:],
-                    self.data.altitude[idx:],
-                    color=colors.get('path', '#1f77b4'),
-                    linewidth=0.5, alpha=0.2)
-
-            # Ground track
-            ax.plot(self.data.E, self.data.N, np.zeros_like(self.data.N),
-                    color='gray', linewidth=0.5, alpha=0.2, linestyle='--')
-
-            # Current position
-            pos = np.array([self.data.E[idx], self.data.N[idx], self.data.altitude[idx]])
-            phi = self.data.phi[idx]
-            theta = self.data.theta[idx]
-            psi = self.data.psi[idx]
-
-            # Transform and draw aircraft
-            transformed = self._transform_aircraft(vertices, pos, phi, theta, psi)
-
-            # Draw filled polygons for aircraft
-            # Wings
-            for face_idx in [8, 9]:
-                face = faces[face_idx]
-                verts = [list(zip(transformed[face, 0],
-                                  transformed[face, 1],
-                                  transformed[face, 2]))]
-                poly = Poly3DCollection(verts, alpha=0.8,
-                                        facecolor=ac_colors.get('wings', '#6ab7ff'),
-                                        edgecolor='black', linewidth=0.5)
-                ax.add_collection3d(poly)
-
-            # Fuselage outline
-            for face_idx in range(8):
-                face = faces[face_idx]
-                verts = transformed[face]
-                ax.plot(verts[[0, 1, 2, 0], 0],
-                        verts[[0, 1, 2, 0], 1],
-                        verts[[0, 1, 2, 0], 2],
-                        color=ac_colors.get('fuselage', '#4a90d9'),
-                        linewidth=1.0)
-
-            # Vertical line to ground
-            ax.plot([pos[0], pos[0]], [pos[1], pos[1]], [0, pos[2]],
-                    color='gray', linestyle=':', alpha=0.5)
-
-            # Start marker
-            ax.scatter(self.data.E[0], self.data.N[0], self.data.altitude[0],
-                       c=colors.get('start', '#2ca02c'), s=80, marker='o')
-
-            # Set consistent view limits
-            max_range = max(
-                self.data.E.max() - self.data.E.min(),
-                self.data.N.max() - self.data.N.min()
-            ) / 2 * 1.1
-
-            mid_e = (self.data.E.max() + self.data.E.min()) / 2
-            mid_n = (self.data.N.max() + self.data.N.min()) / 2
-
-            ax.set_xlim(mid_e - max_range, mid_e + max_range)
-            ax.set_ylim(mid_n - max_range, mid_n + max_range)
-            ax.set_zlim(0, self.data.altitude.max() * 1.2)
-
-            ax.set_xlabel('East (m)')
-            ax.set_ylabel('North (m)')
-            ax.set_zlabel('Altitude (m)')
-
-            # Add time annotation
-            time = self.data.time[idx]
-            ax.set_title(f'Flight Simulation - t = {time:.1f}s',
-                         fontsize=14, fontweight='bold')
+        # Transform aircraft geometry for every frame up front (batched kernel)
+        frame_positions = np.column_stack([self.data.E[frame_indices],
+                                           self.data.N[frame_indices],
+                                           self.data.altitude[frame_indices]])
+        frame_geometry = body_to_world(vertices, frame_positions,
+                                       self.data.phi[frame_indices],
+                                       self.data.theta[frame_indices],
+                                       self.data.psi[frame_indices])
+
+        # Background paths only need enough points to look smooth
+        path_xyz = np.column_stack([self.data.E, self.data.N, self.data.altitude])
+        ground_xy = decimate_trail(path_xyz[:, :2], 500)
+
+        # Future path: decimate the whole path once and, per frame, show the
+        # decimated points after the current sample (copied into a fixed buffer)
+        n_path = len(path_xyz)
+        n_future = min(n_path, 500)
+        future_idx = (np.arange(n_future) * (n_path - 1)) // max(n_future - 1, 1)
+        future_xyz = path_xyz[future_idx]
+        future_starts = np.searchsorted(future_idx, frame_indices, side='right')
+        future_buf = np.empty((n_future + 1, 3))
+
+        # Build the figure and every artist once
+        fig = plt.figure(figsize=(10, 8), dpi=dpi)
+        ax = fig.add_subplot(111, projection='3d')
+        # Fixed margins: the layout never changes between frames, so no
+        # layout engine has to run on each draw
+        fig.subplots_adjust(left=0.08, right=0.95, bottom=0.08, top=0.92)
+
+        # Trail and future path (data set per frame)
+        trail_line, = ax.plot([], [], [], color=colors.get('path', '#1f77b4'),
+                              linewidth=2.0, alpha=0.8)
+        future_line, = ax.plot([], [], [], color=colors.get('path', '#1f77b4'),
+                               linewidth=0.5, alpha=0.2)
+
+        # Ground track (static)
+        ax.plot(ground_xy[:, 0], ground_xy[:, 1], np.zeros(len(ground_xy)),
+                color='gray', linewidth=0.5, alpha=0.2, linestyle='--')
+
+        # Wings as filled polygons
+        wing_faces = [faces[8], faces[9]]
+        wing_poly = Poly3DCollection([frame_geometry[0][face] for face in wing_faces],
+                                     alpha=0.8,
+                                     facecolor=ac_colors.get('wings', '#6ab7ff'),
+                                     edgecolor='black', linewidth=0.5)
+        ax.add_collection3d(wing_poly)
+
+        # Fuselage outline, one collection of edge segments
+        fuselage_edges = _WIREFRAME_EDGES[~_WIREFRAME_IS_WING]
+        fuselage_lines = Line3DCollection(frame_geometry[0][fuselage_edges],
+                                          colors=ac_colors.get('fuselage', '#4a90d9'),
+                                          linewidths=1.0)
+        ax.add_collection3d(fuselage_lines)
+
+        # Vertical line to ground
+        drop_line, = ax.plot([], [], [], color='gray', linestyle=':', alpha=0.5)
+
+        # Start marker (static)
+        ax.scatter(self.data.E[0], self.data.N[0], self.data.altitude[0],
+                   c=colors.get('start', '#2ca02c'), s=80, marker='o')
 
-            ax.view_init(elev=25, azim=-60 + frame_num * 0.1)  # Slow rotation
+        # Set consistent view limits (set once; the frames never change them)
+        (e_min, n_min, _), (e_max, n_max, alt_max) = path_xyz.min(axis=0), path_xyz.max(axis=0)
+        max_range = max(e_max - e_min, n_max - n_min) / 2 * 1.1
 
-            # Convert figure to image (compatible with newer matplotlib)
-            fig.canvas.draw()
-            buf = fig.canvas.buffer_rgba()
-            image = np.asarray(buf)[:, :, :3]  # Remove alpha channel
-            frames.append(image.copy())
+        mid_e = (e_max + e_min) / 2
+        mid_n = (n_max + n_min) / 2
 
-            plt.close(fig)
+        ax.set_xlim(mid_e - max_range, mid_e + max_range)
+        ax.set_ylim(mid_n - max_range, mid_n + max_range)
+        ax.set_zlim(0, alt_max * 1.2)
 
-        # Save animation
-        print(f"Saving animation to {output_path}...")
-        if format == 'gif':
-            imageio.mimsave(output_path, frames, fps=fps, loop=0)
-        else:  # mp4
-            imageio.mimsave(output_path, frames, fps=fps)
+        ax.set_xlabel('East (m)')
+        ax.set_ylabel('North (m)')
+        ax.set_zlabel('Altitude (m)')
 
-        print(f"Animation saved: {output_path}")
-        return output_path
+        title = ax.set_title('', fontsize=14, fontweight='bold')
+
+        def update(frame_num: int):
+            idx = frame_indices[frame_num]
+
+            # Trail (a view into the path, no copy)
+            trail = path_xyz[trail_starts[frame_num]:idx + 1]
+            trail_line.set_data_3d(trail[:, 0], trail[:, 1], trail[:, 2])
+
+            # Future path (faded)
+            n = n_future - future_starts[frame_num]
+            future_buf[0] = path_xyz[idx]
+            future_buf[1:n + 1] = future_xyz[future_starts[frame_num]:]
+            future = future_buf[:n + 1]
+            future_line.set_data_3d(future[:, 0], future[:, 1], future[:, 2])
+
+            # Aircraft pose
+            transformed = frame_geometry[frame_num]
+            wing_poly.set_verts([transformed[face] for face in wing_faces])
+            fuselage_lines.set_segments(transformed[fuselage_edges])
+
+            pos = frame_positions[frame_num]
+            drop_line.set_data_3d([pos[0], pos[0]], [pos[1], pos[1]], [0, pos[2]])
+
+            # Time annotation
+            title.set_text(f'Flight Simulation - t = {self.data.time[idx]:.1f}s')
+
+            ax.view_init(elev=25, azim=-60 + frame_num * 0.1)  # Slow rotation
+
+        return fig, update
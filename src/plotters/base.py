@@ -2,19 +2,79 @@
 Base plotter class with common functionality.
 """
 
+import math
+from concurrent.futures import ThreadPoolExecutor
 import matplotlib.pyplot as plt
 import numpy as np
+from PIL import Image
 from pathlib import Path
-from typing import Optional, Tuple, List
+from typing import Optional, Tuple, List, Dict
 from abc import ABC, abstractmethod
 
 from ..flight_data import FlightData
 from ..styles.themes import PlotStyle, load_style
+from ..utils.kernels import rdp_simplify, decimate_trail, minmax_indices
+
+
+# Thread pool for background PNG encoding (created on first use)
+_png_encoder: Optional[ThreadPoolExecutor] = None
+_pending_saves: list = []
+
+
+def _encode_png(
+    pixels: np.ndarray,
+    filepath: Path,
+    dpi: float,
+    compress_level: int
+) -> Path:
+    """Encode an RGBA pixel array to a PNG file."""
+    Image.fromarray(pixels, 'RGBA').save(filepath, 'PNG', dpi=(dpi, dpi),
+                                         compress_level=compress_level)
+    return filepath
+
+
+def wait_for_pending_saves() -> List[Path]:
+    """
+    Block until all background PNG saves have finished.
+
+    Returns:
+        Paths written since the last call
+
+    Raises:
+        Any exception raised while encoding a figure
+    """
+    try:
+        paths = [future.result() for future in _pending_saves]
+    finally:
+        _pending_saves.clear()
+    return paths
+
+
+def shutdown_png_encoder() -> None:
+    """
+    Stop the background PNG encoder, waiting for any saves still running.
+
+    Results of saves not yet collected by wait_for_pending_saves are discarded.
+    """
+    global _png_encoder
+    if _png_encoder is not None:
+        _png_encoder.shutdown(wait=True)
+        _png_encoder = None
+    _pending_saves.clear()
+
+
+# Flight modes by mean propeller tilt: CRUISE below the first threshold,
+# HOVER above the second, TRANSITION in between
+FLIGHT_MODES = ('CRUISE', 'TRANSITION', 'HOVER')
+FLIGHT_MODE_TILT_DEG = (10.0, 80.0)
 
 
 class BasePlotter(ABC):
     """Base class for all plotters."""
 
+    # Upper bound on drawn points for full-path lines
+    max_path_points = 2000
+
     def __init__(
         self,
         flight_data: FlightData,
@@ -40,7 +100,8 @@ class BasePlotter(ABC):
         self,
         fig: plt.Figure,
         filename: str,
-        subdirectory: Optional[str] = None
+        subdirectory: Optional[str] = None,
+        background: bool = False
     ) -> Optional[Path]:
         """
         Save figure to file.
@@ -49,6 +110,8 @@ class BasePlotter(ABC):
             fig: Matplotlib figure
             filename: Base filename (without extension)
             subdirectory: Optional subdirectory within output_dir
+            background: For PNG output, render now and encode the file on a
+                        background thread (see wait_for_pending_saves)
 
         Returns:
             Path to saved file, or None if no output_dir set
@@ -67,12 +130,115 @@ class BasePlotter(ABC):
         # Add extension
         filepath = save_dir / f"{filename}.{self.style.format}"
 
+        if background and self.style.format == 'png':
+            self._write_png(self._render_tight_rgba(fig), filepath, background=True)
+            return filepath
+
         # Save with tight layout
+        save_kwargs = {}
+        if self.style.format == 'png':
+            save_kwargs['pil_kwargs'] = {'compress_level': self.style.png_compress_level}
         fig.savefig(filepath, dpi=self.style.dpi, bbox_inches='tight',
-                    facecolor='white', edgecolor='none')
+                    facecolor='white', edgecolor='none', **save_kwargs)
 
         return filepath
 
+    def save_figure_regions(
+        self,
+        fig: plt.Figure,
+        regions: Dict[str, plt.Artist],
+        subdirectory: Optional[str] = None,
+        background: bool = False
+    ) -> Dict[str, Optional[Path]]:
+        """
+        Save several regions of one figure (e.g. its subfigures) as separate files.
+
+        For PNG output the figure is drawn once and each region is cropped
+        from the same pixel buffer.
+
+        Args:
+            fig: Matplotlib figure
+            regions: Mapping of base filename to the artist (usually a
+                     SubFigure) whose bounding box is saved
+            subdirectory: Optional subdirectory within output_dir
+            background: Encode the PNG files on a background thread
+
+        Returns:
+            Mapping of filename to saved path (None if no output_dir set)
+        """
+        if self.output_dir is None:
+            return {name: None for name in regions}
+
+        save_dir = self.output_dir / subdirectory if subdirectory else self.output_dir
+        save_dir.mkdir(parents=True, exist_ok=True)
+
+        fig.set_dpi(self.style.dpi)
+        fig.set_facecolor('white')
+        fig.set_edgecolor('none')
+
+        paths = {}
+        if self.style.format == 'png':
+            fig.canvas.draw()
+            pixels = np.asarray(fig.canvas.buffer_rgba())
+            height = pixels.shape[0]
+            for name, region in regions.items():
+                bbox = region.bbox  # display pixels
+                crop = pixels[max(0, height - math.ceil(bbox.y1)):
+                              height - math.floor(bbox.y0),
+                              max(0, math.floor(bbox.x0)):math.ceil(bbox.x1)]
+                paths[name] = save_dir / f"{name}.png"
+                self._write_png(crop.copy(), paths[name], background)
+        else:
+            # Vector formats: one savefig per region, clipped to its bbox
+            to_inches = fig.dpi_scale_trans.inverted()
+            for name, region in regions.items():
+                paths[name] = save_dir / f"{name}.{self.style.format}"
+                fig.savefig(paths[name], dpi=self.style.dpi,
+                            bbox_inches=region.bbox.transformed(to_inches),
+                            facecolor='white', edgecolor='none')
+
+        return paths
+
+    def _write_png(self, pixels: np.ndarray, filepath: Path, background: bool) -> None:
+        """Encode RGBA pixels to a PNG file, optionally on the encoder pool."""
+        if not background:
+            _encode_png(pixels, filepath, self.style.dpi, self.style.png_compress_level)
+            return
+
+        global _png_encoder
+        if _png_encoder is None:
+            _png_encoder = ThreadPoolExecutor(max_workers=4)
+        _pending_saves.append(
+            _png_encoder.submit(_encode_png, pixels, filepath, self.style.dpi,
+                                self.style.png_compress_level))
+
+    def _render_tight_rgba(self, fig: plt.Figure) -> np.ndarray:
+        """
+        Render a figure and crop it to its tight bounding box.
+
+        Matches savefig(bbox_inches='tight') for content inside the figure.
+
+        Returns:
+            (H, W, 4) uint8 RGBA array (a copy, safe to use after closing fig)
+        """
+        fig.set_dpi(self.style.dpi)
+        fig.set_facecolor('white')
+        fig.set_edgecolor('none')
+        fig.canvas.draw()
+        renderer = fig.canvas.get_renderer()
+        pixels = np.asarray(fig.canvas.buffer_rgba())
+
+        # Tight bbox in inches, padded like savefig, clipped to the canvas
+        pad = plt.rcParams['savefig.pad_inches']
+        bbox = fig.get_tightbbox(renderer).padded(pad)
+        dpi = fig.dpi
+        height, width = pixels.shape[:2]
+        x0 = max(0, math.floor(bbox.x0 * dpi))
+        x1 = min(width, math.ceil(bbox.x1 * dpi))
+        y0 = max(0, height - math.ceil(bbox.y1 * dpi))
+        y1 = min(height, height - math.floor(bbox.y0 * dpi))
+        return pixels[y0:y1, x0:x1].copy()
+
     def create_figure(
         self,
         size_type: str = 'single',
@@ -102,6 +268,55 @@ class BasePlotter(ABC):
 
         return fig, axes
 
+    def _simplified_path(self) -> np.ndarray:
+        """
+        Get the flight path simplified for drawing.
+
+        Uses Douglas-Peucker with a tolerance well below one pixel at the
+        default figure size, then caps the result at max_path_points.
+
+        Returns:
+            (M, 3) array of [E, N, altitude] points
+        """
+        xyz = np.column_stack([self.data.E, self.data.N, self.data.altitude])
+        extent = np.linalg.norm(xyz.max(axis=0) - xyz.min(axis=0))
+        simplified = rdp_simplify(xyz, extent * 2e-4)
+        return decimate_trail(simplified, self.max_path_points)
+
+    def _flight_mode(self) -> Tuple[int, float]:
+        """
+        Classify the flight by mean propeller tilt.
+
+        Returns:
+            (index into FLIGHT_MODES, mean tilt of both propellers in degrees)
+        """
+        tilt_l, tilt_r = self.data.theta_Cl, self.data.theta_Cr
+        mean_tilt = float(tilt_l.sum() + tilt_r.sum()) / (2 * len(tilt_l))
+        low, high = FLIGHT_MODE_TILT_DEG
+        return int(mean_tilt >= low) + int(mean_tilt > high), mean_tilt
+
+    def plot_series(self, ax: plt.Axes, x: np.ndarray, y: np.ndarray, **kwargs) -> list:
+        """
+        ax.plot for a long time series, min/max-decimated to the axes width.
+
+        Series with more than two samples per pixel column are reduced to each
+        column's extremes, which rasterizes the same but draws far fewer
+        segments.
+
+        Args:
+            ax: Axes to plot on
+            x: (N,) sample times
+            y: (N,) sample values
+            **kwargs: Passed to ax.plot
+
+        Returns:
+            List of Line2D artists, as returned by ax.plot
+        """
+        idx = minmax_indices(y, ax.bbox.width)
+        if len(idx) < len(y):
+            x, y = x[idx], y[idx]
+        return ax.plot(x, y, **kwargs)
+
     def add_grid(self, ax: plt.Axes) -> None:
         """Add grid to axes with standard styling."""
         ax.grid(
@@ -45,10 +45,10 @@ class ControlsPlotter(BasePlotter):
         colors = self.style.colors.get('controls', {})
 
         # Aileron
-        axes[0].plot(time, self.data.delta_a_deg,
-                     color=colors.get('delta_a', '#2ca02c'),
-                     linewidth=self.style.line_width_main,
-                     label='Aileron (δa)')
+        self.plot_series(axes[0], time, self.data.delta_a_deg,
+                         color=colors.get('delta_a', '#2ca02c'),
+                         linewidth=self.style.line_width_main,
+                         label='Aileron (δa)')
         axes[0].axhline(y=0, color='gray', linestyle='--', alpha=0.5)
         axes[0].set_ylabel('Aileron (deg)')
         axes[0].set_ylim(-35, 35)
@@ -56,10 +56,10 @@ class ControlsPlotter(BasePlotter):
         self.add_legend(axes[0])
 
         # Elevator
-        axes[1].plot(time, self.data.delta_e_deg,
-                     color=colors.get('delta_e', '#17becf'),
-                     linewidth=self.style.line_width_main,
-                     label='Elevator (δe)')
+        self.plot_series(axes[1], time, self.data.delta_e_deg,
+                         color=colors.get('delta_e', '#17becf'),
+                         linewidth=self.style.line_width_main,
+                         label='Elevator (δe)')
         axes[1].axhline(y=0, color='gray', linestyle='--', alpha=0.5)
         axes[1].set_ylabel('Elevator (deg)')
         self.add_grid(axes[1])
@@ -75,10 +75,10 @@ class ControlsPlotter(BasePlotter):
                              bbox=dict(boxstyle='round', facecolor='yellow', alpha=0.7))
 
         # Rudder
-        axes[2].plot(time, self.data.delta_r_deg,
-                     color=colors.get('delta_r', '#bcbd22'),
-                     linewidth=self.style.line_width_main,
-                     label='Rudder (δr)')
+        self.plot_series(axes[2], time, self.data.delta_r_deg,
+                         color=colors.get('delta_r', '#bcbd22'),
+                         linewidth=self.style.line_width_main,
+                         label='Rudder (δr)')
         axes[2].axhline(y=0, color='gray', linestyle='--', alpha=0.5)
         axes[2].set_ylabel('Rudder (deg)')
         axes[2].set_xlabel('Time (s)')
@@ -98,29 +98,29 @@ class ControlsPlotter(BasePlotter):
         colors = self.style.colors.get('propulsion', {})
 
         # RPM
-        axes[0].plot(time, self.data.RPM_Cl,
-                     color=colors.get('RPM', '#9467bd'),
-                     linewidth=self.style.line_width_main,
-                     label='Left Cruise RPM')
-        axes[0].plot(time, self.data.RPM_Cr,
-                     color='#e377c2',
-                     linewidth=self.style.line_width_main,
-                     linestyle='--',
-                     label='Right Cruise RPM')
+        self.plot_series(axes[0], time, self.data.RPM_Cl,
+                         color=colors.get('RPM', '#9467bd'),
+                         linewidth=self.style.line_width_main,
+                         label='Left Cruise RPM')
+        self.plot_series(axes[0], time, self.data.RPM_Cr,
+                         color='#e377c2',
+                         linewidth=self.style.line_width_main,
+                         linestyle='--',
+                         label='Right Cruise RPM')
         axes[0].set_ylabel('RPM')
         self.add_grid(axes[0])
         self.add_legend(axes[0])
 
         # Tilt angles
-        axes[1].plot(time, self.data.theta_Cl,
-                     color=colors.get('tilt', '#e377c2'),
-                     linewidth=self.style.line_width_main,
-                     label='Left Tilt')
-        axes[1].plot(time, self.data.theta_Cr,
-                     color='#9467bd',
-                     linewidth=self.style.line_width_main,
-                     linestyle='--',
-                     label='Right Tilt')
+        self.plot_series(axes[1], time, self.data.theta_Cl,
+                         color=colors.get('tilt', '#e377c2'),
+                         linewidth=self.style.line_width_main,
+                         label='Left Tilt')
+        self.plot_series(axes[1], time, self.data.theta_Cr,
+                         color='#9467bd',
+                         linewidth=self.style.line_width_main,
+                         linestyle='--',
+                         label='Right Tilt')
         axes[1].set_ylabel('Tilt Angle (deg)')
         axes[1].set_xlabel('Time (s)')
         axes[1].set_ylim(-5, 95)
@@ -128,13 +128,10 @@ class ControlsPlotter(BasePlotter):
         self.add_legend(axes[1])
 
         # Add labels for flight mode
-        mean_tilt = (self.data.theta_Cl.mean() + self.data.theta_Cr.mean()) / 2
-        if mean_tilt < 10:
-            mode = "CRUISE MODE (Tilt = 0°)"
-        elif mean_tilt > 80:
-            mode = "HOVER MODE (Tilt = 90°)"
-        else:
-            mode = f"TRANSITION MODE (Tilt ≈ {mean_tilt:.0f}°)"
+        mode_idx, mean_tilt = self._flight_mode()
+        mode = ("CRUISE MODE (Tilt = 0°)",
+                f"TRANSITION MODE (Tilt ≈ {mean_tilt:.0f}°)",
+                "HOVER MODE (Tilt = 90°)")[mode_idx]
 
         axes[1].annotate(mode,
                          xy=(0.02, 0.95), xycoords='axes fraction',
@@ -150,18 +147,18 @@ class ControlsPlotter(BasePlotter):
         time = self.data.time
         colors = self.style.colors.get('controls', {})
 
-        ax.plot(time, self.data.delta_a_deg,
-                color=colors.get('delta_a', '#2ca02c'),
-                linewidth=self.style.line_width_main,
-                label='Aileron (δa)')
-        ax.plot(time, self.data.delta_e_deg,
-                color=colors.get('delta_e', '#17becf'),
-                linewidth=self.style.line_width_main,
-                label='Elevator (δe)')
-        ax.plot(time, self.data.delta_r_deg,
-                color=colors.get('delta_r', '#bcbd22'),
-                linewidth=self.style.line_width_main,
-                label='Rudder (δr)')
+        self.plot_series(ax, time, self.data.delta_a_deg,
+                         color=colors.get('delta_a', '#2ca02c'),
+                         linewidth=self.style.line_width_main,
+                         label='Aileron (δa)')
+        self.plot_series(ax, time, self.data.delta_e_deg,
+                         color=colors.get('delta_e', '#17becf'),
+                         linewidth=self.style.line_width_main,
+                         label='Elevator (δe)')
+        self.plot_series(ax, time, self.data.delta_r_deg,
+                         color=colors.get('delta_r', '#bcbd22'),
+                         linewidth=self.style.line_width_main,
+                         label='Rudder (δr)')
 
         ax.axhline(y=0, color='gray', linestyle='--', alpha=0.5)
         ax.set_ylabel('Deflection (deg)')
@@ -174,15 +171,15 @@ class ControlsPlotter(BasePlotter):
         time = self.data.time
         colors = self.style.colors.get('propulsion', {})
 
-        ax.plot(time, self.data.RPM_Cl,
-                color=colors.get('RPM', '#9467bd'),
-                linewidth=self.style.line_width_main,
-                label='Left Cruise')
-        ax.plot(time, self.data.RPM_Cr,
-                color='#e377c2',
-                linewidth=self.style.line_width_main,
-                linestyle='--',
-                label='Right Cruise')
+        self.plot_series(ax, time, self.data.RPM_Cl,
+                         color=colors.get('RPM', '#9467bd'),
+                         linewidth=self.style.line_width_main,
+                         label='Left Cruise')
+        self.plot_series(ax, time, self.data.RPM_Cr,
+                         color='#e377c2',
+                         linewidth=self.style.line_width_main,
+                         linestyle='--',
+                         label='Right Cruise')
 
         ax.set_ylabel('RPM')
         ax.set_title('Cruise Propeller RPM', fontsize=self.style.title_size)
@@ -194,15 +191,15 @@ class ControlsPlotter(BasePlotter):
         time = self.data.time
         colors = self.style.colors.get('propulsion', {})
 
-        ax.plot(time, self.data.theta_Cl,
-                color=colors.get('tilt', '#e377c2'),
-                linewidth=self.style.line_width_main,
-                label='Left Tilt')
-        ax.plot(time, self.data.theta_Cr,
-                color='#9467bd',
-                linewidth=self.style.line_width_main,
-                linestyle='--',
-                label='Right Tilt')
+        self.plot_series(ax, time, self.data.theta_Cl,
+                         color=colors.get('tilt', '#e377c2'),
+                         linewidth=self.style.line_width_main,
+                         label='Left Tilt')
+        self.plot_series(ax, time, self.data.theta_Cr,
+                         color='#9467bd',
+                         linewidth=self.style.line_width_main,
+                         linestyle='--',
+                         label='Right Tilt')
 
         ax.axhline(y=0, color='green', linestyle=':', alpha=0.7, label='Cruise (0°)')
         ax.axhline(y=90, color='red', linestyle=':', alpha=0.7, label='Hover (90°)')
@@ -3,13 +3,26 @@ Dashboard plotter for summary visualization.
 """
 
 import matplotlib.pyplot as plt
-from mpl_toolkits.mplot3d import Axes3D
 import numpy as np
 from typing import Optional
 
-from .base import BasePlotter
+from .base import BasePlotter, FLIGHT_MODES
 from ..flight_data import FlightData
 from ..styles.themes import PlotStyle
+from ..utils.conversions import UnitConverter
+from ..utils.kernels import minmax_indices
+
+
+# Annotation colour for each of FLIGHT_MODES
+MODE_COLORS = ('lightgreen', 'navajowhite', 'lightyellow')
+
+# FlightData attribute drawn by each time-series line, per dashboard panel
+DASHBOARD_SERIES = {
+    'attitude': ('phi_deg', 'theta_deg', 'psi_deg'),
+    'velocity_altitude': ('V_ground', 'altitude'),
+    'controls': ('delta_a_deg', 'delta_e_deg', 'delta_r_deg'),
+    'propulsion': ('RPM_Cl', 'RPM_Cr', 'theta_Cl', 'theta_Cr'),
+}
 
 
 class DashboardPlotter(BasePlotter):
@@ -21,6 +34,10 @@ class DashboardPlotter(BasePlotter):
 
     def plot_dashboard(self) -> plt.Figure:
         """Create comprehensive dashboard with all key flight data."""
+        # Handles of the data-dependent artists, per panel, for update_dashboard
+        self._artists = {}
+        self._figure = None
+
         fig = plt.figure(figsize=self.style.get_figure_size('dashboard'))
         fig.suptitle('Flight Simulation Dashboard',
                      fontsize=self.style.title_size + 4, fontweight='bold', y=0.98)
@@ -59,23 +76,85 @@ class DashboardPlotter(BasePlotter):
         ax7 = fig.add_subplot(gs[2, 2:])
         self._plot_propulsion(ax7)
 
+        self._figure = fig
         return fig
 
+    def update_dashboard(self, data: Optional[FlightData] = None) -> None:
+        """
+        Refresh the last dashboard in place for new flight data.
+
+        Moves the data of the artists stored by plot_dashboard instead of
+        rebuilding the figure, so no artists are created and the layout is
+        not recomputed. Intended for interactive loops such as scrubbing
+        through a log; the redraw is requested with draw_idle.
+
+        Args:
+            data: Flight data to show (default: the current data, e.g. after
+                its arrays were reassigned)
+        """
+        if getattr(self, '_figure', None) is None:
+            raise RuntimeError("update_dashboard requires plot_dashboard to be called first")
+        if data is not None:
+            self.data = data
+
+        time = self.data.time
+        for panel, attrs in DASHBOARD_SERIES.items():
+            for line, attr in zip(self._artists[panel], attrs):
+                y = getattr(self.data, attr)
+                idx = minmax_indices(y, line.axes.bbox.width)
+                line.set_data(time[idx], y[idx])
+        for panel in DASHBOARD_SERIES:
+            for ax in {line.axes for line in self._artists[panel]}:
+                ax.relim()
+                ax.autoscale_view()
+
+        # Trajectory panels
+        E, N, alt = self.data.E, self.data.N, self.data.altitude
+        path = self._simplified_path()
+        path_line, shadow, start, end = self._artists['trajectory_3d']
+        path_line.set_data_3d(path[:, 0], path[:, 1], path[:, 2])
+        shadow.set_data_3d(path[:, 0], path[:, 1], np.zeros(len(path)))
+        start.set_offsets([[E[0], N[0]]])
+        start.set_3d_properties([alt[0]], 'z')
+        end.set_offsets([[E[-1], N[-1]]])
+        end.set_3d_properties([alt[-1]], 'z')
+        # Limits cover the path and its shadow on the ground, as when drawn
+        path_line.axes.auto_scale_xyz(path[:, 0], path[:, 1], np.append(path[:, 2], 0.0),
+                                      had_data=False)
+
+        track, start, end = self._artists['ground_track']
+        track.set_data(E, N)
+        start.set_offsets([[E[0], N[0]]])
+        end.set_offsets([[E[-1], N[-1]]])
+        track.axes.relim()
+        track.axes.autoscale_view()
+
+        # Text panels
+        self._artists['stats'][0].set_text(self._stats_text())
+        mode_idx, _ = self._flight_mode()
+        label, = self._artists['mode']
+        label.set_text(f'Mode: {FLIGHT_MODES[mode_idx]}')
+        label.get_bbox_patch().set_facecolor(MODE_COLORS[mode_idx])
+
+        self._figure.canvas.draw_idle()
+
     def _plot_3d_trajectory(self, ax: plt.Axes) -> None:
         """Plot 3D trajectory on given axes."""
         colors = self.style.colors.get('trajectory', {})
 
-        ax.plot(self.data.E, self.data.N, self.data.altitude,
-                color=colors.get('path', '#1f77b4'),
-                linewidth=1.5)
-        ax.scatter(self.data.E[0], self.data.N[0], self.data.altitude[0],
-                   c=colors.get('start', '#2ca02c'), s=60, marker='o')
-        ax.scatter(self.data.E[-1], self.data.N[-1], self.data.altitude[-1],
-                   c=colors.get('end', '#d62728'), s=60, marker='s')
+        path = self._simplified_path()
+        path_line, = ax.plot(path[:, 0], path[:, 1], path[:, 2],
+                             color=colors.get('path', '#1f77b4'),
+                             linewidth=1.5)
+        start = ax.scatter(self.data.E[0], self.data.N[0], self.data.altitude[0],
+                           c=colors.get('start', '#2ca02c'), s=60, marker='o')
+        end = ax.scatter(self.data.E[-1], self.data.N[-1], self.data.altitude[-1],
+                         c=colors.get('end', '#d62728'), s=60, marker='s')
 
-        # Ground shadow
-        ax.plot(self.data.E, self.data.N, np.zeros_like(self.data.N),
-                color='gray', linewidth=0.3, alpha=0.3)
+        # Ground shadow (zeros only for the simplified path's points)
+        shadow, = ax.plot(path[:, 0], path[:, 1], np.zeros(len(path)),
+                          color='gray', linewidth=0.3, alpha=0.3)
+        self._artists['trajectory_3d'] = (path_line, shadow, start, end)
 
         ax.set_xlabel('E (m)', fontsize=8)
         ax.set_ylabel('N (m)', fontsize=8)
@@ -88,13 +167,14 @@ class DashboardPlotter(BasePlotter):
         """Plot ground track on given axes."""
         colors = self.style.colors.get('trajectory', {})
 
-        ax.plot(self.data.E, self.data.N,
-                color=colors.get('path', '#1f77b4'),
-                linewidth=1.5)
-        ax.scatter(self.data.E[0], self.data.N[0],
-                   c=colors.get('start', '#2ca02c'), s=50, marker='o', label='Start')
-        ax.scatter(self.data.E[-1], self.data.N[-1],
-                   c=colors.get('end', '#d62728'), s=50, marker='s', label='End')
+        track, = ax.plot(self.data.E, self.data.N,
+                         color=colors.get('path', '#1f77b4'),
+                         linewidth=1.5)
+        start = ax.scatter(self.data.E[0], self.data.N[0],
+                           c=colors.get('start', '#2ca02c'), s=50, marker='o', label='Start')
+        end = ax.scatter(self.data.E[-1], self.data.N[-1],
+                         c=colors.get('end', '#d62728'), s=50, marker='s', label='End')
+        self._artists['ground_track'] = (track, start, end)
 
         ax.set_xlabel('East (m)', fontsize=9)
         ax.set_ylabel('North (m)', fontsize=9)
@@ -108,57 +188,58 @@ class DashboardPlotter(BasePlotter):
         ax.axis('off')
         ax.set_title('Flight Statistics', fontsize=self.style.title_size)
 
-        # Calculate stats
-        summary = self.data.get_summary()
-        distance = np.sqrt((self.data.N[-1] - self.data.N[0])**2 +
-                           (self.data.E[-1] - self.data.E[0])**2)
-        path_length = np.sum(np.sqrt(np.diff(self.data.N)**2 +
-                                      np.diff(self.data.E)**2 +
-                                      np.diff(self.data.altitude)**2))
-
-        stats_text = f"""
-Duration: {self.data.duration:.1f} s
-Sample Rate: {self.data.sample_rate:.0f} Hz
-Samples: {self.data.n_samples}
-
-Distance: {distance/1000:.2f} km
-Path Length: {path_length/1000:.2f} km
-
-Altitude:
-  Min: {self.data.altitude.min():.1f} m
-  Max: {self.data.altitude.max():.1f} m
-
-Speed (Ground):
-  Min: {self.data.V_ground.min():.1f} m/s
-  Max: {self.data.V_ground.max():.1f} m/s
-  Mean: {self.data.V_ground.mean():.1f} m/s
-        ({self.data.V_ground.mean()*1.944:.1f} kts)
-
-Climb Rate:
-  Max: {self.data.climb_rate.max():.2f} m/s
-  Min: {self.data.climb_rate.min():.2f} m/s
-"""
-
-        ax.text(0.05, 0.95, stats_text.strip(),
-                transform=ax.transAxes,
-                fontsize=8, fontfamily='monospace',
-                verticalalignment='top',
-                bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8))
+        text = ax.text(0.05, 0.95, self._stats_text(),
+                       transform=ax.transAxes,
+                       fontsize=8, fontfamily='monospace',
+                       verticalalignment='top',
+                       bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8))
+        self._artists['stats'] = (text,)
+
+    def _stats_text(self) -> str:
+        """Text of the flight statistics panel."""
+        # Stats are cached on the flight data, so re-renders skip the reductions
+        stats = self.data.flight_stats
+
+        speed_mean = stats['speed_mean_ms']
+        rows = [
+            f"Duration: {self.data.duration:.1f} s",
+            f"Sample Rate: {self.data.sample_rate:.0f} Hz",
+            f"Samples: {self.data.n_samples}",
+            "",
+            f"Distance: {stats['distance_m']/1000:.2f} km",
+            f"Path Length: {stats['path_length_m']/1000:.2f} km",
+            "",
+            "Altitude:",
+            f"  Min: {stats['altitude_min_m']:.1f} m",
+            f"  Max: {stats['altitude_max_m']:.1f} m",
+            "",
+            "Speed (Ground):",
+            f"  Min: {stats['speed_min_ms']:.1f} m/s",
+            f"  Max: {stats['speed_max_ms']:.1f} m/s",
+            f"  Mean: {speed_mean:.1f} m/s",
+            f"        ({speed_mean * UnitConverter.MS_TO_KNOTS:.1f} kts)",
+            "",
+            "Climb Rate:",
+            f"  Max: {stats['climb_rate_max_ms']:.2f} m/s",
+            f"  Min: {stats['climb_rate_min_ms']:.2f} m/s",
+        ]
+        return '\n'.join(rows)
 
     def _plot_attitude(self, ax: plt.Axes) -> None:
         """Plot attitude on given axes."""
         time = self.data.time
         colors = self.style.colors.get('attitude', {})
 
-        ax.plot(time, self.data.phi_deg,
-                color=colors.get('phi', '#d62728'),
-                linewidth=1.0, label='Roll (φ)')
-        ax.plot(time, self.data.theta_deg,
-                color=colors.get('theta', '#ff7f0e'),
-                linewidth=1.0, label='Pitch (θ)')
-        ax.plot(time, self.data.psi_deg,
-                color=colors.get('psi', '#9467bd'),
-                linewidth=1.0, label='Yaw (ψ)')
+        l_phi, = self.plot_series(ax, time, self.data.phi_deg,
+                                  color=colors.get('phi', '#d62728'),
+                                  linewidth=1.0, label='Roll (φ)')
+        l_theta, = self.plot_series(ax, time, self.data.theta_deg,
+                                    color=colors.get('theta', '#ff7f0e'),
+                                    linewidth=1.0, label='Pitch (θ)')
+        l_psi, = self.plot_series(ax, time, self.data.psi_deg,
+                                  color=colors.get('psi', '#9467bd'),
+                                  linewidth=1.0, label='Yaw (ψ)')
+        self._artists['attitude'] = (l_phi, l_theta, l_psi)
 
         ax.axhline(y=0, color='gray', linestyle='--', alpha=0.5)
         ax.set_xlabel('Time (s)', fontsize=9)
@@ -174,9 +255,9 @@ Climb Rate:
         pos_colors = self.style.colors.get('position', {})
 
         # Ground speed
-        line1, = ax.plot(time, self.data.V_ground,
-                         color=vel_colors.get('V_ground', '#17becf'),
-                         linewidth=1.0, label='Ground Speed (m/s)')
+        line1, = self.plot_series(ax, time, self.data.V_ground,
+                                  color=vel_colors.get('V_ground', '#17becf'),
+                                  linewidth=1.0, label='Ground Speed (m/s)')
 
         ax.set_xlabel('Time (s)', fontsize=9)
         ax.set_ylabel('Speed (m/s)', fontsize=9,
@@ -185,12 +266,13 @@ Climb Rate:
 
         # Altitude on secondary axis
         ax2 = ax.twinx()
-        line2, = ax2.plot(time, self.data.altitude,
-                          color=pos_colors.get('altitude', '#1f77b4'),
-                          linewidth=1.0, linestyle='--', label='Altitude (m)')
+        line2, = self.plot_series(ax2, time, self.data.altitude,
+                                  color=pos_colors.get('altitude', '#1f77b4'),
+                                  linewidth=1.0, linestyle='--', label='Altitude (m)')
         ax2.set_ylabel('Altitude (m)', fontsize=9,
                        color=pos_colors.get('altitude', '#1f77b4'))
         ax2.tick_params(axis='y', labelcolor=pos_colors.get('altitude', '#1f77b4'))
+        self._artists['velocity_altitude'] = (line1, line2)
 
         ax.set_title('Velocity & Altitude', fontsize=self.style.title_size)
         ax.legend([line1, line2], ['Ground Speed', 'Altitude'],
@@ -202,15 +284,16 @@ Climb Rate:
         time = self.data.time
         colors = self.style.colors.get('controls', {})
 
-        ax.plot(time, self.data.delta_a_deg,
-                color=colors.get('delta_a', '#2ca02c'),
-                linewidth=1.0, label='Aileron')
-        ax.plot(time, self.data.delta_e_deg,
-                color=colors.get('delta_e', '#17becf'),
-                linewidth=1.0, label='Elevator')
-        ax.plot(time, self.data.delta_r_deg,
-                color=colors.get('delta_r', '#bcbd22'),
-                linewidth=1.0, label='Rudder')
+        l_aileron, = self.plot_series(ax, time, self.data.delta_a_deg,
+                                      color=colors.get('delta_a', '#2ca02c'),
+                                      linewidth=1.0, label='Aileron')
+        l_elevator, = self.plot_series(ax, time, self.data.delta_e_deg,
+                                       color=colors.get('delta_e', '#17becf'),
+                                       linewidth=1.0, label='Elevator')
+        l_rudder, = self.plot_series(ax, time, self.data.delta_r_deg,
+                                     color=colors.get('delta_r', '#bcbd22'),
+                                     linewidth=1.0, label='Rudder')
+        self._artists['controls'] = (l_aileron, l_elevator, l_rudder)
 
         ax.axhline(y=0, color='gray', linestyle='--', alpha=0.5)
         ax.set_xlabel('Time (s)', fontsize=9)
@@ -225,12 +308,12 @@ Climb Rate:
         colors = self.style.colors.get('propulsion', {})
 
         # RPM
-        line1, = ax.plot(time, self.data.RPM_Cl,
-                         color=colors.get('RPM', '#9467bd'),
-                         linewidth=1.0, label='Cruise RPM (L/R)')
-        ax.plot(time, self.data.RPM_Cr,
-                color=colors.get('RPM', '#9467bd'),
-                linewidth=1.0, linestyle='--', alpha=0.7)
+        line1, = self.plot_series(ax, time, self.data.RPM_Cl,
+                                  color=colors.get('RPM', '#9467bd'),
+                                  linewidth=1.0, label='Cruise RPM (L/R)')
+        line1r, = self.plot_series(ax, time, self.data.RPM_Cr,
+                                   color=colors.get('RPM', '#9467bd'),
+                                   linewidth=1.0, linestyle='--', alpha=0.7)
 
         ax.set_xlabel('Time (s)', fontsize=9)
         ax.set_ylabel('RPM', fontsize=9, color=colors.get('RPM', '#9467bd'))
@@ -238,16 +321,17 @@ Climb Rate:
 
         # Tilt on secondary axis
         ax2 = ax.twinx()
-        line2, = ax2.plot(time, self.data.theta_Cl,
-                          color=colors.get('tilt', '#e377c2'),
-                          linewidth=1.0, label='Tilt Angle')
-        ax2.plot(time, self.data.theta_Cr,
-                 color=colors.get('tilt', '#e377c2'),
-                 linewidth=1.0, linestyle='--', alpha=0.7)
+        line2, = self.plot_series(ax2, time, self.data.theta_Cl,
+                                  color=colors.get('tilt', '#e377c2'),
+                                  linewidth=1.0, label='Tilt Angle')
+        line2r, = self.plot_series(ax2, time, self.data.theta_Cr,
+                                   color=colors.get('tilt', '#e377c2'),
+                                   linewidth=1.0, linestyle='--', alpha=0.7)
         ax2.set_ylabel('Tilt (deg)', fontsize=9,
                        color=colors.get('tilt', '#e377c2'))
         ax2.tick_params(axis='y', labelcolor=colors.get('tilt', '#e377c2'))
         ax2.set_ylim(-5, 95)
+        self._artists['propulsion'] = (line1, line1r, line2, line2r)
 
         ax.set_title('Propulsion System', fontsize=self.style.title_size)
         ax.legend([line1, line2], ['Cruise RPM', 'Tilt Angle'],
@@ -255,18 +339,12 @@ Climb Rate:
         self.add_grid(ax)
 
         # Add flight mode annotation
-        mean_tilt = (self.data.theta_Cl.mean() + self.data.theta_Cr.mean()) / 2
-        if mean_tilt < 10:
-            mode = "CRUISE"
-            mode_color = 'lightgreen'
-        elif mean_tilt > 80:
-            mode = "HOVER"
-            mode_color = 'lightyellow'
-        else:
-            mode = "TRANSITION"
-            mode_color = 'lightorange'
-
-        ax.annotate(f'Mode: {mode}',
-                    xy=(0.02, 0.95), xycoords='axes fraction',
-                    fontsize=9, fontweight='bold',
-                    bbox=dict(boxstyle='round', facecolor=mode_color, alpha=0.8))
+        mode_idx, _ = self._flight_mode()
+        mode = FLIGHT_MODES[mode_idx]
+        mode_color = MODE_COLORS[mode_idx]
+
+        label = ax.annotate(f'Mode: {mode}',
+                            xy=(0.02, 0.95), xycoords='axes fraction',
+                            fontsize=9, fontweight='bold',
+                            bbox=dict(boxstyle='round', facecolor=mode_color, alpha=0.8))
+        self._artists['mode'] = (label,)
@@ -4,11 +4,13 @@ Time history plotter for flight data.
 
 import matplotlib.pyplot as plt
 import numpy as np
-from typing import Optional, List, Tuple
+from typing import Optional, List, Tuple, Dict, Union
+from matplotlib.figure import Figure, SubFigure
 
 from .base import BasePlotter
 from ..flight_data import FlightData
 from ..styles.themes import PlotStyle
+from ..utils.conversions import UnitConverter
 
 
 class TimeHistoryPlotter(BasePlotter):
@@ -18,10 +20,63 @@ class TimeHistoryPlotter(BasePlotter):
         """Generate complete time history plot."""
         return self.plot_all_states()
 
+    def plot_grouped(self) -> Tuple[plt.Figure, Dict[str, SubFigure]]:
+        """
+        Draw all time history plots as subfigures of a single figure.
+
+        The figure is rendered once and each subfigure saved as its own file
+        (see BasePlotter.save_figure_regions).
+
+        Returns:
+            (figure, mapping of output name to subfigure)
+        """
+        names = ['time_history_all', 'attitude', 'position', 'velocity']
+        sizes = [self.style.get_figure_size(size_type)
+                 for size_type in ('multi_panel', 'single', 'single', 'single')]
+
+        fig = plt.figure(figsize=(max(w for w, _ in sizes), sum(h for _, h in sizes)),
+                         layout='constrained')
+        subfigs = fig.subfigures(len(names), 1, height_ratios=[h for _, h in sizes])
+
+        self._draw_all_states(subfigs[0])
+        self._draw_attitude(subfigs[1])
+        self._draw_position(subfigs[2])
+        self._draw_velocity(subfigs[3])
+
+        return fig, dict(zip(names, subfigs))
+
     def plot_all_states(self) -> plt.Figure:
         """Create comprehensive time history plot with all states."""
-        fig, axes = self.create_figure('multi_panel', nrows=4, ncols=1)
-        fig.suptitle(f'Flight Time History - {self.data.source_file.split("/")[-1]}',
+        fig = plt.figure(figsize=self.style.get_figure_size('multi_panel'))
+        self._draw_all_states(fig)
+        plt.tight_layout()
+        return fig
+
+    def plot_attitude(self) -> plt.Figure:
+        """Create attitude-only time history plot."""
+        fig = plt.figure(figsize=self.style.get_figure_size('single'))
+        self._draw_attitude(fig)
+        plt.tight_layout()
+        return fig
+
+    def plot_position(self) -> plt.Figure:
+        """Create position time history plot."""
+        fig = plt.figure(figsize=self.style.get_figure_size('single'))
+        self._draw_position(fig)
+        plt.tight_layout()
+        return fig
+
+    def plot_velocity(self) -> plt.Figure:
+        """Create velocity time history plot."""
+        fig = plt.figure(figsize=self.style.get_figure_size('single'))
+        self._draw_velocity(fig)
+        plt.tight_layout()
+        return fig
+
+    def _draw_all_states(self, fig: Union[Figure, SubFigure]) -> None:
+        """Draw the all-states panels into a figure or subfigure."""
+        axes = fig.subplots(4, 1, sharex=True)
+        fig.suptitle(f'Flight Time History - {self.data.source_name}',
                      fontsize=self.style.title_size + 2, fontweight='bold')
 
         # Plot each category
@@ -30,108 +85,94 @@ class TimeHistoryPlotter(BasePlotter):
         self._plot_velocity(axes[2])
         self._plot_altitude(axes[3])
 
-        # Only show x-label on bottom plot
-        for ax in axes[:-1]:
-            ax.set_xlabel('')
-            ax.tick_params(labelbottom=False)
-
-        plt.tight_layout()
-        return fig
-
-    def plot_attitude(self) -> plt.Figure:
-        """Create attitude-only time history plot."""
-        fig, axes = self.create_figure('single', nrows=3, ncols=1, sharex=True)
+    def _draw_attitude(self, fig: Union[Figure, SubFigure]) -> None:
+        """Draw the attitude panels into a figure or subfigure."""
+        axes = fig.subplots(3, 1, sharex=True)
         fig.suptitle('Attitude Time History', fontsize=self.style.title_size + 2)
 
         time = self.data.time
         colors = self.style.colors.get('attitude', {})
 
         # Roll
-        axes[0].plot(time, self.data.phi_deg,
-                     color=colors.get('phi', '#d62728'),
-                     linewidth=self.style.line_width_main,
-                     label='Roll (φ)')
+        self.plot_series(axes[0], time, self.data.phi_deg,
+                         color=colors.get('phi', '#d62728'),
+                         linewidth=self.style.line_width_main,
+                         label='Roll (φ)')
         axes[0].set_ylabel('Roll (deg)')
         axes[0].axhline(y=0, color='gray', linestyle='--', alpha=0.5)
         self.add_grid(axes[0])
         self.add_legend(axes[0])
 
         # Pitch
-        axes[1].plot(time, self.data.theta_deg,
-                     color=colors.get('theta', '#ff7f0e'),
-                     linewidth=self.style.line_width_main,
-                     label='Pitch (θ)')
+        self.plot_series(axes[1], time, self.data.theta_deg,
+                         color=colors.get('theta', '#ff7f0e'),
+                         linewidth=self.style.line_width_main,
+                         label='Pitch (θ)')
         axes[1].set_ylabel('Pitch (deg)')
         axes[1].axhline(y=0, color='gray', linestyle='--', alpha=0.5)
         self.add_grid(axes[1])
         self.add_legend(axes[1])
 
         # Yaw
-        axes[2].plot(time, self.data.psi_deg,
-                     color=colors.get('psi', '#9467bd'),
-                     linewidth=self.style.line_width_main,
-                     label='Yaw (ψ)')
+        self.plot_series(axes[2], time, self.data.psi_deg,
+                         color=colors.get('psi', '#9467bd'),
+                         linewidth=self.style.line_width_main,
+                         label='Yaw (ψ)')
         axes[2].set_ylabel('Yaw (deg)')
         axes[2].set_xlabel('Time (s)')
         self.add_grid(axes[2])
         self.add_legend(axes[2])
 
-        plt.tight_layout()
-        return fig
-
-    def plot_position(self) -> plt.Figure:
-        """Create position time history plot."""
-        fig, axes = self.create_figure('single', nrows=3, ncols=1, sharex=True)
+    def _draw_position(self, fig: Union[Figure, SubFigure]) -> None:
+        """Draw the position panels into a figure or subfigure."""
+        axes = fig.subplots(3, 1, sharex=True)
         fig.suptitle('Position Time History (NED Frame)', fontsize=self.style.title_size + 2)
 
         time = self.data.time
         colors = self.style.colors.get('position', {})
 
         # North
-        axes[0].plot(time, self.data.N,
-                     color=colors.get('N', '#1f77b4'),
-                     linewidth=self.style.line_width_main,
-                     label='North')
+        self.plot_series(axes[0], time, self.data.N,
+                         color=colors.get('N', '#1f77b4'),
+                         linewidth=self.style.line_width_main,
+                         label='North')
         axes[0].set_ylabel('North (m)')
         self.add_grid(axes[0])
         self.add_legend(axes[0])
 
         # East
-        axes[1].plot(time, self.data.E,
-                     color=colors.get('E', '#4a9fd4'),
-                     linewidth=self.style.line_width_main,
-                     label='East')
+        self.plot_series(axes[1], time, self.data.E,
+                         color=colors.get('E', '#4a9fd4'),
+                         linewidth=self.style.line_width_main,
+                         label='East')
         axes[1].set_ylabel('East (m)')
         self.add_grid(axes[1])
         self.add_legend(axes[1])
 
         # Down (show as negative for intuitive altitude interpretation)
-        axes[2].plot(time, self.data.D,
-                     color=colors.get('D', '#7ec8e3'),
-                     linewidth=self.style.line_width_main,
-                     label='Down')
+        self.plot_series(axes[2], time, self.data.D,
+                         color=colors.get('D', '#7ec8e3'),
+                         linewidth=self.style.line_width_main,
+                         label='Down')
         axes[2].set_ylabel('Down (m)')
         axes[2].set_xlabel('Time (s)')
         axes[2].invert_yaxis()  # Invert so "up" appears up
         self.add_grid(axes[2])
         self.add_legend(axes[2])
 
-        plt.tight_layout()
-        return fig
-
-    def plot_velocity(self) -> plt.Figure:
-        """Create velocity time history plot."""
-        fig, axes = self.create_figure('single', nrows=2, ncols=1, sharex=True)
+    def _draw_velocity(self, fig: Union[Figure, SubFigure]) -> None:
+        """Draw the velocity panels into a figure or subfigure."""
+        axes = fig.subplots(2, 1, sharex=True)
         fig.suptitle('Velocity Time History', fontsize=self.style.title_size + 2)
 
         time = self.data.time
         colors = self.style.colors.get('velocity', {})
 
         # Ground speed
-        axes[0].plot(time, self.data.V_ground,
-                     color=colors.get('V_ground', '#17becf'),
-                     linewidth=self.style.line_width_main,
-                     label=f'Ground Speed (mean: {self.data.V_ground.mean():.1f} m/s)')
+        self.plot_series(axes[0], time, self.data.V_ground,
+                         color=colors.get('V_ground', '#17becf'),
+                         linewidth=self.style.line_width_main,
+                         label=f'Ground Speed (mean: {self.data.V_ground.mean():.1f} m/s)')
         axes[0].set_ylabel('Ground Speed (m/s)')
         self.add_grid(axes[0])
         self.add_legend(axes[0])
@@ -139,46 +180,44 @@ class TimeHistoryPlotter(BasePlotter):
         # Add secondary axis for knots
         ax2 = axes[0].twinx()
         ax2.set_ylabel('Speed (knots)', color='gray')
-        ax2.set_ylim(axes[0].get_ylim()[0] * 1.944, axes[0].get_ylim()[1] * 1.944)
+        lo, hi = axes[0].get_ylim()
+        ax2.set_ylim(lo * UnitConverter.MS_TO_KNOTS, hi * UnitConverter.MS_TO_KNOTS)
         ax2.tick_params(axis='y', labelcolor='gray')
 
         # Climb rate
-        axes[1].plot(time, self.data.climb_rate,
-                     color=colors.get('climb_rate', '#2ca02c'),
-                     linewidth=self.style.line_width_main,
-                     label='Climb Rate')
+        self.plot_series(axes[1], time, self.data.climb_rate,
+                         color=colors.get('climb_rate', '#2ca02c'),
+                         linewidth=self.style.line_width_main,
+                         label='Climb Rate')
         axes[1].axhline(y=0, color='gray', linestyle='--', alpha=0.5)
         axes[1].set_ylabel('Climb Rate (m/s)')
         axes[1].set_xlabel('Time (s)')
-        axes[1].fill_between(time, 0, self.data.climb_rate,
-                             where=self.data.climb_rate > 0,
+        # Clipped copies fill each side of zero without where= masks
+        climb_rate = self.data.climb_rate
+        axes[1].fill_between(time, 0, np.maximum(climb_rate, 0),
                              alpha=0.3, color='green', label='Climbing')
-        axes[1].fill_between(time, 0, self.data.climb_rate,
-                             where=self.data.climb_rate < 0,
+        axes[1].fill_between(time, 0, np.minimum(climb_rate, 0),
                              alpha=0.3, color='red', label='Descending')
         self.add_grid(axes[1])
         self.add_legend(axes[1])
 
-        plt.tight_layout()
-        return fig
-
     def _plot_attitude(self, ax: plt.Axes) -> None:
         """Plot attitude on a single axes."""
         time = self.data.time
         colors = self.style.colors.get('attitude', {})
 
-        ax.plot(time, self.data.phi_deg,
-                color=colors.get('phi', '#d62728'),
-                linewidth=self.style.line_width_main,
-                label='Roll (φ)')
-        ax.plot(time, self.data.theta_deg,
-                color=colors.get('theta', '#ff7f0e'),
-                linewidth=self.style.line_width_main,
-                label='Pitch (θ)')
-        ax.plot(time, self.data.psi_deg,
-                color=colors.get('psi', '#9467bd'),
-                linewidth=self.style.line_width_main,
-                label='Yaw (ψ)')
+        self.plot_series(ax, time, self.data.phi_deg,
+                         color=colors.get('phi', '#d62728'),
+                         linewidth=self.style.line_width_main,
+                         label='Roll (φ)')
+        self.plot_series(ax, time, self.data.theta_deg,
+                         color=colors.get('theta', '#ff7f0e'),
+                         linewidth=self.style.line_width_main,
+                         label='Pitch (θ)')
+        self.plot_series(ax, time, self.data.psi_deg,
+                         color=colors.get('psi', '#9467bd'),
+                         linewidth=self.style.line_width_main,
+                         label='Yaw (ψ)')
 
         ax.set_ylabel('Attitude (deg)')
         ax.axhline(y=0, color='gray', linestyle='--', alpha=0.5)
@@ -191,14 +230,14 @@ class TimeHistoryPlotter(BasePlotter):
         time = self.data.time
         colors = self.style.colors.get('position', {})
 
-        ax.plot(time, self.data.N / 1000,
-                color=colors.get('N', '#1f77b4'),
-                linewidth=self.style.line_width_main,
-                label='North')
-        ax.plot(time, self.data.E,
-                color=colors.get('E', '#4a9fd4'),
-                linewidth=self.style.line_width_main,
-                label='East')
+        self.plot_series(ax, time, self.data.N / 1000,
+                         color=colors.get('N', '#1f77b4'),
+                         linewidth=self.style.line_width_main,
+                         label='North')
+        self.plot_series(ax, time, self.data.E,
+                         color=colors.get('E', '#4a9fd4'),
+                         linewidth=self.style.line_width_main,
+                         label='East')
 
         ax.set_ylabel('Position (km N, m E)')
         self.add_grid(ax)
@@ -210,14 +249,14 @@ class TimeHistoryPlotter(BasePlotter):
         time = self.data.time
         colors = self.style.colors.get('velocity', {})
 
-        ax.plot(time, self.data.V_ground,
-                color=colors.get('V_ground', '#17becf'),
-                linewidth=self.style.line_width_main,
-                label=f'Ground Speed')
-        ax.plot(time, self.data.climb_rate,
-                color=colors.get('climb_rate', '#2ca02c'),
-                linewidth=self.style.line_width_main,
-                label='Climb Rate')
+        self.plot_series(ax, time, self.data.V_ground,
+                         color=colors.get('V_ground', '#17becf'),
+                         linewidth=self.style.line_width_main,
+                         label=f'Ground Speed')
+        self.plot_series(ax, time, self.data.climb_rate,
+                         color=colors.get('climb_rate', '#2ca02c'),
+                         linewidth=self.style.line_width_main,
+                         label='Climb Rate')
 
         ax.set_ylabel('Velocity (m/s)')
         ax.axhline(y=0, color='gray', linestyle='--', alpha=0.5)
@@ -230,10 +269,10 @@ class TimeHistoryPlotter(BasePlotter):
         time = self.data.time
         colors = self.style.colors.get('position', {})
 
-        ax.plot(time, self.data.altitude,
-                color=colors.get('altitude', '#1f77b4'),
-                linewidth=self.style.line_width_main,
-                label='Altitude')
+        self.plot_series(ax, time, self.data.altitude,
+                         color=colors.get('altitude', '#1f77b4'),
+                         linewidth=self.style.line_width_main,
+                         label='Altitude')
         ax.fill_between(time, 0, self.data.altitude, alpha=0.2,
                         color=colors.get('altitude', '#1f77b4'))
 
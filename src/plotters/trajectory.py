@@ -2,6 +2,7 @@
 Trajectory plotter for 2D and 3D flight path visualization.
 """
 
+import math
 import matplotlib.pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D
 import numpy as np
@@ -35,30 +36,38 @@ class TrajectoryPlotter(BasePlotter):
         fig.suptitle('Ground Track (Top View)', fontsize=self.style.title_size + 2)
 
         colors = self.style.colors.get('trajectory', {})
-
-        # Plot path
-        path = ax.plot(self.data.E, self.data.N,
-                       color=colors.get('path', '#1f77b4'),
-                       linewidth=self.style.line_width_main,
-                       label='Flight Path')
+        path_color = colors.get('path', '#1f77b4')
+        E, N = self.data.E, self.data.N
+        n = E.shape[0]
+
+        # Plot path (simplified; its top-view deviation is bounded like the 3D one)
+        path = self._simplified_path()
+        ax.plot(path[:, 0], path[:, 1],
+                color=path_color,
+                linewidth=self.style.line_width_main,
+                label='Flight Path')
 
         # Mark start and end
-        ax.scatter(self.data.E[0], self.data.N[0],
+        ax.scatter(E[0], N[0],
                    c=colors.get('start', '#2ca02c'),
                    s=100, marker='o', zorder=5, label='Start')
-        ax.scatter(self.data.E[-1], self.data.N[-1],
+        ax.scatter(E[-1], N[-1],
                    c=colors.get('end', '#d62728'),
                    s=100, marker='s', zorder=5, label='End')
 
-        # Add direction arrows at intervals
-        arrow_interval = len(self.data.N) // 10
-        for i in range(arrow_interval, len(self.data.N) - arrow_interval, arrow_interval):
-            dx = self.data.E[i + 10] - self.data.E[i]
-            dy = self.data.N[i + 10] - self.data.N[i]
-            ax.annotate('', xy=(self.data.E[i + 10], self.data.N[i + 10]),
-                        xytext=(self.data.E[i], self.data.N[i]),
-                        arrowprops=dict(arrowstyle='->', color=colors.get('path', '#1f77b4'),
-                                        lw=1.5))
+        # Add direction arrows at intervals: each points along the next 10
+        # samples with its head at the later one; unit vectors give every
+        # arrow the same on-screen length
+        arrow_interval = max(n // 10, 1)
+        idx = np.arange(arrow_interval, n - arrow_interval, arrow_interval)
+        tip = np.minimum(idx + 10, n - 1)
+        dE, dN = E[tip] - E[idx], N[tip] - N[idx]
+        norm = np.hypot(dE, dN)
+        norm[norm == 0] = 1.0
+        ax.quiver(E[tip], N[tip], dE / norm, dN / norm,
+                  angles='xy', scale_units='inches', scale=7, pivot='tip',
+                  color=path_color, width=0.004, headwidth=5, headlength=6,
+                  headaxislength=5, zorder=4)
 
         ax.set_xlabel('East (m)')
         ax.set_ylabel('North (m)')
@@ -67,8 +76,7 @@ class TrajectoryPlotter(BasePlotter):
         self.add_legend(ax)
 
         # Add distance annotation
-        distance = np.sqrt((self.data.N[-1] - self.data.N[0])**2 +
-                           (self.data.E[-1] - self.data.E[0])**2)
+        distance = math.hypot(N[-1] - N[0], E[-1] - E[0])
         ax.annotate(f'Distance: {distance/1000:.2f} km',
                     xy=(0.02, 0.98), xycoords='axes fraction',
                     fontsize=self.style.label_size,
@@ -85,33 +93,35 @@ class TrajectoryPlotter(BasePlotter):
         fig.suptitle('3D Flight Trajectory', fontsize=self.style.title_size + 2)
 
         colors = self.style.colors.get('trajectory', {})
+        E, N, alt = self.data.E, self.data.N, self.data.altitude
+        n = E.shape[0]
 
-        # Plot 3D path (using altitude = -D)
-        ax.plot(self.data.E, self.data.N, self.data.altitude,
-                color=colors.get('path', '#1f77b4'),
-                linewidth=self.style.line_width_main,
-                label='Flight Path')
+        # Plot 3D path (using altitude = -D), simplified and rasterized
+        path = self._simplified_path()
+        path_line, = ax.plot(path[:, 0], path[:, 1], path[:, 2],
+                             color=colors.get('path', '#1f77b4'),
+                             linewidth=self.style.line_width_main,
+                             label='Flight Path')
+        path_line.set_rasterized(True)
 
         # Mark start and end
-        ax.scatter(self.data.E[0], self.data.N[0], self.data.altitude[0],
+        ax.scatter(E[0], N[0], alt[0],
                    c=colors.get('start', '#2ca02c'),
                    s=100, marker='o', label='Start')
-        ax.scatter(self.data.E[-1], self.data.N[-1], self.data.altitude[-1],
+        ax.scatter(E[-1], N[-1], alt[-1],
                    c=colors.get('end', '#d62728'),
                    s=100, marker='s', label='End')
 
         # Project path onto ground plane
-        ax.plot(self.data.E, self.data.N, np.zeros_like(self.data.N),
-                color='gray', linewidth=0.5, alpha=0.5, linestyle='--',
-                label='Ground Track')
+        ground_line, = ax.plot(path[:, 0], path[:, 1], np.zeros(len(path)),
+                               color='gray', linewidth=0.5, alpha=0.5, linestyle='--',
+                               label='Ground Track')
+        ground_line.set_rasterized(True)
 
         # Draw vertical lines at key points
-        key_points = [0, len(self.data.N) // 4, len(self.data.N) // 2,
-                      3 * len(self.data.N) // 4, -1]
+        key_points = [0, n // 4, n // 2, 3 * n // 4, -1]
         for i in key_points:
-            ax.plot([self.data.E[i], self.data.E[i]],
-                    [self.data.N[i], self.data.N[i]],
-                    [0, self.data.altitude[i]],
+            ax.plot([E[i], E[i]], [N[i], N[i]], [0, alt[i]],
                     color='gray', linestyle=':', alpha=0.5, linewidth=0.8)
 
         ax.set_xlabel('East (m)')
@@ -119,13 +129,12 @@ class TrajectoryPlotter(BasePlotter):
         ax.set_zlabel('Altitude (m)')
 
         # Set equal aspect ratio for x and y
-        max_range = max(
-            self.data.E.max() - self.data.E.min(),
-            self.data.N.max() - self.data.N.min()
-        ) / 2
+        e_min, e_max = E.min(), E.max()
+        n_min, n_max = N.min(), N.max()
+        max_range = max(e_max - e_min, n_max - n_min) / 2
 
-        mid_e = (self.data.E.max() + self.data.E.min()) / 2
-        mid_n = (self.data.N.max() + self.data.N.min()) / 2
+        mid_e = (e_max + e_min) / 2
+        mid_n = (n_max + n_min) / 2
 
         ax.set_xlim(mid_e - max_range, mid_e + max_range)
         ax.set_ylim(mid_n - max_range, mid_n + max_range)
@@ -146,16 +155,25 @@ class TrajectoryPlotter(BasePlotter):
 
         colors = self.style.colors.get('trajectory', {})
         pos_colors = self.style.colors.get('position', {})
+        path_color = colors.get('path', '#1f77b4')
+        start_color = colors.get('start', '#2ca02c')
+        end_color = colors.get('end', '#d62728')
+        alt_color = pos_colors.get('altitude', '#1f77b4')
+        E, N, alt, time = self.data.E, self.data.N, self.data.altitude, self.data.time
+
+        # Every panel draws reduced data: the simplified path for the spatial
+        # views and the min/max-decimated series for altitude vs time
+        path = self._simplified_path()
+        path_N_km = path[:, 1] / 1000
 
         # 3D view (main, left side)
         ax1 = fig.add_subplot(2, 2, 1, projection='3d')
-        ax1.plot(self.data.E, self.data.N, self.data.altitude,
-                 color=colors.get('path', '#1f77b4'),
-                 linewidth=self.style.line_width_main)
-        ax1.scatter(self.data.E[0], self.data.N[0], self.data.altitude[0],
-                    c=colors.get('start', '#2ca02c'), s=100, marker='o')
-        ax1.scatter(self.data.E[-1], self.data.N[-1], self.data.altitude[-1],
-                    c=colors.get('end', '#d62728'), s=100, marker='s')
+        path_line, = ax1.plot(path[:, 0], path[:, 1], path[:, 2],
+                              color=path_color,
+                              linewidth=self.style.line_width_main)
+        path_line.set_rasterized(True)
+        ax1.scatter(E[0], N[0], alt[0], c=start_color, s=100, marker='o')
+        ax1.scatter(E[-1], N[-1], alt[-1], c=end_color, s=100, marker='s')
         ax1.set_xlabel('East (m)')
         ax1.set_ylabel('North (m)')
         ax1.set_zlabel('Altitude (m)')
@@ -164,13 +182,12 @@ class TrajectoryPlotter(BasePlotter):
 
         # Top view (ground track)
         ax2 = fig.add_subplot(2, 2, 2)
-        ax2.plot(self.data.E, self.data.N,
-                 color=colors.get('path', '#1f77b4'),
-                 linewidth=self.style.line_width_main)
-        ax2.scatter(self.data.E[0], self.data.N[0],
-                    c=colors.get('start', '#2ca02c'), s=80, marker='o', label='Start')
-        ax2.scatter(self.data.E[-1], self.data.N[-1],
-                    c=colors.get('end', '#d62728'), s=80, marker='s', label='End')
+        track_line, = ax2.plot(path[:, 0], path[:, 1],
+                               color=path_color,
+                               linewidth=self.style.line_width_main)
+        track_line.set_rasterized(True)
+        ax2.scatter(E[0], N[0], c=start_color, s=80, marker='o', label='Start')
+        ax2.scatter(E[-1], N[-1], c=end_color, s=80, marker='s', label='End')
         ax2.set_xlabel('East (m)')
         ax2.set_ylabel('North (m)')
         ax2.set_title('Top View (Ground Track)', fontsize=self.style.title_size)
@@ -180,15 +197,12 @@ class TrajectoryPlotter(BasePlotter):
 
         # Side view (North-Altitude)
         ax3 = fig.add_subplot(2, 2, 3)
-        ax3.plot(self.data.N / 1000, self.data.altitude,
-                 color=colors.get('path', '#1f77b4'),
+        ax3.plot(path_N_km, path[:, 2],
+                 color=path_color,
                  linewidth=self.style.line_width_main)
-        ax3.scatter(self.data.N[0] / 1000, self.data.altitude[0],
-                    c=colors.get('start', '#2ca02c'), s=80, marker='o')
-        ax3.scatter(self.data.N[-1] / 1000, self.data.altitude[-1],
-                    c=colors.get('end', '#d62728'), s=80, marker='s')
-        ax3.fill_between(self.data.N / 1000, 0, self.data.altitude, alpha=0.2,
-                         color=pos_colors.get('altitude', '#1f77b4'))
+        ax3.scatter(N[0] / 1000, alt[0], c=start_color, s=80, marker='o')
+        ax3.scatter(N[-1] / 1000, alt[-1], c=end_color, s=80, marker='s')
+        ax3.fill_between(path_N_km, 0, path[:, 2], alpha=0.2, color=alt_color)
         ax3.set_xlabel('North (km)')
         ax3.set_ylabel('Altitude (m)')
         ax3.set_title('Side View (Altitude Profile)', fontsize=self.style.title_size)
@@ -196,11 +210,11 @@ class TrajectoryPlotter(BasePlotter):
 
         # Altitude vs Time
         ax4 = fig.add_subplot(2, 2, 4)
-        ax4.plot(self.data.time, self.data.altitude,
-                 color=pos_colors.get('altitude', '#1f77b4'),
-                 linewidth=self.style.line_width_main)
-        ax4.fill_between(self.data.time, 0, self.data.altitude, alpha=0.2,
-                         color=pos_colors.get('altitude', '#1f77b4'))
+        alt_line, = self.plot_series(ax4, time, alt,
+                                     color=alt_color,
+                                     linewidth=self.style.line_width_main)
+        alt_t, alt_y = alt_line.get_data(orig=True)
+        ax4.fill_between(alt_t, 0, alt_y, alpha=0.2, color=alt_color)
         ax4.set_xlabel('Time (s)')
         ax4.set_ylabel('Altitude (m)')
         ax4.set_title('Altitude vs Time', fontsize=self.style.title_size)
@@ -216,29 +230,32 @@ class TrajectoryPlotter(BasePlotter):
 
         colors = self.style.colors.get('position', {})
         vel_colors = self.style.colors.get('velocity', {})
+        alt_color = colors.get('altitude', '#1f77b4')
+        time, alt, climb_rate = self.data.time, self.data.altitude, self.data.climb_rate
 
         # Altitude
-        axes[0].plot(self.data.time, self.data.altitude,
-                     color=colors.get('altitude', '#1f77b4'),
-                     linewidth=self.style.line_width_main,
-                     label='Altitude')
-        axes[0].fill_between(self.data.time, 0, self.data.altitude, alpha=0.2,
-                             color=colors.get('altitude', '#1f77b4'))
+        alt_line, = self.plot_series(axes[0], time, alt,
+                                     color=alt_color,
+                                     linewidth=self.style.line_width_main,
+                                     label='Altitude')
+        # Fills reuse the min/max-decimated samples of their line
+        alt_t, alt_y = alt_line.get_data(orig=True)
+        axes[0].fill_between(alt_t, 0, alt_y, alpha=0.2, color=alt_color)
         axes[0].set_ylabel('Altitude (m)')
         axes[0].set_title('Altitude', fontsize=self.style.title_size)
         self.add_grid(axes[0])
 
         # Climb rate with fill
-        axes[1].plot(self.data.time, self.data.climb_rate,
-                     color=vel_colors.get('climb_rate', '#2ca02c'),
-                     linewidth=self.style.line_width_main,
-                     label='Climb Rate')
+        climb_line, = self.plot_series(axes[1], time, climb_rate,
+                                       color=vel_colors.get('climb_rate', '#2ca02c'),
+                                       linewidth=self.style.line_width_main,
+                                       label='Climb Rate')
         axes[1].axhline(y=0, color='gray', linestyle='--', alpha=0.5)
-        axes[1].fill_between(self.data.time, 0, self.data.climb_rate,
-                             where=self.data.climb_rate > 0,
+        # Clipped copies fill each side of zero without where= masks
+        climb_t, climb_y = climb_line.get_data(orig=True)
+        axes[1].fill_between(climb_t, 0, np.maximum(climb_y, 0),
                              alpha=0.3, color='green')
-        axes[1].fill_between(self.data.time, 0, self.data.climb_rate,
-                             where=self.data.climb_rate < 0,
+        axes[1].fill_between(climb_t, 0, np.minimum(climb_y, 0),
                              alpha=0.3, color='red')
         axes[1].set_xlabel('Time (s)')
         axes[1].set_ylabel('Climb Rate (m/s)')
@@ -3,13 +3,31 @@ Plot styling and theme management.
 """
 
 import yaml
+import zlib
+from functools import lru_cache
 import matplotlib.pyplot as plt
 import matplotlib as mpl
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Union
 from dataclasses import dataclass, field
 
 
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Colors for variables missing from the configured palette
+_FALLBACK_COLORS = ('#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd')
+
+
+@lru_cache(maxsize=None)
+def _fallback_color(variable: str) -> str:
+    """Fallback color for a variable, stable across runs (unlike hash())."""
+    return _FALLBACK_COLORS[zlib.crc32(variable.encode()) % len(_FALLBACK_COLORS)]
+
+
+# rcParams most recently applied by PlotStyle.apply_to_matplotlib (None = unknown)
+_active_rc: Optional[Dict[str, Any]] = None
+
+
 @dataclass
 class PlotStyle:
     """Container for plot styling configuration."""
@@ -17,6 +35,7 @@ class PlotStyle:
     # Figure settings
     dpi: int = 300
     format: str = 'png'
+    png_compress_level: int = 3  # zlib level 0-9; lower is faster, larger
 
     # Figure sizes
     figure_sizes: Dict[str, tuple] = field(default_factory=lambda: {
@@ -45,6 +64,9 @@ class PlotStyle:
     line_width_secondary: float = 1.0
     line_width_reference: float = 0.8
 
+    # Line simplification tolerance in pixels (matplotlib default is 1/9)
+    simplify_threshold: float = 1.0
+
     # Color palettes
     colors: Dict[str, Dict[str, str]] = field(default_factory=dict)
 
@@ -56,6 +78,8 @@ class PlotStyle:
         plot_config = config.get('plot', {})
         style.dpi = plot_config.get('dpi', style.dpi)
         style.format = plot_config.get('format', style.format)
+        style.png_compress_level = plot_config.get('png_compress_level',
+                                                   style.png_compress_level)
 
         # Figure sizes
         fig_sizes = plot_config.get('figure_sizes', {})
@@ -82,15 +106,17 @@ class PlotStyle:
         style.line_width_main = lw.get('main', style.line_width_main)
         style.line_width_secondary = lw.get('secondary', style.line_width_secondary)
         style.line_width_reference = lw.get('reference', style.line_width_reference)
+        style.simplify_threshold = plot_config.get('simplify_threshold',
+                                                   style.simplify_threshold)
 
         # Colors
         style.colors = config.get('colors', {})
 
         return style
 
-    def apply_to_matplotlib(self) -> None:
-        """Apply style settings to matplotlib defaults."""
-        plt.rcParams.update({
+    def to_rc_params(self) -> Dict[str, Any]:
+        """Build the matplotlib rcParams dictionary for this style."""
+        return {
             'font.family': self.font_family,
             'font.size': self.label_size,
             'axes.titlesize': self.title_size,
@@ -105,25 +131,45 @@ class PlotStyle:
             'grid.linestyle': self.grid_linestyle,
             'grid.color': self.grid_color,
             'lines.linewidth': self.line_width_main,
-        })
+            'path.simplify': True,
+            'path.simplify_threshold': self.simplify_threshold,
+            # Rasterize long unfilled paths in chunks rather than in one pass
+            'agg.path.chunksize': 10000,
+        }
+
+    def apply_to_matplotlib(self) -> None:
+        """
+        Apply style settings to matplotlib defaults.
+
+        Idempotent: if the same settings are already active, rcParams is left
+        untouched, so every plotter can call this cheaply on construction.
+        """
+        global _active_rc
+        rc = self.to_rc_params()
+        if rc == _active_rc:
+            return
+        plt.rcParams.update(rc)
+        _active_rc = rc
 
     def get_color(self, category: str, variable: str) -> str:
         """Get color for a specific variable."""
         if category in self.colors and variable in self.colors[category]:
             return self.colors[category][variable]
-        # Fallback colors
-        fallback = ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd']
-        return fallback[hash(variable) % len(fallback)]
+        return _fallback_color(variable)
 
     def get_figure_size(self, size_type: str) -> tuple:
         """Get figure size by type."""
         return self.figure_sizes.get(size_type, (10, 6))
 
 
-def load_style(config_path: Optional[str] = None) -> PlotStyle:
+def load_style(config_path: Optional[Union[str, Path]] = None) -> PlotStyle:
     """
     Load plot style from configuration file.
 
+    Results are memoized per resolved config path and modification time, so
+    repeated calls (e.g. from every plotter constructed without an explicit
+    style) parse the YAML only once, however the path is spelled.
+
     Args:
         config_path: Path to YAML config file. If None, uses default.
 
@@ -140,14 +186,23 @@ def load_style(config_path: Optional[str] = None) -> PlotStyle:
         print(f"Warning: Config not found at {config_path}, using defaults")
         return PlotStyle()
 
-    with open(config_path, 'r') as f:
-        config = yaml.safe_load(f)
+    config_path = config_path.resolve()
+    return _load_style_file(str(config_path), config_path.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=4)
+def _load_style_file(path: str, mtime_ns: int) -> PlotStyle:
+    """Parse a style YAML; memoized on (path, mtime) so edits are picked up."""
+    with open(path, 'r') as f:
+        config = yaml.load(f, Loader=_YAML_LOADER)
 
     return PlotStyle.from_config(config)
 
 
 def setup_publication_style() -> None:
     """Configure matplotlib for publication-quality figures."""
+    global _active_rc
+    _active_rc = None
     plt.rcParams.update({
         'font.family': 'serif',
         'font.size': 10,
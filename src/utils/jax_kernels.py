@@ -0,0 +1,87 @@
+"""
+JAX versions of the data-processing kernels, for accelerators and batches.
+
+JAX is optional: when it is not installed JAX_AVAILABLE is False and callers
+fall back to the kernels in kernels.py. Computation runs in JAX's default
+precision (float32 unless jax_enable_x64 is set), which matches the storage
+precision of FlightData's packed signals.
+"""
+
+import numpy as np
+
+# Try to import JAX (optional)
+try:
+    import jax
+    import jax.numpy as jnp
+    JAX_AVAILABLE = True
+except ImportError:
+    JAX_AVAILABLE = False
+    jax = None
+    jnp = None
+
+
+if JAX_AVAILABLE:
+
+    def _central_diff(x, dt):
+        # Central differences inside, one-sided at the ends (np.gradient)
+        interior = (x[2:] - x[:-2]) * (0.5 / dt)
+        return jnp.concatenate([(x[1:2] - x[:1]) / dt, interior, (x[-1:] - x[-2:-1]) / dt])
+
+    def _derive(N, E, D, dt):
+        Vn = _central_diff(N, dt)
+        Ve = _central_diff(E, dt)
+        Vd = _central_diff(D, dt)
+        V_ground = jnp.sqrt(Vn * Vn + Ve * Ve)
+        V_total = jnp.sqrt(V_ground * V_ground + Vd * Vd)
+        return Vn, Ve, Vd, V_ground, V_total
+
+    _derive_jit = jax.jit(_derive)
+    _derive_batched = jax.jit(jax.vmap(_derive))
+
+
+def _require_jax() -> None:
+    if not JAX_AVAILABLE:
+        raise ImportError("JAX is required for this function. Install with: pip install jax")
+
+
+def derived_quantities_jax(
+    N: np.ndarray,
+    E: np.ndarray,
+    D: np.ndarray,
+    dt: float
+) -> tuple:
+    """
+    JAX-compiled equivalent of kernels.derived_quantities.
+
+    Args:
+        N, E, D: (T,) NED positions (m), at least two samples
+        dt: Sample interval (s)
+
+    Returns:
+        (Vn, Ve, Vd, V_ground, V_total) NumPy arrays
+    """
+    _require_jax()
+    return tuple(np.asarray(out) for out in _derive_jit(N, E, D, dt))
+
+
+def derived_quantities_batched(
+    N: np.ndarray,
+    E: np.ndarray,
+    D: np.ndarray,
+    dt: np.ndarray
+) -> tuple:
+    """
+    Compute derived quantities for a batch of equal-length flights at once.
+
+    The whole batch is a single vmapped, compiled call, so it runs as one
+    launch on a GPU or other accelerator.
+
+    Args:
+        N, E, D: (B, T) NED positions (m), one row per flight, T >= 2
+        dt: (B,) sample interval of each flight (s)
+
+    Returns:
+        (Vn, Ve, Vd, V_ground, V_total) NumPy arrays, each (B, T)
+    """
+    _require_jax()
+    return tuple(np.asarray(out) for out in _derive_batched(N, E, D, dt))
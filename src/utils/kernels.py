@@ -0,0 +1,528 @@
+"""
+Numeric kernels for data processing and plotting hot paths.
+
+Kernels are JIT-compiled with Numba when it is installed and fall back to
+vectorized NumPy implementations otherwise, so Numba remains optional.
+"""
+
+from typing import Optional
+
+import numpy as np
+
+# Try to import Numba (optional)
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    numba = None
+
+# Try to import numexpr (optional, speeds up the NumPy fallbacks)
+try:
+    import numexpr
+    NUMEXPR_AVAILABLE = True
+except ImportError:
+    NUMEXPR_AVAILABLE = False
+    numexpr = None
+
+
+def _euler_to_dcm_numpy(
+    phi: np.ndarray,
+    theta: np.ndarray,
+    psi: np.ndarray,
+    dcm: np.ndarray
+) -> np.ndarray:
+    """Vectorized NumPy implementation of euler_to_dcm_batch."""
+    cp, sp = np.cos(phi), np.sin(phi)
+    ct, st = np.cos(theta), np.sin(theta)
+    cs, ss = np.cos(psi), np.sin(psi)
+
+    # ZYX convention (Rz @ Ry @ Rx)
+    dcm[:, 0, 0] = cs * ct
+    dcm[:, 0, 1] = cs * st * sp - ss * cp
+    dcm[:, 0, 2] = cs * st * cp + ss * sp
+    dcm[:, 1, 0] = ss * ct
+    dcm[:, 1, 1] = ss * st * sp + cs * cp
+    dcm[:, 1, 2] = ss * st * cp - cs * sp
+    dcm[:, 2, 0] = -st
+    dcm[:, 2, 1] = ct * sp
+    dcm[:, 2, 2] = ct * cp
+    return dcm
+
+
+def _body_to_world_numpy(
+    vertices: np.ndarray,
+    positions: np.ndarray,
+    phi: np.ndarray,
+    theta: np.ndarray,
+    psi: np.ndarray
+) -> np.ndarray:
+    """Vectorized NumPy implementation of body_to_world."""
+    dcm = _euler_to_dcm_numpy(phi, theta, psi, np.empty((len(phi), 3, 3)))
+    out = np.einsum('fij,vj->fvi', dcm, vertices)
+    out += positions[:, None, :]
+    return out
+
+
+def _transform_vertices_numpy(
+    vertices: np.ndarray,
+    position: np.ndarray,
+    phi: float,
+    theta: float,
+    psi: float,
+    scale: float,
+    out: np.ndarray
+) -> np.ndarray:
+    """NumPy implementation of transform_vertices."""
+    dcm = _euler_to_dcm_numpy(np.array([phi]), np.array([theta]), np.array([psi]),
+                              np.empty((1, 3, 3)))[0]
+    dcm *= scale
+    np.matmul(vertices, dcm.T, out=out)
+    out += position
+    return out
+
+
+def _decimate_trail_numpy(xyz: np.ndarray, n_out: int) -> np.ndarray:
+    """Vectorized NumPy implementation of decimate_trail."""
+    n = xyz.shape[0]
+    if n <= n_out:
+        return xyz.copy()
+    idx = (np.arange(n_out) * (n - 1)) // (n_out - 1)
+    return xyz[idx]
+
+
+def _central_diff(x: np.ndarray, dt: float, out: np.ndarray) -> np.ndarray:
+    """
+    Differentiate x into out like np.gradient, without temporaries.
+
+    Central differences in the interior, one-sided differences at the ends.
+    """
+    np.subtract(x[2:], x[:-2], out=out[1:-1])
+    out[1:-1] *= 0.5 / dt
+    out[0] = (x[1] - x[0]) / dt
+    out[-1] = (x[-1] - x[-2]) / dt
+    return out
+
+
+def _derived_quantities_numpy(
+    N: np.ndarray,
+    E: np.ndarray,
+    D: np.ndarray,
+    dt: float
+) -> tuple:
+    """NumPy implementation of derived_quantities."""
+    if N.shape[0] < 2:
+        raise ValueError("At least two samples are required to compute velocities")
+
+    Vn = _central_diff(N, dt, np.empty_like(N))
+    Ve = _central_diff(E, dt, np.empty_like(E))
+    Vd = _central_diff(D, dt, np.empty_like(D))
+
+    if NUMEXPR_AVAILABLE:
+        # Fused, multithreaded evaluation with no temporaries
+        V_ground = numexpr.evaluate('sqrt(Vn*Vn + Ve*Ve)')
+        V_total = numexpr.evaluate('sqrt(V_ground*V_ground + Vd*Vd)')
+        return Vn, Ve, Vd, V_ground, V_total
+
+    # Speeds built in place in their output buffers
+    V_ground = np.multiply(Vn, Vn)
+    V_ground += Ve * Ve
+    V_total = np.multiply(Vd, Vd)
+    V_total += V_ground
+    np.sqrt(V_ground, out=V_ground)
+    np.sqrt(V_total, out=V_total)
+    return Vn, Ve, Vd, V_ground, V_total
+
+
+def _rdp_mask_numpy(xyz: np.ndarray, eps: float) -> np.ndarray:
+    """NumPy implementation of the Douglas-Peucker keep-mask."""
+    n = xyz.shape[0]
+    keep = np.zeros(n, dtype=np.bool_)
+    keep[0] = keep[n - 1] = True
+    stack = [(0, n - 1)]
+    while stack:
+        start, end = stack.pop()
+        if end - start < 2:
+            continue
+        a = xyz[start]
+        d = xyz[end] - a
+        rel = xyz[start + 1:end] - a
+        dd = d @ d
+        if dd > 0.0:
+            rel = rel - np.outer(rel @ d / dd, d)
+        dist2 = np.einsum('ij,ij->i', rel, rel)
+        k = int(np.argmax(dist2))
+        if dist2[k] > eps * eps:
+            mid = start + 1 + k
+            keep[mid] = True
+            stack.append((start, mid))
+            stack.append((mid, end))
+    return keep
+
+
+if NUMBA_AVAILABLE:
+    # Explicit signatures compile eagerly at import; cache=True persists the
+    # machine code so later runs skip compilation entirely.
+
+    # Body vertices may be read-only (cached geometry); a readonly array type
+    # accepts writable arrays too
+    _ro_2d = numba.types.Array(numba.float64, 2, 'A', readonly=True)
+
+    @numba.njit(numba.float64[:, :, :](_ro_2d, numba.float64[:, :], numba.float64[:],
+                                       numba.float64[:], numba.float64[:]),
+                cache=True, fastmath=True)
+    def _body_to_world_numba(vertices, positions, phi, theta, psi):
+        n_frames = phi.shape[0]
+        n_verts = vertices.shape[0]
+        out = np.empty((n_frames, n_verts, 3))
+        for f in range(n_frames):
+            cp, sp = np.cos(phi[f]), np.sin(phi[f])
+            ct, st = np.cos(theta[f]), np.sin(theta[f])
+            cs, ss = np.cos(psi[f]), np.sin(psi[f])
+
+            r00 = cs * ct
+            r01 = cs * st * sp - ss * cp
+            r02 = cs * st * cp + ss * sp
+            r10 = ss * ct
+            r11 = ss * st * sp + cs * cp
+            r12 = ss * st * cp - cs * sp
+            r20 = -st
+            r21 = ct * sp
+            r22 = ct * cp
+
+            px, py, pz = positions[f, 0], positions[f, 1], positions[f, 2]
+            for v in range(n_verts):
+                x, y, z = vertices[v, 0], vertices[v, 1], vertices[v, 2]
+                out[f, v, 0] = r00 * x + r01 * y + r02 * z + px
+                out[f, v, 1] = r10 * x + r11 * y + r12 * z + py
+                out[f, v, 2] = r20 * x + r21 * y + r22 * z + pz
+        return out
+
+    @numba.njit(numba.float64[:, :](_ro_2d, numba.float64[:], numba.float64, numba.float64,
+                                    numba.float64, numba.float64, numba.float64[:, :]),
+                cache=True, fastmath=True)
+    def _transform_vertices_numba(vertices, position, phi, theta, psi, scale, out):
+        cp, sp = np.cos(phi), np.sin(phi)
+        ct, st = np.cos(theta), np.sin(theta)
+        cs, ss = np.cos(psi), np.sin(psi)
+
+        # Scaled ZYX DCM
+        r00 = cs * ct * scale
+        r01 = (cs * st * sp - ss * cp) * scale
+        r02 = (cs * st * cp + ss * sp) * scale
+        r10 = ss * ct * scale
+        r11 = (ss * st * sp + cs * cp) * scale
+        r12 = (ss * st * cp - cs * sp) * scale
+        r20 = -st * scale
+        r21 = ct * sp * scale
+        r22 = ct * cp * scale
+
+        px, py, pz = position[0], position[1], position[2]
+        for v in range(vertices.shape[0]):
+            x, y, z = vertices[v, 0], vertices[v, 1], vertices[v, 2]
+            out[v, 0] = r00 * x + r01 * y + r02 * z + px
+            out[v, 1] = r10 * x + r11 * y + r12 * z + py
+            out[v, 2] = r20 * x + r21 * y + r22 * z + pz
+        return out
+
+    @numba.njit('f8[:,:,:](f8[:], f8[:], f8[:], f8[:,:,:])', cache=True, fastmath=True)
+    def _euler_to_dcm_numba(phi, theta, psi, dcm):
+        for f in range(phi.shape[0]):
+            cp, sp = np.cos(phi[f]), np.sin(phi[f])
+            ct, st = np.cos(theta[f]), np.sin(theta[f])
+            cs, ss = np.cos(psi[f]), np.sin(psi[f])
+
+            dcm[f, 0, 0] = cs * ct
+            dcm[f, 0, 1] = cs * st * sp - ss * cp
+            dcm[f, 0, 2] = cs * st * cp + ss * sp
+            dcm[f, 1, 0] = ss * ct
+            dcm[f, 1, 1] = ss * st * sp + cs * cp
+            dcm[f, 1, 2] = ss * st * cp - cs * sp
+            dcm[f, 2, 0] = -st
+            dcm[f, 2, 1] = ct * sp
+            dcm[f, 2, 2] = ct * cp
+        return dcm
+
+    @numba.njit('UniTuple(f8[:], 5)(f8[:], f8[:], f8[:], f8)',
+                cache=True, fastmath=True)
+    def _derived_quantities_numba(N, E, D, dt):
+        n = N.shape[0]
+        Vn = np.empty(n)
+        Ve = np.empty(n)
+        Vd = np.empty(n)
+        V_ground = np.empty(n)
+        V_total = np.empty(n)
+
+        inv_dt = 1.0 / dt
+        half_inv_dt = 0.5 / dt
+        for i in range(n):
+            # Central differences inside, one-sided at the ends (np.gradient)
+            if i == 0:
+                vn = (N[1] - N[0]) * inv_dt
+                ve = (E[1] - E[0]) * inv_dt
+                vd = (D[1] - D[0]) * inv_dt
+            elif i == n - 1:
+                vn = (N[i] - N[i - 1]) * inv_dt
+                ve = (E[i] - E[i - 1]) * inv_dt
+                vd = (D[i] - D[i - 1]) * inv_dt
+            else:
+                vn = (N[i + 1] - N[i - 1]) * half_inv_dt
+                ve = (E[i + 1] - E[i - 1]) * half_inv_dt
+                vd = (D[i + 1] - D[i - 1]) * half_inv_dt
+
+            vg2 = vn * vn + ve * ve
+            Vn[i] = vn
+            Ve[i] = ve
+            Vd[i] = vd
+            V_ground[i] = np.sqrt(vg2)
+            V_total[i] = np.sqrt(vg2 + vd * vd)
+        return Vn, Ve, Vd, V_ground, V_total
+
+    @numba.njit('f8[:,:](f8[:,:], i8)', cache=True)
+    def _decimate_trail_numba(xyz, n_out):
+        n = xyz.shape[0]
+        if n <= n_out:
+            return xyz.copy()
+        out = np.empty((n_out, xyz.shape[1]))
+        for k in range(n_out):
+            src = (k * (n - 1)) // (n_out - 1)
+            for j in range(xyz.shape[1]):
+                out[k, j] = xyz[src, j]
+        return out
+
+    @numba.njit('b1[:](f8[:,:], f8)', cache=True)
+    def _rdp_mask_numba(xyz, eps):
+        n = xyz.shape[0]
+        dim = xyz.shape[1]
+        keep = np.zeros(n, dtype=np.bool_)
+        keep[0] = True
+        keep[n - 1] = True
+        eps2 = eps * eps
+
+        # Explicit stack of (start, end) index pairs instead of recursion
+        stack = np.empty((n, 2), dtype=np.int64)
+        stack[0, 0] = 0
+        stack[0, 1] = n - 1
+        top = 1
+        while top > 0:
+            top -= 1
+            start = stack[top, 0]
+            end = stack[top, 1]
+            if end - start < 2:
+                continue
+
+            dd = 0.0
+            for j in range(dim):
+                dj = xyz[end, j] - xyz[start, j]
+                dd += dj * dj
+
+            best = -1.0
+            best_idx = start
+            for i in range(start + 1, end):
+                t = 0.0
+                if dd > 0.0:
+                    for j in range(dim):
+                        t += (xyz[i, j] - xyz[start, j]) * (xyz[end, j] - xyz[start, j])
+                    t /= dd
+                dist2 = 0.0
+                for j in range(dim):
+                    r = xyz[i, j] - xyz[start, j] - t * (xyz[end, j] - xyz[start, j])
+                    dist2 += r * r
+                if dist2 > best:
+                    best = dist2
+                    best_idx = i
+
+            if best > eps2:
+                keep[best_idx] = True
+                stack[top, 0] = start
+                stack[top, 1] = best_idx
+                stack[top + 1, 0] = best_idx
+                stack[top + 1, 1] = end
+                top += 2
+        return keep
+
+
+def euler_to_dcm_batch(
+    phi: np.ndarray,
+    theta: np.ndarray,
+    psi: np.ndarray,
+    out: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Batched equivalent of RotationUtils.euler_to_dcm (body to NED).
+
+    Args:
+        phi, theta, psi: (F,) Euler angles (radians)
+        out: Optional (F, 3, 3) float64 buffer to fill
+
+    Returns:
+        (F, 3, 3) DCMs, one per set of angles
+    """
+    phi = np.ascontiguousarray(phi, dtype=np.float64)
+    theta = np.ascontiguousarray(theta, dtype=np.float64)
+    psi = np.ascontiguousarray(psi, dtype=np.float64)
+    if out is None:
+        out = np.empty((len(phi), 3, 3))
+
+    if NUMBA_AVAILABLE:
+        return _euler_to_dcm_numba(phi, theta, psi, out)
+    return _euler_to_dcm_numpy(phi, theta, psi, out)
+
+
+def transform_vertices(
+    vertices: np.ndarray,
+    position: np.ndarray,
+    phi: float,
+    theta: float,
+    psi: float,
+    scale: float = 1.0,
+    out: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Scale, rotate and translate body-frame vertices for a single pose.
+
+    Single-pose counterpart of body_to_world. Small vertex sets go through
+    the compiled kernel: at these sizes NumPy's per-call dispatch costs more
+    than the arithmetic.
+
+    Args:
+        vertices: (V, 3) body-frame vertices
+        position: (3,) world position
+        phi, theta, psi: Euler angles (radians)
+        scale: Scaling factor applied to the vertices
+        out: Optional (V, 3) float64 buffer for the result
+
+    Returns:
+        (V, 3) transformed vertices (out, if given)
+    """
+    vertices = np.asarray(vertices, dtype=np.float64)
+    position = np.asarray(position, dtype=np.float64)
+    if out is None:
+        out = np.empty((vertices.shape[0], 3))
+
+    if NUMBA_AVAILABLE and vertices.shape[0] < 64 and position.ndim == 1:
+        return _transform_vertices_numba(vertices, position, float(phi), float(theta),
+                                         float(psi), float(scale), out)
+    return _transform_vertices_numpy(vertices, position, phi, theta, psi, scale, out)
+
+
+def body_to_world(
+    vertices: np.ndarray,
+    positions: np.ndarray,
+    phi: np.ndarray,
+    theta: np.ndarray,
+    psi: np.ndarray
+) -> np.ndarray:
+    """
+    Transform body-frame vertices for a batch of poses.
+
+    Args:
+        vertices: (V, 3) body-frame vertices
+        positions: (F, 3) world position for each pose
+        phi, theta, psi: (F,) Euler angles for each pose (radians)
+
+    Returns:
+        (F, V, 3) transformed vertices, one set per pose
+    """
+    vertices = np.ascontiguousarray(vertices, dtype=np.float64)
+    positions = np.ascontiguousarray(positions, dtype=np.float64)
+    phi = np.ascontiguousarray(phi, dtype=np.float64)
+    theta = np.ascontiguousarray(theta, dtype=np.float64)
+    psi = np.ascontiguousarray(psi, dtype=np.float64)
+
+    if NUMBA_AVAILABLE:
+        return _body_to_world_numba(vertices, positions, phi, theta, psi)
+    return _body_to_world_numpy(vertices, positions, phi, theta, psi)
+
+
+def decimate_trail(xyz: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Evenly decimate a polyline to at most n_out points, keeping both endpoints.
+
+    Args:
+        xyz: (N, D) polyline points
+        n_out: Maximum number of output points (>= 2)
+
+    Returns:
+        (min(N, n_out), D) decimated points
+    """
+    xyz = np.ascontiguousarray(xyz, dtype=np.float64)
+    if NUMBA_AVAILABLE:
+        return _decimate_trail_numba(xyz, int(n_out))
+    return _decimate_trail_numpy(xyz, int(n_out))
+
+
+def minmax_indices(y: np.ndarray, n_buckets: int) -> np.ndarray:
+    """
+    Indices of a min/max-decimated series, for drawing at a given pixel width.
+
+    Splits the series into n_buckets equal runs and keeps the first and last
+    samples plus the minimum and maximum of each run, in time order. Every
+    pixel column therefore still spans the full range of its samples.
+
+    Args:
+        y: (N,) series
+        n_buckets: Number of buckets, typically the axes width in pixels
+
+    Returns:
+        Sorted sample indices (all of them if N <= 2 * n_buckets)
+    """
+    n = len(y)
+    n_buckets = max(int(n_buckets), 1)
+    if n <= 2 * n_buckets:
+        return np.arange(n)
+
+    size = n // n_buckets
+    m = size * n_buckets
+    blocks = np.asarray(y[:m]).reshape(n_buckets, size)
+    base = np.arange(0, m, size)
+    idx = np.concatenate([[0], base + blocks.argmin(axis=1), base + blocks.argmax(axis=1),
+                          np.arange(m, n), [n - 1]])
+    return np.unique(idx)
+
+
+def derived_quantities(
+    N: np.ndarray,
+    E: np.ndarray,
+    D: np.ndarray,
+    dt: float
+) -> tuple:
+    """
+    Compute velocities and speeds from NED positions in one pass.
+
+    Velocities use central differences with one-sided differences at the
+    ends, matching np.gradient.
+
+    Args:
+        N, E, D: (N,) NED positions (m), at least two samples
+        dt: Sample interval (s)
+
+    Returns:
+        (Vn, Ve, Vd, V_ground, V_total) arrays
+    """
+    N = np.ascontiguousarray(N, dtype=np.float64)
+    E = np.ascontiguousarray(E, dtype=np.float64)
+    D = np.ascontiguousarray(D, dtype=np.float64)
+
+    if NUMBA_AVAILABLE and N.shape[0] >= 2:
+        return _derived_quantities_numba(N, E, D, float(dt))
+    return _derived_quantities_numpy(N, E, D, float(dt))
+
+
+def rdp_simplify(xyz: np.ndarray, eps: float) -> np.ndarray:
+    """
+    Simplify a polyline with the Ramer-Douglas-Peucker algorithm.
+
+    Args:
+        xyz: (N, D) polyline points
+        eps: Maximum allowed perpendicular deviation (data units)
+
+    Returns:
+        (M, D) simplified points, always including both endpoints
+    """
+    xyz = np.ascontiguousarray(xyz, dtype=np.float64)
+    if xyz.shape[0] <= 2:
+        return xyz.copy()
+    if NUMBA_AVAILABLE:
+        return xyz[_rdp_mask_numba(xyz, float(eps))]
+    return xyz[_rdp_mask_numpy(xyz, float(eps))]
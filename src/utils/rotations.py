@@ -2,8 +2,67 @@
 Rotation utilities for 3D transformations.
 """
 
+import math
 import numpy as np
-from typing import Tuple
+from functools import lru_cache
+from typing import Optional, Tuple
+
+from .kernels import body_to_world, euler_to_dcm_batch, transform_vertices
+
+
+@lru_cache(maxsize=32)
+def _aircraft_vertices(
+    wingspan: float,
+    fuselage_length: float,
+    tail_span: float
+) -> Tuple[np.ndarray, Tuple[Tuple[int, ...], ...]]:
+    """Body-frame aircraft geometry, built once per set of dimensions."""
+    # Simplified aircraft geometry (nose pointing +X in body frame)
+    w = wingspan / 2
+    fl = fuselage_length
+    ts = tail_span / 2
+
+    vertices = np.array([
+        # Fuselage (elongated diamond)
+        [fl * 0.6, 0, 0],       # 0: Nose
+        [-fl * 0.4, 0, 0],      # 1: Tail
+        [0, 0, fl * 0.05],      # 2: Fuselage bottom
+        [0, 0, -fl * 0.03],     # 3: Fuselage top
+
+        # Main wing
+        [0, w, 0],              # 4: Right wing tip
+        [0, -w, 0],             # 5: Left wing tip
+        [-fl * 0.1, w * 0.3, 0],   # 6: Right wing trailing
+        [-fl * 0.1, -w * 0.3, 0],  # 7: Left wing trailing
+
+        # Horizontal tail
+        [-fl * 0.35, ts, 0],    # 8: Right tail tip
+        [-fl * 0.35, -ts, 0],   # 9: Left tail tip
+
+        # Vertical tail
+        [-fl * 0.35, 0, -fl * 0.12],  # 10: Tail top
+    ])
+
+    # Define faces (triangles) by vertex indices
+    faces = [
+        # Fuselage sides
+        [0, 2, 4], [0, 4, 3],
+        [0, 5, 2], [0, 3, 5],
+        [1, 4, 2], [1, 3, 4],
+        [1, 2, 5], [1, 5, 3],
+
+        # Main wing (simplified)
+        [4, 6, 5], [5, 6, 7],
+
+        # Horizontal tail
+        [1, 8, 9],
+
+        # Vertical tail
+        [1, 10, 3],
+    ]
+
+    vertices.flags.writeable = False
+    return vertices, tuple(tuple(face) for face in faces)
 
 
 class RotationUtils:
@@ -53,10 +112,33 @@ class RotationUtils:
         Returns:
             3x3 DCM for body-to-inertial transformation
         """
-        Rz = RotationUtils.rotation_matrix_z(psi)
-        Ry = RotationUtils.rotation_matrix_y(theta)
-        Rx = RotationUtils.rotation_matrix_x(phi)
-        return Rz @ Ry @ Rx
+        cp, sp = math.cos(phi), math.sin(phi)
+        ct, st = math.cos(theta), math.sin(theta)
+        cs, ss = math.cos(psi), math.sin(psi)
+
+        # Closed form of Rz(psi) @ Ry(theta) @ Rx(phi)
+        return np.array([
+            [cs * ct, cs * st * sp - ss * cp, cs * st * cp + ss * sp],
+            [ss * ct, ss * st * sp + cs * cp, ss * st * cp - cs * sp],
+            [-st, ct * sp, ct * cp]
+        ])
+
+    @staticmethod
+    def euler_to_dcm_batch(
+        phi: np.ndarray,
+        theta: np.ndarray,
+        psi: np.ndarray
+    ) -> np.ndarray:
+        """
+        Convert arrays of Euler angles to DCMs in one call.
+
+        Args:
+            phi, theta, psi: (F,) Euler angles (radians)
+
+        Returns:
+            (F, 3, 3) DCMs for body-to-inertial transformation
+        """
+        return euler_to_dcm_batch(phi, theta, psi)
 
     @staticmethod
     def transform_body_to_ned(
@@ -85,59 +167,18 @@ class RotationUtils:
         wingspan: float = 10.0,
         fuselage_length: float = 8.0,
         tail_span: float = 3.0
-    ) -> Tuple[np.ndarray, np.ndarray]:
+    ) -> Tuple[np.ndarray, Tuple[Tuple[int, ...], ...]]:
         """
         Create simple aircraft geometry vertices in body frame.
 
+        The geometry is cached per set of dimensions and shared between
+        callers, so it is returned immutable.
+
         Returns:
-            vertices: (N, 3) array of vertex positions
-            faces: List of vertex indices for each face
+            vertices: (N, 3) read-only array of vertex positions
+            faces: Tuple of vertex index tuples, one per face
         """
-        # Simplified aircraft geometry (nose pointing +X in body frame)
-        w = wingspan / 2
-        fl = fuselage_length
-        ts = tail_span / 2
-
-        vertices = np.array([
-            # Fuselage (elongated diamond)
-            [fl * 0.6, 0, 0],       # 0: Nose
-            [-fl * 0.4, 0, 0],      # 1: Tail
-            [0, 0, fl * 0.05],      # 2: Fuselage bottom
-            [0, 0, -fl * 0.03],     # 3: Fuselage top
-
-            # Main wing
-            [0, w, 0],              # 4: Right wing tip
-            [0, -w, 0],             # 5: Left wing tip
-            [-fl * 0.1, w * 0.3, 0],   # 6: Right wing trailing
-            [-fl * 0.1, -w * 0.3, 0],  # 7: Left wing trailing
-
-            # Horizontal tail
-            [-fl * 0.35, ts, 0],    # 8: Right tail tip
-            [-fl * 0.35, -ts, 0],   # 9: Left tail tip
-
-            # Vertical tail
-            [-fl * 0.35, 0, -fl * 0.12],  # 10: Tail top
-        ])
-
-        # Define faces (triangles) by vertex indices
-        faces = [
-            # Fuselage sides
-            [0, 2, 4], [0, 4, 3],
-            [0, 5, 2], [0, 3, 5],
-            [1, 4, 2], [1, 3, 4],
-            [1, 2, 5], [1, 5, 3],
-
-            # Main wing (simplified)
-            [4, 6, 5], [5, 6, 7],
-
-            # Horizontal tail
-            [1, 8, 9],
-
-            # Vertical tail
-            [1, 10, 3],
-        ]
-
-        return vertices, faces
+        return _aircraft_vertices(float(wingspan), float(fuselage_length), float(tail_span))
 
     @staticmethod
     def transform_aircraft_geometry(
@@ -146,7 +187,8 @@ class RotationUtils:
         phi: float,
         theta: float,
         psi: float,
-        scale: float = 1.0
+        scale: float = 1.0,
+        out: Optional[np.ndarray] = None
     ) -> np.ndarray:
         """
         Transform aircraft vertices to world coordinates.
@@ -156,11 +198,35 @@ class RotationUtils:
             position: (3,) position in NED frame [N, E, D]
             phi, theta, psi: Euler angles (radians)
             scale: Scaling factor for aircraft size
+            out: Optional (N, 3) float64 buffer for the result, so per-frame
+                callers can reuse one allocation
 
         Returns:
-            (N, 3) vertices in NED frame
+            (N, 3) vertices in NED frame (out, if given)
         """
-        dcm = RotationUtils.euler_to_dcm(phi, theta, psi)
-        transformed = (dcm @ (vertices.T * scale)).T
-        transformed += position
-        return transformed
+        return transform_vertices(vertices, position, phi, theta, psi, scale, out)
+
+    @staticmethod
+    def transform_aircraft_geometry_batch(
+        vertices: np.ndarray,
+        positions: np.ndarray,
+        phi: np.ndarray,
+        theta: np.ndarray,
+        psi: np.ndarray,
+        scale: float = 1.0
+    ) -> np.ndarray:
+        """
+        Transform aircraft vertices to world coordinates for many poses at once.
+
+        Batched form of transform_aircraft_geometry for whole trajectories.
+
+        Args:
+            vertices: (V, 3) body-frame vertices
+            positions: (F, 3) position in NED frame for each pose
+            phi, theta, psi: (F,) Euler angles for each pose (radians)
+            scale: Scaling factor for aircraft size
+
+        Returns:
+            (F, V, 3) vertices in NED frame, one set per pose
+        """
+        return body_to_world(np.asarray(vertices) * scale, positions, phi, theta, psi)
@@ -113,6 +113,10 @@ class NEDConverter:
         Returns:
             GeoPoint with latitude, longitude, altitude
         """
+        # Promote to Python floats: float32 samples would otherwise keep the
+        # sums below in single precision (~0.5 m at typical latitudes)
+        north, east, down = float(north), float(east), float(down)
+
         # Latitude change from north displacement
         delta_lat = north / self._meters_per_deg_lat
 
@@ -165,6 +169,10 @@ class NEDConverter:
         Returns:
             Tuple of (lat_array, lon_array, alt_array) in degrees and meters
         """
+        N = np.asarray(N, dtype=np.float64)
+        E = np.asarray(E, dtype=np.float64)
+        D = np.asarray(D, dtype=np.float64)
+
         lat = self._origin_lat + N / self._meters_per_deg_lat
         lon = self._origin_lon + E / self._meters_per_deg_lon
         alt = self._origin_alt - D
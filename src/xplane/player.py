@@ -5,10 +5,16 @@ Plays back flight simulation data in X-Plane, controlling aircraft position,
 attitude, control surfaces, and propulsion state in real-time.
 """
 
+import atexit
+import logging
+import logging.handlers
 import math
+import queue
+import sys
 import time
 import threading
 from enum import Enum, auto
+from functools import lru_cache
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional, Callable, Dict, Any, Union, List
@@ -29,6 +35,45 @@ except ImportError:
     from flight_data import FlightData
 
 
+logger = logging.getLogger(__name__)
+
+# Prefer the libyaml C loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
+def _enable_debug_logging() -> None:
+    """
+    Route this module's debug output to stdout via a background thread.
+
+    Messages are queued by the playback thread and written by a
+    QueueListener, so stdout flushes never delay frame sends. Does nothing if
+    the application already configured logging handlers.
+    """
+    logger.setLevel(logging.DEBUG)
+    if logger.hasHandlers():
+        return
+
+    log_queue = queue.SimpleQueue()
+    stream = logging.StreamHandler(sys.stdout)
+    stream.setFormatter(logging.Formatter('%(message)s'))
+    listener = logging.handlers.QueueListener(log_queue, stream)
+    listener.start()
+    atexit.register(listener.stop)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+
+
+@lru_cache(maxsize=8)
+def _load_yaml(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """
+    Parse a YAML file, memoized on (path, mtime).
+
+    The mtime is part of the cache key so edits to the file are picked up.
+    The returned dict is shared between calls and must not be mutated.
+    """
+    with open(path, 'r') as f:
+        return yaml.load(f, Loader=_YAML_LOADER) or {}
+
+
 class PlaybackState(Enum):
     """Playback state enumeration."""
     STOPPED = auto()
@@ -193,9 +238,14 @@ class PlaybackConfig:
 
     @classmethod
     def from_yaml(cls, path: Union[str, Path]) -> 'PlaybackConfig':
-        """Load configuration from YAML file."""
-        with open(path, 'r') as f:
-            data = yaml.safe_load(f)
+        """
+        Load configuration from YAML file.
+
+        The parsed YAML is cached per file modification time; a new
+        PlaybackConfig is built on every call, so callers may modify it.
+        """
+        path = Path(path)
+        data = _load_yaml(str(path), path.stat().st_mtime_ns)
 
         config = cls()
 
@@ -290,6 +340,8 @@ class XPlanePlayer:
         self._debug = debug  # Detailed debug mode
         self._debug_interval = 30  # Debug output every N frames
         self._frame_log_interval = 100  # Log every N frames when verbose
+        if verbose or debug:
+            _enable_debug_logging()
 
         self._state = PlaybackState.STOPPED
         self._speed: float = self.config.default_speed
@@ -435,24 +487,26 @@ class XPlanePlayer:
         return state
 
     def _debug_print_prop_state(self, frame_idx: int, sent_drefs: Dict[str, float]) -> None:
-        """Print detailed debug info about prop state."""
-        print(f"\n{'='*60}")
-        print(f"[DEBUG] Frame {frame_idx} - Prop/Engine State")
-        print(f"{'='*60}")
-
-        print("\n--- SENT to X-Plane ---")
+        """Log detailed debug info about prop state."""
+        lines = [
+            f"\n{'='*60}",
+            f"[DEBUG] Frame {frame_idx} - Prop/Engine State",
+            f"{'='*60}",
+            "\n--- SENT to X-Plane ---",
+        ]
         for dref, val in sorted(sent_drefs.items()):
-            print(f"  {dref} = {val:.4f}")
+            lines.append(f"  {dref} = {val:.4f}")
 
-        print("\n--- READ BACK from X-Plane ---")
+        lines.append("\n--- READ BACK from X-Plane ---")
         state = self._debug_read_prop_state()
         for dref, val in state.items():
             if val is not None:
-                print(f"  {dref} = {val}")
+                lines.append(f"  {dref} = {val}")
             else:
-                print(f"  {dref} = None (not readable or not set)")
+                lines.append(f"  {dref} = None (not readable or not set)")
 
-        print(f"{'='*60}\n")
+        lines.append(f"{'='*60}\n")
+        logger.debug('\n'.join(lines))
 
     def load(self, source: Union[str, Path, FlightData]) -> bool:
         """
@@ -724,27 +778,28 @@ class XPlanePlayer:
 
         # Verbose debug logging
         if self._verbose and frame_idx % self._frame_log_interval == 0:
-            print(f"\n[Frame {frame_idx}] Debug data:")
+            lines = [f"\n[Frame {frame_idx}] Debug data:"]
             if len(data.theta_Cl) > 0:
-                print(f"  Tilt L: {math.degrees(data.theta_Cl[frame_idx]):.2f}°")
+                lines.append(f"  Tilt L: {math.degrees(data.theta_Cl[frame_idx]):.2f}°")
             else:
-                print(f"  Tilt L: EMPTY ARRAY")
+                lines.append(f"  Tilt L: EMPTY ARRAY")
             if len(data.theta_Cr) > 0:
-                print(f"  Tilt R: {math.degrees(data.theta_Cr[frame_idx]):.2f}°")
+                lines.append(f"  Tilt R: {math.degrees(data.theta_Cr[frame_idx]):.2f}°")
             else:
-                print(f"  Tilt R: EMPTY ARRAY")
+                lines.append(f"  Tilt R: EMPTY ARRAY")
             if len(data.RPM_Cl) > 0:
-                print(f"  RPM L: {data.RPM_Cl[frame_idx]:.0f}")
+                lines.append(f"  RPM L: {data.RPM_Cl[frame_idx]:.0f}")
             else:
-                print(f"  RPM L: EMPTY ARRAY")
+                lines.append(f"  RPM L: EMPTY ARRAY")
             if len(data.RPM_Cr) > 0:
-                print(f"  RPM R: {data.RPM_Cr[frame_idx]:.0f}")
+                lines.append(f"  RPM R: {data.RPM_Cr[frame_idx]:.0f}")
             else:
-                print(f"  RPM R: EMPTY ARRAY")
+                lines.append(f"  RPM R: EMPTY ARRAY")
             if len(data.delta_e) > 0:
-                print(f"  Elevator: {math.degrees(data.delta_e[frame_idx]):.2f}°")
+                lines.append(f"  Elevator: {math.degrees(data.delta_e[frame_idx]):.2f}°")
             else:
-                print(f"  Elevator: EMPTY ARRAY")
+                lines.append(f"  Elevator: EMPTY ARRAY")
+            logger.debug('\n'.join(lines))
 
         # Position and attitude
         if self.config.send_position or self.config.send_attitude:
@@ -816,15 +871,17 @@ class XPlanePlayer:
 
             # Debug: Print propulsion status on first frame (only if verbose)
             if self._verbose and frame_idx == 0:
-                print(f"\n[Propulsion Config]")
-                print(f"  rpm_left: {dref_cfg.rpm_left}")
-                print(f"  rpm_right: {dref_cfg.rpm_right}")
-                print(f"  tilt_left: {dref_cfg.tilt_left}")
-                print(f"  tilt_right: {dref_cfg.tilt_right}")
-                print(f"  RPM_Cl samples: {len(data.RPM_Cl) if data.RPM_Cl is not None else 'None'}")
-                print(f"  RPM_Cr samples: {len(data.RPM_Cr) if data.RPM_Cr is not None else 'None'}")
-                print(f"  theta_Cl samples: {len(data.theta_Cl) if data.theta_Cl is not None else 'None'}")
-                print(f"  theta_Cr samples: {len(data.theta_Cr) if data.theta_Cr is not None else 'None'}")
+                logger.debug('\n'.join([
+                    f"\n[Propulsion Config]",
+                    f"  rpm_left: {dref_cfg.rpm_left}",
+                    f"  rpm_right: {dref_cfg.rpm_right}",
+                    f"  tilt_left: {dref_cfg.tilt_left}",
+                    f"  tilt_right: {dref_cfg.tilt_right}",
+                    f"  RPM_Cl samples: {len(data.RPM_Cl) if data.RPM_Cl is not None else 'None'}",
+                    f"  RPM_Cr samples: {len(data.RPM_Cr) if data.RPM_Cr is not None else 'None'}",
+                    f"  theta_Cl samples: {len(data.theta_Cl) if data.theta_Cl is not None else 'None'}",
+                    f"  theta_Cr samples: {len(data.theta_Cr) if data.theta_Cr is not None else 'None'}",
+                ]))
 
             # Note: Engine indices are SWAPPED in X-Plane (0=right, 1=left)
             # Left RPM -> X-Plane engine index 1
@@ -902,7 +959,7 @@ class XPlanePlayer:
                 drefs[target] = value
                 # Debug: Print tilt value on first frame (only if verbose)
                 if self._verbose and frame_idx == 0:
-                    print(f"  Tilt LEFT: raw={math.degrees(data.theta_Cl[0]):.1f}°, offset={cfg.offset}, final={value:.1f}° -> {target}")
+                    logger.debug(f"  Tilt LEFT: raw={math.degrees(data.theta_Cl[0]):.1f}°, offset={cfg.offset}, final={value:.1f}° -> {target}")
 
             # Right tilt angle - use config for target dref and unit conversion
             if dref_cfg.tilt_right and len(data.theta_Cr) > 0:
@@ -925,13 +982,14 @@ class XPlanePlayer:
                 drefs[target] = value
                 # Debug: Print tilt value on first frame (only if verbose)
                 if self._verbose and frame_idx == 0:
-                    print(f"  Tilt RIGHT: raw={math.degrees(data.theta_Cr[0]):.1f}°, offset={cfg.offset}, final={value:.1f}° -> {target}")
+                    logger.debug(f"  Tilt RIGHT: raw={math.degrees(data.theta_Cr[0]):.1f}°, offset={cfg.offset}, final={value:.1f}° -> {target}")
 
             # Debug: Print all datarefs being sent on first frame (only if verbose)
             if self._verbose and frame_idx == 0 and drefs:
-                print(f"\n[Sending {len(drefs)} propulsion datarefs]")
+                lines = [f"\n[Sending {len(drefs)} propulsion datarefs]"]
                 for dref, val in drefs.items():
-                    print(f"  {dref} = {val}")
+                    lines.append(f"  {dref} = {val}")
+                logger.debug('\n'.join(lines))
 
             if drefs:
                 backend.send_datarefs(drefs)